@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+
+"""Plan the AUGUSTUS prediction chunks of a whole genome and distribute them across jobs."""
+
+
+import argparse
+import heapq
+import logging
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+def read_lengths(fasta):
+    """
+    Read the name and length of each sequence of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+
+    Returns:
+        list: A list of (name, length) tuples in file order.
+
+    """
+    lengths = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                lengths.append([line[1:].split(None, 1)[0], 0])
+            elif lengths:
+                lengths[-1][1] += len(line.rstrip("\r\n"))
+    return [tuple(entry) for entry in lengths]
+
+
+def plan_chunks(lengths, chunk_length):
+    """
+    Cut each sequence into overlapping prediction windows.
+
+    Reproduces the windows of ``augustus_from_chunks.pl``: sequences up to
+    ``chunk_length`` are predicted in one go, longer sequences in windows of
+    ``chunk_length`` bases that overlap by one sixth of the window.
+
+    Args:
+        lengths (list): The (name, length) tuples of the assembly.
+        chunk_length (int): The size of a prediction window.
+
+    Returns:
+        list: A list of (chunk_id, name, start, end, length) tuples in genomic order.
+
+    """
+    overlap = chunk_length // 6
+    chunks = []
+    for name, length in lengths:
+        if length <= chunk_length:
+            chunks.append((len(chunks) + 1, name, 1, length, length))
+            continue
+        start = 1
+        previous_end = 0
+        while start < length and previous_end < length:
+            end = min(start + chunk_length, length)
+            chunks.append((len(chunks) + 1, name, start, end, length))
+            start += chunk_length - overlap
+            previous_end = end
+    return chunks
+
+
+def distribute(chunks, njobs):
+    """
+    Assign chunks to jobs so that the largest amount of sequence per job is as small as possible.
+
+    Chunks are visited longest first and each one is given to the job with the least
+    sequence so far. Every job keeps its chunks in longest-first order, so that the
+    slowest predictions start first when the job works through its own queue.
+
+    Args:
+        chunks (list): The chunks as returned by ``plan_chunks``.
+        njobs (int): The number of jobs to create.
+
+    Returns:
+        list: One list of chunks per non-empty job.
+
+    """
+    heap = [(0, i) for i in range(min(njobs, len(chunks)))]
+    jobs = [[] for _ in heap]
+    for chunk in sorted(chunks, key=lambda c: (c[2] - c[3], c[0])):
+        load, index = heapq.heappop(heap)
+        jobs[index].append(chunk)
+        heapq.heappush(heap, (load + chunk[3] - chunk[2] + 1, index))
+    return jobs
+
+
+def write_jobs(jobs, prefix):
+    """
+    Write one tab-separated chunk list per job, named ``<prefix>.<n>.tsv``.
+
+    Args:
+        jobs (list): The chunks per job, as returned by ``distribute``.
+        prefix (str): The output file prefix.
+
+    """
+    for number, job in enumerate(jobs, start=1):
+        with open(f"{prefix}.{number}.tsv", "w") as handle:
+            for chunk in job:
+                handle.write("\t".join(str(field) for field in chunk) + "\n")
+        logger.info(f"Job {number}: {len(job)} chunks, {sum(c[3] - c[2] + 1 for c in job)} bp.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Plan the AUGUSTUS prediction chunks of a genome and distribute them across jobs.",
+        epilog="Example: python augustus_chunk_plan.py --fasta genome.fa --chunk_length 3000000 --jobs 10",
+    )
+    parser.add_argument("--fasta", metavar="FASTA", type=Path, required=True, help="The assembly in FASTA format.")
+    parser.add_argument(
+        "--chunk_length",
+        metavar="N",
+        type=int,
+        default=3000000,
+        help="The size of a prediction window (default 3000000).",
+    )
+    parser.add_argument("--jobs", metavar="N", type=int, required=True, help="The number of jobs to create.")
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="augustus_jobs",
+        help="The prefix of the output files (default augustus_jobs).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.fasta.is_file():
+        logger.error(f"The given input file {args.fasta} was not found!")
+        sys.exit(2)
+    if args.jobs < 1 or args.chunk_length < 6:
+        logger.error("The number of jobs must be at least 1 and the chunk length at least 6.")
+        sys.exit(2)
+    chunks = plan_chunks(read_lengths(args.fasta), args.chunk_length)
+    if not chunks:
+        logger.critical(f"The assembly {args.fasta} does not contain any sequences.")
+        sys.exit(1)
+    write_jobs(distribute(chunks, args.jobs), args.prefix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,8 +15,14 @@ perl my_script.pl
 		A bed file of target regions
     [--hints filename]
 		A hints file in GFF format
+    [--hints_index filename]
+		A bgzip compressed and tabix indexed hints file; if given, each
+		chunk only reads the hints overlapping its own region
     [--aug_conf filename]
 		An augustus custom config file with hint weights
+    [--jobs filename]
+		A list of pre-computed chunks (id, scaffold, start, end, length)
+		to use instead of chunking all scaffolds of the fai file
   Ouput:    
     [--outfile filename]
         The name of the output file. By default the output is the
@@ -29,11 +35,13 @@ my $infile = undef;
 my $genome_fai = undef;
 my $chunk_length = 3000000;
 my $hints = undef;
+my $hints_index = undef;
 my $aug_conf = undef;
 my $options = "";
 my $utr = undef;
 my %dictionary;
 my $model = undef;
+my $jobs = undef;
 my $help;
 
 GetOptions(
@@ -42,10 +50,12 @@ GetOptions(
     "model=s" => \$model,
     "genome_fai=s" => \$genome_fai,
     "hints=s" => \$hints,
+    "hints_index=s" => \$hints_index,
     "utr=s" => \$utr,
     "options=s" => \$options,
     "chunk_length=s" => \$chunk_length,
     "aug_conf=s" => \$aug_conf,
+    "jobs=s" => \$jobs,
     "outfile=s" => \$outfile);
 
 # Print Help and exit
@@ -60,6 +70,45 @@ if ($outfile) {
 
 my $overlap = ($chunk_length/6) ;
 
+# Returns the command prefix and hints file for a chunk; with an indexed
+# hints file, only the hints of the chunk region are extracted.
+
+sub chunk_hints {
+
+	my ($id,$key,$start,$end) = @_;
+
+	return ("",$hints) unless ($hints_index);
+
+	my $chunk_hints = $id . "_" . "hints.gff" ;
+
+	return ("tabix $hints_index '$key:$start-$end' > $chunk_hints && ",$chunk_hints);
+}
+
+# Commands for a pre-computed list of chunks, in the order given
+
+if ($jobs) {
+
+	open (my $JOBS, '<', $jobs) or die "FATAL: Can't open file: $jobs for reading.\n$!\n";
+
+	while (<$JOBS>) {
+
+		my $line = $_;
+		chomp($line);
+
+		my ($id,$key,$start,$end,$len) = split("\t",$line);
+
+		my $output = $id . "_" . "augustus_chunk.out" ;
+		my $exonnames = ($len <= $chunk_length) ? "--exonnames=on " : "" ;
+		my ($extract,$chunk_hints) = chunk_hints($id,$key,$start,$end);
+
+		my $command = $extract . "augustus $exonnames--species=$model --softmasking=1 $options --UTR=$utr --extrinsicCfgFile=$aug_conf --hintsfile=$chunk_hints --predictionStart=$start --predictionEnd=$end $key.fa > $output" ;
+		printf $command . "\n" ;
+	}
+
+	close($JOBS);
+	exit(0);
+}
+
 my @chromosomes;
 
 # Read FAI file to get list of scaffolds
@@ -93,7 +142,9 @@ foreach my  $key  (@chromosomes) {
 	
 		my $output = $counter . "_" . "augustus_chunk.out" ;
 
-		my $command = "augustus --exonnames=on --species=$model --softmasking=1 $options --UTR=$utr --extrinsicCfgFile=$aug_conf --hintsfile=$hints --predictionStart=1 --predictionEnd=$len  $key.fa > $output" ;
+		my ($extract,$chunk_hints) = chunk_hints($counter,$key,1,$len);
+
+		my $command = $extract . "augustus --exonnames=on --species=$model --softmasking=1 $options --UTR=$utr --extrinsicCfgFile=$aug_conf --hintsfile=$chunk_hints --predictionStart=1 --predictionEnd=$len  $key.fa > $output" ;
 		printf $command . "\n" ;
 
 	} else {
@@ -117,7 +168,9 @@ foreach my  $key  (@chromosomes) {
 			#my $output = "augustus_chunk_" . $counter . ".out" ;
 			my $output = $counter . "_" . "augustus_chunk.out" ;
 
-			my $command = "augustus --species=$model --softmasking=1 $options --UTR=$utr --extrinsicCfgFile=$aug_conf --hintsfile=$hints --predictionStart=$start --predictionEnd=$end $key.fa > $output" ;
+			my ($extract,$chunk_hints) = chunk_hints($counter,$key,$start,$end);
+
+			my $command = $extract . "augustus --species=$model --softmasking=1 $options --UTR=$utr --extrinsicCfgFile=$aug_conf --hintsfile=$chunk_hints --predictionStart=$start --predictionEnd=$end $key.fa > $output" ;
                 	printf $command . "\n" ;	
 		
 			$start += ($chunk_length-$overlap);
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+
+
+"""Train AUGUSTUS for a species, optimising its parameters round by round until the accuracy stops improving."""
+
+
+import argparse
+import csv
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+# Weights of the accuracy levels in the target of optimize_augustus.pl.
+WEIGHTS = {
+    "nucleotide_sensitivity": 3,
+    "nucleotide_specificity": 2,
+    "exon_sensitivity": 4,
+    "exon_specificity": 3,
+    "gene_sensitivity": 2,
+    "gene_specificity": 1,
+}
+NUMBER = re.compile(r"[0-9.]+")
+
+
+def run(command, **kwargs):
+    """Run a command, logging it first, and fail on a non-zero exit status."""
+    logger.info(" ".join(str(part) for part in command))
+    subprocess.run([str(part) for part in command], check=True, **kwargs)
+
+
+def split_genbank(genbank, nparts, prefix):
+    """
+    Distribute the records of a GenBank file round-robin across several files.
+
+    Args:
+        genbank (pathlib.Path): The gene structures in GenBank format.
+        nparts (int): The largest number of files to create.
+        prefix (str): The prefix of the files, named ``<prefix>.<n>.gb``.
+
+    Returns:
+        list: The files that were created.
+
+    """
+    records = []
+    lines = []
+    with genbank.open() as handle:
+        for line in handle:
+            lines.append(line)
+            if line.startswith("//"):
+                records.append(lines)
+                lines = []
+    parts = [Path(f"{prefix}.{number}.gb") for number in range(1, min(nparts, len(records)) + 1)]
+    handles = [part.open("w") for part in parts]
+    try:
+        for index, record in enumerate(records):
+            handles[index % len(handles)].writelines(record)
+    finally:
+        for handle in handles:
+            handle.close()
+    return parts
+
+
+def parse_evaluation(report):
+    """
+    Read the counts of the evaluation AUGUSTUS prints for annotated input.
+
+    Args:
+        report (pathlib.Path): The output of AUGUSTUS.
+
+    Returns:
+        dict: The nucleotide level sensitivity and specificity, and the number of
+        predicted, annotated and correctly predicted exons and genes.
+
+    """
+    counts = {}
+    with report.open() as handle:
+        for line in handle:
+            if line.startswith("nucleotide level"):
+                values = NUMBER.findall(line.split("|", 1)[1])
+                counts["nucleotide_sensitivity"], counts["nucleotide_specificity"] = map(float, values[:2])
+            elif line.startswith("exon level"):
+                values = [int(value) for value in NUMBER.findall(line.split("|", 1)[1])[:3]]
+                counts["exon_pred"], counts["exon_anno"], counts["exon_tp"] = values
+            elif line.startswith("gene level"):
+                values = [int(value) for value in NUMBER.findall(line.split("|", 1)[1])[:7]]
+                counts["gene_pred"], counts["gene_anno"], counts["gene_tp"] = values[0], values[2], values[4]
+    if "exon_tp" not in counts or "gene_tp" not in counts:
+        raise ValueError(f"No evaluation found in {report}.")
+    return counts
+
+
+def combine_evaluations(evaluations):
+    """
+    Combine the evaluations of the parts of a test set into one.
+
+    Exon and gene level accuracy is computed from the summed counts; the nucleotide
+    level values are averaged, weighted by the number of annotated exons of each part.
+
+    Args:
+        evaluations (list): The evaluations, as returned by ``parse_evaluation``.
+
+    Returns:
+        dict: The sensitivity and specificity of each level and the weighted target
+        of optimize_augustus.pl as ``accuracy``.
+
+    """
+    total = {key: sum(e[key] for e in evaluations) for key in evaluations[0]}
+    weight = max(total["exon_anno"], 1)
+    accuracy = {
+        "nucleotide_sensitivity": sum(e["nucleotide_sensitivity"] * e["exon_anno"] for e in evaluations) / weight,
+        "nucleotide_specificity": sum(e["nucleotide_specificity"] * e["exon_anno"] for e in evaluations) / weight,
+        "exon_sensitivity": total["exon_tp"] / max(total["exon_anno"], 1),
+        "exon_specificity": total["exon_tp"] / max(total["exon_pred"], 1),
+        "gene_sensitivity": total["gene_tp"] / max(total["gene_anno"], 1),
+        "gene_specificity": total["gene_tp"] / max(total["gene_pred"], 1),
+    }
+    accuracy["accuracy"] = sum(WEIGHTS[key] * accuracy[key] for key in WEIGHTS) / sum(WEIGHTS.values())
+    return accuracy
+
+
+class Trainer:
+    """
+    Run the AUGUSTUS training tools for one species.
+
+    Attributes:
+        species (str): The name of the species.
+        species_dir (pathlib.Path): The parameter files of the species in the config directory.
+        threads (int): The number of cores to use.
+
+    """
+
+    def __init__(self, species, config_dir, threads):
+        self.species = species
+        self.species_dir = config_dir / "species" / species
+        self.threads = threads
+
+    def etraining(self, genbank):
+        """Estimate the parameters of the species from the training genes."""
+        with open(os.devnull, "w") as devnull:
+            run(
+                ["etraining", f"--species={self.species}", "--stopCodonExcludedFromCDS=true", genbank],
+                stdout=devnull,
+            )
+
+    def optimize(self, genbank, kfold):
+        """Run one round of meta parameter optimisation, evaluating the folds in parallel."""
+        with open(os.devnull, "w") as devnull:
+            run(
+                [
+                    "optimize_augustus.pl",
+                    f"--species={self.species}",
+                    f"--kfold={kfold}",
+                    f"--cpus={min(self.threads, kfold)}",
+                    "--rounds=1",
+                    genbank,
+                ],
+                stdout=devnull,
+            )
+
+    def evaluate(self, parts):
+        """Predict the test genes, one part per core, and return the combined accuracy."""
+
+        def predict(part):
+            report = part.with_suffix(".out")
+            with report.open("w") as handle:
+                run(
+                    ["augustus", f"--species={self.species}", "--stopCodonExcludedFromCDS=true", part],
+                    stdout=handle,
+                )
+            return parse_evaluation(report)
+
+        with ThreadPool(len(parts)) as pool:
+            return combine_evaluations(pool.map(predict, parts))
+
+    def save(self, backup):
+        """Keep a copy of the current parameters of the species."""
+        if backup.exists():
+            shutil.rmtree(backup)
+        shutil.copytree(self.species_dir, backup)
+
+    def restore(self, backup):
+        """Put back the parameters saved with ``save``."""
+        shutil.rmtree(self.species_dir)
+        shutil.copytree(backup, self.species_dir)
+
+
+def augustus_train(args):
+    """
+    Train the species and optimise its parameters until the accuracy on the test genes plateaus.
+
+    After each round of ``optimize_augustus.pl`` the species is retrained and the test
+    genes are predicted. Training stops once a round improves the weighted accuracy by
+    less than ``min_gain``; a round that lowers it is undone.
+
+    """
+    os.environ["AUGUSTUS_CONFIG_PATH"] = str(args.config_dir.resolve())
+    trainer = Trainer(args.species, args.config_dir, args.threads)
+    complete = Path("training.gb")
+    run(["gff2gbSmallDNA.pl", args.gff, args.genome, args.flank, complete])
+    run(["randomSplit.pl", complete, args.test_size])
+    train, test = Path(f"{complete}.train"), Path(f"{complete}.test")
+    if not trainer.species_dir.exists():
+        run(["new_species.pl", f"--species={args.species}"])
+    trainer.etraining(train)
+    parts = split_genbank(test, args.threads, "test")
+    history = [dict(round=0, **trainer.evaluate(parts))]
+    logger.info(f"Accuracy before optimisation: {history[-1]['accuracy']:.4f}.")
+    backup = Path("parameters.best")
+    for number in range(1, args.rounds + 1):
+        trainer.save(backup)
+        best = max(entry["accuracy"] for entry in history)
+        trainer.optimize(train, args.kfold)
+        trainer.etraining(train)
+        history.append(dict(round=number, **trainer.evaluate(parts)))
+        gain = history[-1]["accuracy"] - best
+        logger.info(f"Accuracy after round {number}: {history[-1]['accuracy']:.4f} ({gain:+.4f}).")
+        if gain < 0:
+            trainer.restore(backup)
+        if gain < args.min_gain:
+            break
+    if backup.exists():
+        shutil.rmtree(backup)
+    with args.stats.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(history[0]), delimiter="\t")
+        writer.writeheader()
+        for entry in history:
+            writer.writerow({key: f"{value:.4f}" if isinstance(value, float) else value for key, value in entry.items()})
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Train AUGUSTUS for a species, optimising its parameters round by round until the accuracy "
+        "stops improving.",
+        epilog="Example: python augustus_train.py --gff training.gff3 --genome genome.fa --species my_species "
+        "--config_dir augustus_config --threads 8",
+    )
+    parser.add_argument("--gff", metavar="GFF", type=Path, required=True, help="The training gene models.")
+    parser.add_argument("--genome", metavar="FASTA", type=Path, required=True, help="The assembly in FASTA format.")
+    parser.add_argument("--species", required=True, help="The species to train; created if it does not exist.")
+    parser.add_argument(
+        "--config_dir",
+        metavar="DIR",
+        type=Path,
+        required=True,
+        help="The writable AUGUSTUS config directory the parameters are written to.",
+    )
+    parser.add_argument(
+        "--flank",
+        metavar="N",
+        type=int,
+        default=1000,
+        help="The number of bases around each training gene (default 1000).",
+    )
+    parser.add_argument(
+        "--test_size",
+        metavar="N",
+        type=int,
+        default=250,
+        help="The number of genes held out to measure accuracy (default 250).",
+    )
+    parser.add_argument(
+        "--kfold",
+        metavar="N",
+        type=int,
+        default=8,
+        help="The number of folds of the cross-validation during optimisation (default 8).",
+    )
+    parser.add_argument(
+        "--rounds",
+        metavar="N",
+        type=int,
+        default=5,
+        help="The largest number of optimisation rounds; 0 only runs etraining (default 5).",
+    )
+    parser.add_argument(
+        "--min_gain",
+        type=float,
+        default=0.005,
+        help="The smallest gain in accuracy for another optimisation round (default 0.005).",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="TSV",
+        type=Path,
+        default=Path("training_accuracy.tsv"),
+        help="Where to write the accuracy after each round (default training_accuracy.tsv).",
+    )
+    parser.add_argument(
+        "--threads",
+        metavar="N",
+        type=int,
+        default=1,
+        help="The number of cores to use (default 1).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for path in (args.gff, args.genome):
+        if not path.is_file():
+            logger.error(f"The given input file {path} was not found!")
+            sys.exit(2)
+    if not args.config_dir.is_dir():
+        logger.error(f"The given config directory {args.config_dir} was not found!")
+        sys.exit(2)
+    args.threads = max(args.threads, 1)
+    args.kfold = max(args.kfold, 2)
+    args.rounds = max(args.rounds, 0)
+    augustus_train(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+
+"""Split a sorted BAM file into read clusters and distribute them across BED files of similar read count."""
+
+
+import argparse
+import heapq
+import logging
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+import pysam
+
+
+logger = logging.getLogger()
+
+
+SKIP_FLAGS = 0x4 | 0x100 | 0x200 | 0x400 | 0x800
+
+
+def find_clusters(bam, reference, max_gap):
+    """
+    Find the clusters of overlapping reads on one reference sequence.
+
+    A cluster ends where no read covers the next ``max_gap`` bases, so that no
+    transcript assembled from the reads can span two clusters.
+
+    Args:
+        bam (pathlib.Path): The sorted and indexed BAM file.
+        reference (str): The name of the reference sequence.
+        max_gap (int): The longest gap allowed within a cluster, i.e. the longest intron.
+
+    Returns:
+        list: Tuples of reference, start, end (0-based, half-open) and number of reads.
+
+    """
+    clusters = []
+    start = end = None
+    reads = 0
+    with pysam.AlignmentFile(str(bam)) as handle:
+        for read in handle.fetch(reference):
+            if read.flag & SKIP_FLAGS:
+                continue
+            if end is not None and read.reference_start > end + max_gap:
+                clusters.append((reference, start, end, reads))
+                start = end = None
+                reads = 0
+            if start is None:
+                start = read.reference_start
+                end = read.reference_end
+            else:
+                end = max(end, read.reference_end)
+            reads += 1
+    if start is not None:
+        clusters.append((reference, start, end, reads))
+    return clusters
+
+
+def _find_clusters(arguments):
+    """Unpack the arguments of ``find_clusters`` for use with a process pool."""
+    return find_clusters(*arguments)
+
+
+def pack(clusters, nparts):
+    """
+    Assign clusters to parts so that the largest number of reads per part is as small as possible.
+
+    Uses the longest-processing-time-first heuristic: clusters are visited by
+    decreasing read count and each one is placed in the part with the fewest reads.
+
+    Args:
+        clusters (list): The clusters as returned by ``find_clusters``.
+        nparts (int): The number of parts to create.
+
+    Returns:
+        list: One list of clusters per non-empty part, each in genome order.
+
+    """
+    order = {cluster: i for i, cluster in enumerate(clusters)}
+    heap = [(0, i) for i in range(min(nparts, len(clusters)))]
+    parts = [[] for _ in heap]
+    for cluster in sorted(clusters, key=lambda c: c[3], reverse=True):
+        load, index = heapq.heappop(heap)
+        parts[index].append(cluster)
+        heapq.heappush(heap, (load + cluster[3], index))
+    return [sorted(part, key=lambda c: order[c]) for part in parts]
+
+
+def write_parts(parts, prefix):
+    """
+    Write one BED file of clusters per part, named ``<prefix>.<n>.bed``.
+
+    Args:
+        parts (list): The clusters per part, as returned by ``pack``.
+        prefix (str): The output file prefix.
+
+    """
+    for number, part in enumerate(parts, start=1):
+        with open(f"{prefix}.{number}.bed", "w") as handle:
+            for reference, start, end, reads in part:
+                handle.write(f"{reference}\t{start}\t{end}\t{reads}\n")
+        logger.info(f"Part {number}: {len(part)} clusters, {sum(c[3] for c in part)} reads.")
+
+
+def bam_clusters(bam, nparts, max_gap, prefix, threads):
+    """
+    Find the read clusters of a BAM file, one reference sequence per worker, and write the parts.
+
+    Args:
+        bam (pathlib.Path): The sorted BAM file; it is indexed if no index exists.
+        nparts (int): The number of parts to create.
+        max_gap (int): The longest gap allowed within a cluster.
+        prefix (str): The output file prefix.
+        threads (int): The number of reference sequences to process at the same time.
+
+    """
+    if not Path(f"{bam}.bai").exists():
+        pysam.index(str(bam))
+    with pysam.AlignmentFile(str(bam)) as handle:
+        references = [stat.contig for stat in handle.get_index_statistics() if stat.mapped > 0]
+    clusters = []
+    with Pool(threads) as pool:
+        for found in pool.imap(_find_clusters, ((bam, reference, max_gap) for reference in references)):
+            clusters.extend(found)
+    logger.info(f"Found {len(clusters)} clusters on {len(references)} sequences.")
+    write_parts(pack(clusters, nparts), prefix)
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Split a sorted BAM file into read clusters and distribute them across BED files of similar read count.",
+        epilog="Example: python bam_clusters.py --bam merged.bam --parts 20 --max_gap 20000",
+    )
+    parser.add_argument("--bam", metavar="BAM", type=Path, required=True, help="A coordinate-sorted BAM file.")
+    parser.add_argument("--parts", metavar="N", type=int, required=True, help="The number of parts to create.")
+    parser.add_argument(
+        "--max_gap",
+        metavar="N",
+        type=int,
+        default=20000,
+        help="The longest uncovered gap within a cluster, usually the longest intron (default 20000).",
+    )
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="clusters",
+        help="The prefix of the output files (default clusters).",
+    )
+    parser.add_argument(
+        "--threads",
+        metavar="N",
+        type=int,
+        default=1,
+        help="The number of sequences to process at the same time (default 1).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.bam.is_file():
+        logger.error(f"The given input file {args.bam} was not found!")
+        sys.exit(2)
+    bam_clusters(args.bam, max(args.parts, 1), args.max_gap, args.prefix, max(args.threads, 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+
+
+"""
+Create AUGUSTUS intron and exonpart hints from several sorted BAM files without merging them.
+
+Introns are reported as bam2hints does; exonparts summarize the coverage in windows as
+wig2hints does, and are given the wiggle source so that they are weighted like its hints.
+"""
+
+
+import argparse
+import logging
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate
+from multiprocessing import Pool
+from pathlib import Path
+
+import pysam
+
+
+logger = logging.getLogger()
+
+
+# CIGAR operations that advance on the reference.
+MATCH_OPS = (0, 7, 8)  # M, =, X
+SKIP_OP = 3  # N
+DELETION_OP = 2  # D
+SKIP_FLAGS = 0x4 | 0x100 | 0x200 | 0x400 | 0x800
+
+
+class HintSettings:
+    """
+    Collect the settings shared by all regions.
+
+    Attributes:
+        bams (list): The sorted and indexed BAM files.
+        priority (int): The priority of the intron hints.
+        source (str): The source of the intron hints in the AUGUSTUS extrinsic config.
+        wiggle_priority (int): The priority of the exonpart hints.
+        wiggle_source (str): The source of the exonpart hints in the AUGUSTUS extrinsic config.
+        window (int): The size of the windows coverage is summarized over.
+        min_coverage (float): The minimal mean coverage of a window to report it.
+        min_intron (int): The shortest intron to report.
+        max_intron (int): The longest intron to report.
+
+    """
+
+    def __init__(
+        self, bams, priority, source, wiggle_priority, wiggle_source, window, min_coverage, min_intron, max_intron
+    ):
+        self.bams = bams
+        self.priority = priority
+        self.source = source
+        self.wiggle_priority = wiggle_priority
+        self.wiggle_source = wiggle_source
+        self.window = window
+        self.min_coverage = min_coverage
+        self.min_intron = min_intron
+        self.max_intron = max_intron
+
+
+def split_regions(bam, region_size):
+    """
+    Split all reference sequences of a BAM file into regions of at most a given size.
+
+    Args:
+        bam (pathlib.Path): A BAM file whose header lists the reference sequences.
+        region_size (int): The largest region to create.
+
+    Returns:
+        list: Tuples of sequence name, start and end (0-based, half-open).
+
+    """
+    regions = []
+    with pysam.AlignmentFile(str(bam)) as handle:
+        for name, length in zip(handle.references, handle.lengths):
+            for start in range(0, length, region_size):
+                regions.append((name, start, min(start + region_size, length)))
+    return regions
+
+
+def count_region(settings, region):
+    """
+    Count intron support and base coverage of one region over all BAM files.
+
+    Only the counts are merged; each read is looked at once. Introns are counted
+    in the region their read starts in, so that reads spanning two regions are not
+    counted twice.
+
+    Args:
+        settings (HintSettings): The shared settings.
+        region (tuple): The sequence name, start and end of the region.
+
+    Returns:
+        tuple: The coverage per base of the region and a ``Counter`` of introns keyed
+        by start, end (both 1-based, inclusive) and strand.
+
+    """
+    name, start, end = region
+    difference = array("l", bytes(8 * (end - start + 1)))
+    introns = Counter()
+    for bam in settings.bams:
+        with pysam.AlignmentFile(str(bam)) as handle:
+            for read in handle.fetch(name, start, end):
+                if read.flag & SKIP_FLAGS or read.cigartuples is None:
+                    continue
+                position = read.reference_start
+                counts_introns = position >= start
+                strand = read.get_tag("XS") if read.has_tag("XS") else "."
+                for operation, length in read.cigartuples:
+                    if operation in MATCH_OPS:
+                        block_start = max(position, start)
+                        block_end = min(position + length, end)
+                        if block_start < block_end:
+                            difference[block_start - start] += 1
+                            difference[block_end - start] -= 1
+                        position += length
+                    elif operation == DELETION_OP:
+                        position += length
+                    elif operation == SKIP_OP:
+                        if counts_introns and settings.min_intron <= length <= settings.max_intron:
+                            introns[(position + 1, position + length, strand)] += 1
+                        position += length
+    coverage = list(accumulate(difference))[:-1]
+    return coverage, introns
+
+
+def region_hints(settings, region):
+    """
+    Create the hints of one region.
+
+    Args:
+        settings (HintSettings): The shared settings.
+        region (tuple): The sequence name, start and end of the region.
+
+    Returns:
+        list: The hints in GFF format, sorted by position.
+
+    """
+    name, start, _ = region
+    coverage, introns = count_region(settings, region)
+    attributes = f"pri={settings.priority};src={settings.source}"
+    wiggle_attributes = f"pri={settings.wiggle_priority};src={settings.wiggle_source}"
+    hints = []
+    for (intron_start, intron_end, strand), count in introns.items():
+        hints.append(
+            (intron_start, f"{name}\tb2h\tintron\t{intron_start}\t{intron_end}\t0\t{strand}\t.\tmult={count};{attributes}\n")
+        )
+    window = settings.window
+    for offset in range(0, len(coverage), window):
+        values = coverage[offset : offset + window]
+        total = sum(values)
+        if total == 0 or total < settings.min_coverage * len(values):
+            continue
+        # Trim uncovered bases, so that hints do not reach into introns.
+        first = next(i for i, value in enumerate(values) if value > 0)
+        last = len(values) - next(i for i, value in enumerate(reversed(values)) if value > 0)
+        hint_start = start + offset + first + 1
+        hints.append(
+            (
+                hint_start,
+                f"{name}\tw2h\tep\t{hint_start}\t{start + offset + last}\t0\t.\t.\t"
+                f"mult={round(total / (last - first))};{wiggle_attributes}\n",
+            )
+        )
+    hints.sort(key=lambda hint: hint[0])
+    return [line for _, line in hints]
+
+
+def _region_hints(arguments):
+    """Unpack the arguments of ``region_hints`` for use with a process pool."""
+    return region_hints(*arguments)
+
+
+def index_bam(bam):
+    """Index a BAM file unless an index already exists."""
+    if not Path(f"{bam}.bai").exists() and not bam.with_suffix(".bai").exists():
+        pysam.index(str(bam))
+
+
+def bam_to_hints(settings, output, threads, region_size):
+    """
+    Create hints from all BAM files, processing regions in parallel.
+
+    Args:
+        settings (HintSettings): The shared settings.
+        output (pathlib.Path): Where the hints in GFF format should be created.
+        threads (int): The number of regions to process at the same time.
+        region_size (int): The size of the regions the genome is split into.
+
+    """
+    with Pool(threads) as pool:
+        pool.map(index_bam, settings.bams)
+        regions = split_regions(settings.bams[0], region_size)
+        logger.info(f"Counting {len(settings.bams)} BAM files in {len(regions)} regions.")
+        count = 0
+        with output.open("w") as handle:
+            for hints in pool.imap(_region_hints, ((settings, region) for region in regions)):
+                handle.writelines(hints)
+                count += len(hints)
+    logger.info(f"Wrote {count} hints.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Create AUGUSTUS intron and exonpart hints from several sorted BAM files without merging them.",
+        epilog="Example: python bam_to_hints.py --bam a.bam b.bam --out hints.gff --threads 8",
+    )
+    parser.add_argument(
+        "--bam",
+        metavar="BAM",
+        type=Path,
+        nargs="+",
+        required=True,
+        help="Coordinate-sorted BAM files aligned to the same assembly.",
+    )
+    parser.add_argument("--out", metavar="GFF", type=Path, required=True, help="The hints in GFF format.")
+    parser.add_argument("--priority", type=int, default=4, help="The priority of the intron hints (default 4).")
+    parser.add_argument("--source", default="E", help="The source of the intron hints (default E).")
+    parser.add_argument(
+        "--wiggle_priority",
+        type=int,
+        default=2,
+        help="The priority of the exonpart hints (default 2).",
+    )
+    parser.add_argument("--wiggle_source", default="W", help="The source of the exonpart hints (default W).")
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=10,
+        help="The size of the windows exonpart hints are created for (default 10).",
+    )
+    parser.add_argument(
+        "--min_coverage",
+        type=float,
+        default=1.0,
+        help="The minimal mean coverage of a window to create an exonpart hint (default 1).",
+    )
+    parser.add_argument("--min_intron", type=int, default=32, help="The shortest intron to report (default 32).")
+    parser.add_argument(
+        "--max_intron",
+        type=int,
+        default=350000,
+        help="The longest intron to report (default 350000).",
+    )
+    parser.add_argument(
+        "--region_size",
+        type=int,
+        default=5000000,
+        help="The size of the regions processed in parallel (default 5000000).",
+    )
+    parser.add_argument(
+        "--threads",
+        metavar="N",
+        type=int,
+        default=1,
+        help="The number of regions to process at the same time (default 1).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for bam in args.bam:
+        if not bam.is_file():
+            logger.error(f"The given input file {bam} was not found!")
+            sys.exit(2)
+    settings = HintSettings(
+        args.bam,
+        args.priority,
+        args.source,
+        args.wiggle_priority,
+        args.wiggle_source,
+        max(args.window, 1),
+        args.min_coverage,
+        args.min_intron,
+        args.max_intron,
+    )
+    bam_to_hints(settings, args.out, max(args.threads, 1), max(args.region_size, 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,12 @@
 import argparse
 import csv
 import logging
+import os
 import sys
+import urllib.request
+import zlib
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -129,6 +133,285 @@ class RowChecker:
                     row[self._sample_col] = f"{sample}_T{seen[sample]}"
 
 
+class FastqReport:
+    """
+    Describe what could be learned about a FASTQ file from its first and last blocks.
+
+    Attributes:
+        path (str): The local path or URL of the file.
+        error (str): Why the file is unusable, or None.
+        lengths (list): The lengths of the reads in the first block.
+        encoding (str): The detected quality encoding.
+        first_id (str): The name of the first read, without pair suffix.
+        last_id (str): The name of the last read, or None if the end could not be read.
+        reads (int): The number of reads, if they were counted.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.error = None
+        self.lengths = []
+        self.encoding = "unknown"
+        self.first_id = None
+        self.last_id = None
+        self.reads = None
+
+
+# The parts of a FASTQ file that are read to check it, in bytes.
+HEAD_SIZE = 1 << 16
+TAIL_SIZE = 1 << 18
+GZIP_MAGIC = b"\x1f\x8b\x08"
+REMOTE_SCHEMES = ("s3://", "gs://", "az://", "latch://", "ftp://")
+
+
+def read_bytes(path, start=None, tail=None):
+    """
+    Read the start or the end of a local file or of a file served over HTTP(S).
+
+    Args:
+        path (str): A local path or an HTTP(S) URL.
+        start (int): Read this many bytes from the start of the file.
+        tail (int): Read this many bytes from the end of the file.
+
+    Returns:
+        bytes: The requested bytes, fewer if the file is shorter.
+
+    """
+    if path.startswith(("http://", "https://")):
+        request = urllib.request.Request(path)
+        request.add_header("Range", f"bytes=0-{start - 1}" if start is not None else f"bytes=-{tail}")
+        with urllib.request.urlopen(request, timeout=60) as response:
+            data = response.read()
+        # Servers that ignore the range send the whole file.
+        return data[:start] if start is not None else data[-tail:]
+    with open(path, "rb") as handle:
+        if start is not None:
+            return handle.read(start)
+        size = os.fstat(handle.fileno()).st_size
+        handle.seek(max(size - tail, 0))
+        return handle.read()
+
+
+def read_id(header):
+    """Return the name of a read without its pair suffix."""
+    name = header[1:].split(None, 1)[0] if len(header) > 1 else ""
+    return name[:-2] if name.endswith(("/1", "/2")) else name
+
+
+def parse_records(text, from_end=False):
+    """
+    Split text into complete FASTQ records and check that each is well-formed.
+
+    Args:
+        text (str): Decompressed FASTQ text that may start or end within a record.
+        from_end (bool): Whether the text ends with the end of the file, in which case
+            records are aligned to the end instead of the start.
+
+    Returns:
+        list: Tuples of header, sequence and quality of each record.
+
+    """
+    lines = text.split("\n")
+    if from_end:
+        if lines and lines[-1] == "":
+            lines.pop()
+        lines = lines[len(lines) % 4 :]
+    else:
+        # The last line may be incomplete.
+        lines = lines[: (len(lines) - 1) // 4 * 4]
+    records = []
+    for i in range(0, len(lines), 4):
+        header, sequence, separator, quality = lines[i : i + 4]
+        assert header.startswith("@"), f"Expected a read header, found: {header[:50]}"
+        assert separator.startswith("+"), f"Expected a '+' separator line, found: {separator[:50]}"
+        assert len(sequence) == len(quality), f"Sequence and quality lengths differ for read {header[:50]}"
+        records.append((header, sequence, quality))
+    return records
+
+
+def quality_encoding(qualities):
+    """Guess the quality encoding from the range of quality characters."""
+    characters = "".join(qualities)
+    if not characters:
+        return "unknown"
+    lowest = min(characters)
+    if lowest < ";":
+        return "phred+33"
+    if lowest >= "@" and max(characters) > "J":
+        return "phred+64"
+    return "phred+33"
+
+
+def decompress_tail(data):
+    """
+    Decompress the complete gzip members at the end of a file.
+
+    BGZF and other multi-member gzip files consist of many small members, so the
+    last ones can be decompressed without reading the rest of the file.
+
+    Args:
+        data (bytes): The last bytes of a gzip file.
+
+    Returns:
+        str: The decompressed text of the last members, or None if they could not be
+        found, e.g. for a file that consists of a single member.
+
+    Raises:
+        AssertionError: If the last member is incomplete.
+
+    """
+    offset = data.find(GZIP_MAGIC)
+    while offset >= 0:
+        remaining = data[offset:]
+        text = []
+        try:
+            while remaining:
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                text.append(decompressor.decompress(remaining))
+                if not decompressor.eof:
+                    # Complete members followed by an incomplete one mark a cut off file.
+                    assert len(text) == 1, "The file is truncated."
+                    break
+                remaining = decompressor.unused_data
+            else:
+                return b"".join(text).decode("ascii", errors="replace")
+        except zlib.error:
+            pass
+        offset = data.find(GZIP_MAGIC, offset + 1)
+    return None
+
+
+def read_all(path):
+    """
+    Decompress all of a gzipped FASTQ file, counting its reads.
+
+    Args:
+        path (str): A local path or an HTTP(S) URL.
+
+    Returns:
+        tuple: The number of reads and the last decompressed text.
+
+    Raises:
+        AssertionError: If the last gzip member is incomplete.
+
+    """
+    lines = 0
+    tail = b""
+    pending = False
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    opener = urllib.request.urlopen if path.startswith(("http://", "https://")) else lambda p: open(p, "rb")
+    with opener(path) as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            while block:
+                text = decompressor.decompress(block)
+                lines += text.count(b"\n")
+                tail = (tail + text)[-TAIL_SIZE:]
+                pending = not decompressor.eof
+                block = decompressor.unused_data
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    # Without the gzip trailer, the file was cut off.
+    assert not pending, "The file is truncated."
+    return lines // 4, tail.decode("ascii", errors="replace")
+
+
+def check_fastq(path, full=False):
+    """
+    Check that a gzipped FASTQ file exists and is well-formed at its start and end.
+
+    Args:
+        path (str): A local path or an HTTP(S) URL.
+        full (bool): Whether to also count all reads.
+
+    Returns:
+        FastqReport: What was learned about the file.
+
+    """
+    report = FastqReport(path)
+    try:
+        head = zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(read_bytes(path, start=HEAD_SIZE))
+        records = parse_records(head.decode("ascii", errors="replace"))
+        assert records, "No complete FASTQ record found at the start of the file."
+        report.lengths = [len(sequence) for _, sequence, _ in records]
+        report.encoding = quality_encoding([quality for _, _, quality in records])
+        report.first_id = read_id(records[0][0])
+        tail = decompress_tail(read_bytes(path, tail=TAIL_SIZE))
+        # A file of a single gzip member, unlike BGZF, can only be checked for completeness as a whole.
+        if tail is None or full:
+            report.reads, tail = read_all(path)
+        records = parse_records(tail, from_end=True)
+        assert records, "No complete FASTQ record found at the end of the file."
+        report.last_id = read_id(records[-1][0])
+    except FileNotFoundError:
+        report.error = "The file does not exist."
+    except (OSError, zlib.error) as error:
+        report.error = f"The file could not be read: {error}"
+    except AssertionError as error:
+        report.error = str(error)
+    return report
+
+
+def check_fastq_files(rows, first_col="fastq_1", second_col="fastq_2", threads=8, full=False):
+    """
+    Check all FASTQ files of a samplesheet concurrently and compare the files of each pair.
+
+    Args:
+        rows (list): The validated rows of the samplesheet.
+        first_col (str): The name of the column with the first FASTQ file.
+        second_col (str): The name of the column with the second FASTQ file.
+        threads (int): The number of files to check at the same time.
+        full (bool): Whether to also count all reads.
+
+    Returns:
+        tuple: A dict of ``FastqReport`` objects keyed by path, and a list of errors.
+
+    """
+    paths = []
+    for row in rows:
+        for path in (row[first_col], row[second_col]):
+            if path and path not in paths:
+                if path.startswith(REMOTE_SCHEMES):
+                    logger.warning(f"Cannot check files on remote storage, skipping {path}")
+                else:
+                    paths.append(path)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        reports = dict(zip(paths, executor.map(lambda p: check_fastq(p, full), paths)))
+    errors = [f"{report.path}: {report.error}" for report in reports.values() if report.error is not None]
+    for row in rows:
+        first, second = reports.get(row[first_col]), reports.get(row[second_col])
+        if first is None or second is None or first.error is not None or second.error is not None:
+            continue
+        if first.first_id != second.first_id:
+            errors.append(f"{first.path} and {second.path}: The pairs do not start with the same read.")
+        elif first.last_id != second.last_id:
+            errors.append(f"{first.path} and {second.path}: The pairs do not end with the same read.")
+        elif first.reads is not None and second.reads is not None and first.reads != second.reads:
+            errors.append(f"{first.path} and {second.path}: The pair has {first.reads} and {second.reads} reads.")
+    return reports, errors
+
+
+def write_fastq_stats(reports, file_out):
+    """Write the read length and quality encoding of each checked FASTQ file."""
+    with file_out.open(mode="w", newline="") as out_handle:
+        writer = csv.writer(out_handle, delimiter="\t")
+        writer.writerow(["fastq", "min_length", "max_length", "mean_length", "encoding", "end_checked", "reads"])
+        for report in reports.values():
+            if report.error is not None:
+                continue
+            writer.writerow(
+                [
+                    report.path,
+                    min(report.lengths),
+                    max(report.lengths),
+                    round(sum(report.lengths) / len(report.lengths), 1),
+                    report.encoding,
+                    report.last_id is not None,
+                    "" if report.reads is None else report.reads,
+                ]
+            )
+
+
 def sniff_format(handle):
     """
     Detect the tabular format.
@@ -154,7 +437,7 @@ def sniff_format(handle):
     return dialect
 
 
-def check_samplesheet(file_in, file_out):
+def check_samplesheet(file_in, file_out, check_files=False, threads=8, count=False, stats=None):
     """
     Check that the tabular samplesheet has the structure expected by nf-core pipelines.
 
@@ -166,6 +449,12 @@ def check_samplesheet(file_in, file_out):
             CSV, TSV, or any other format automatically recognized by ``csv.Sniffer``.
         file_out (pathlib.Path): Where the validated and transformed samplesheet should
             be created; always in CSV format.
+        check_files (bool): Whether to check that all FASTQ files exist and are
+            well-formed at their start and end, and that pairs are in sync.
+        threads (int): The number of FASTQ files to check at the same time.
+        count (bool): Whether to also count the reads of all FASTQ files.
+        stats (pathlib.Path): Where to write read length and quality encoding of the
+            checked FASTQ files (optional).
 
     Example:
         This function checks that the samplesheet follows the following structure,
@@ -197,6 +486,14 @@ def check_samplesheet(file_in, file_out):
                 logger.critical(f"{str(error)} On line {i + 2}.")
                 sys.exit(1)
         checker.validate_unique_samples()
+    if check_files:
+        reports, errors = check_fastq_files(checker.modified, threads=threads, full=count)
+        for error in errors:
+            logger.critical(error)
+        if errors:
+            sys.exit(1)
+        if stats is not None:
+            write_fastq_stats(reports, stats)
     header = list(reader.fieldnames)
     header.insert(1, "single_end")
     # See https://docs.python.org/3.9/library/csv.html#id3 to read up on `newline=""`.
@@ -225,6 +522,29 @@ def parse_args(argv=None):
         type=Path,
         help="Transformed output samplesheet in CSV format.",
     )
+    parser.add_argument(
+        "--check-files",
+        action="store_true",
+        help="Check that all FASTQ files exist and are complete, and that read pairs are in sync.",
+    )
+    parser.add_argument(
+        "--count-reads",
+        action="store_true",
+        help="With --check-files, also count all reads and compare the counts within pairs (slow).",
+    )
+    parser.add_argument(
+        "--threads",
+        metavar="N",
+        type=int,
+        default=8,
+        help="The number of FASTQ files to check at the same time (default 8).",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="STATS",
+        type=Path,
+        help="With --check-files, where to write read length and quality encoding per FASTQ file.",
+    )
     parser.add_argument(
         "-l",
         "--log-level",
@@ -243,7 +563,14 @@ def main(argv=None):
         logger.error(f"The given input file {args.file_in} was not found!")
         sys.exit(2)
     args.file_out.parent.mkdir(parents=True, exist_ok=True)
-    check_samplesheet(args.file_in, args.file_out)
+    check_samplesheet(
+        args.file_in,
+        args.file_out,
+        check_files=args.check_files,
+        threads=max(args.threads, 1),
+        count=args.count_reads,
+        stats=args.stats,
+    )
 
 
 if __name__ == "__main__":
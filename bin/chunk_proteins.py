@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+
+"""Split proteins into chunks of similar alignment cost, removing duplicate sequences."""
+
+
+import argparse
+import hashlib
+import heapq
+import logging
+import math
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+def read_fasta(fasta):
+    """
+    Yield the records of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): A file in FASTA format.
+
+    Yields:
+        tuple: The sequence name and the lines of the record, including its header.
+
+    """
+    name = None
+    lines = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                if name is not None:
+                    yield name, lines
+                name = line[1:].split(None, 1)[0]
+                lines = []
+            lines.append(line if line.endswith("\n") else line + "\n")
+    if name is not None:
+        yield name, lines
+
+
+def read_proteins(fasta, overhead):
+    """
+    Read the proteins and estimate the cost of aligning each, skipping duplicate sequences.
+
+    The cost of a protein is its number of residues plus a fixed overhead for
+    searching the genome index, which every protein pays regardless of its length.
+
+    Args:
+        fasta (pathlib.Path): The proteins in FASTA format.
+        overhead (int): The cost of a protein in addition to its residues.
+
+    Returns:
+        list: Tuples of cost, position in the file and the lines of each unique protein.
+
+    """
+    proteins = []
+    seen = set()
+    duplicates = 0
+    for name, lines in read_fasta(fasta):
+        residues = "".join(line.strip() for line in lines[1:]).upper().rstrip("*")
+        digest = hashlib.sha1(residues.encode()).digest()
+        if digest in seen:
+            duplicates += 1
+            continue
+        seen.add(digest)
+        proteins.append((len(residues) + overhead, len(proteins), lines))
+    logger.info(f"Read {len(proteins)} proteins; skipped {duplicates} duplicate sequences.")
+    return proteins
+
+
+def pack(proteins, nchunks):
+    """
+    Assign proteins to chunks so that the largest total cost is as small as possible.
+
+    Uses the longest-processing-time-first heuristic: proteins are visited by
+    decreasing cost and each one is placed in the chunk with the lowest total cost.
+
+    Args:
+        proteins (list): The proteins, as returned by ``read_proteins``.
+        nchunks (int): The number of chunks to create.
+
+    Returns:
+        list: One list of proteins per non-empty chunk, each in original file order.
+
+    """
+    heap = [(0, i) for i in range(min(nchunks, len(proteins)))]
+    chunks = [[] for _ in heap]
+    for protein in sorted(proteins, key=lambda p: (-p[0], p[1])):
+        load, index = heapq.heappop(heap)
+        chunks[index].append(protein)
+        heapq.heappush(heap, (load + protein[0], index))
+    return [sorted(chunk, key=lambda p: p[1]) for chunk in chunks]
+
+
+def write_chunks(chunks, prefix):
+    """
+    Write one FASTA file per chunk, named ``<prefix>.<n>.fa``.
+
+    Args:
+        chunks (list): The proteins per chunk, as returned by ``pack``.
+        prefix (str): The output file prefix.
+
+    """
+    for number, chunk in enumerate(chunks, start=1):
+        with open(f"{prefix}.{number}.fa", "w") as handle:
+            for _, _, lines in chunk:
+                handle.writelines(lines)
+        logger.info(f"Chunk {number}: {len(chunk)} proteins, cost {sum(p[0] for p in chunk)}.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Split proteins into chunks of similar alignment cost, removing duplicate sequences.",
+        epilog="Example: python chunk_proteins.py --fasta proteins.fa --per_chunk 200 --prefix proteins",
+    )
+    parser.add_argument("--fasta", metavar="FASTA", type=Path, required=True, help="The proteins in FASTA format.")
+    parser.add_argument(
+        "--per_chunk",
+        metavar="N",
+        type=int,
+        required=True,
+        help="The mean number of proteins per chunk; sets the number of chunks.",
+    )
+    parser.add_argument(
+        "--overhead",
+        metavar="N",
+        type=int,
+        default=100,
+        help="The cost of a protein in residues, in addition to its own length (default 100).",
+    )
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="proteins",
+        help="The prefix of the output files (default proteins).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.fasta.is_file():
+        logger.error(f"The given input file {args.fasta} was not found!")
+        sys.exit(2)
+    proteins = read_proteins(args.fasta, max(args.overhead, 0))
+    nchunks = math.ceil(len(proteins) / max(args.per_chunk, 1))
+    write_chunks(pack(proteins, nchunks), args.prefix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
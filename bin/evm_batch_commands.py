@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+
+"""Pack EvidenceModeler partition commands into batches of similar estimated runtime."""
+
+
+import argparse
+import bisect
+import heapq
+import logging
+import math
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+EXEC_DIR = re.compile(r"--exec_dir\s+(\S+)")
+PARTITION = re.compile(r"^(.+)_(\d+)-(\d+)$")
+
+
+def read_lengths(fasta):
+    """
+    Read the length of each sequence of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+
+    Returns:
+        dict: Sequence lengths keyed by sequence name.
+
+    """
+    lengths = {}
+    name = None
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                name = line[1:].split(None, 1)[0]
+                lengths[name] = 0
+            elif name is not None:
+                lengths[name] += len(line.rstrip("\r\n"))
+    return lengths
+
+
+def read_features(gffs):
+    """
+    Collect the start positions of all features of the evidence files.
+
+    Args:
+        gffs (list): Gene, protein and transcript alignments in GFF format.
+
+    Returns:
+        dict: A sorted list of feature start positions keyed by sequence name.
+
+    """
+    starts = defaultdict(list)
+    for gff in gffs:
+        with gff.open() as handle:
+            for line in handle:
+                if line.startswith("#") or not line.strip():
+                    continue
+                fields = line.split("\t", 4)
+                if len(fields) < 5:
+                    continue
+                starts[fields[0]].append(int(fields[3]))
+    for positions in starts.values():
+        positions.sort()
+    return starts
+
+
+def locate(command, lengths):
+    """
+    Find the sequence and range a command works on from its execution directory.
+
+    EvidenceModeler runs partitioned sequences in ``<seq>/<seq>_<start>-<end>`` and
+    unpartitioned sequences in ``<seq>``.
+
+    Args:
+        command (str): A line of the EvidenceModeler command list.
+        lengths (dict): Sequence lengths keyed by sequence name.
+
+    Returns:
+        tuple: The sequence name, start and end, or None if the command has no
+        execution directory.
+
+    """
+    match = EXEC_DIR.search(command)
+    if match is None:
+        return None
+    exec_dir = Path(match.group(1))
+    partition = PARTITION.match(exec_dir.name)
+    if partition is not None and partition.group(1) == exec_dir.parent.name:
+        return partition.group(1), int(partition.group(2)), int(partition.group(3))
+    return exec_dir.name, 1, lengths.get(exec_dir.name, 0)
+
+
+def estimate_cost(location, starts, feature_weight):
+    """
+    Estimate the runtime of a partition in base-pair equivalents.
+
+    Args:
+        location (tuple): The sequence name, start and end of the partition.
+        starts (dict): Sorted feature start positions keyed by sequence name.
+        feature_weight (float): The base-pair equivalent cost of a single feature.
+
+    Returns:
+        float: The estimated cost.
+
+    """
+    name, start, end = location
+    positions = starts.get(name, [])
+    features = bisect.bisect_right(positions, end) - bisect.bisect_left(positions, start)
+    return (end - start + 1) + feature_weight * features
+
+
+def pack(costs, nbatches):
+    """
+    Assign commands to batches so that the largest total cost is as small as possible.
+
+    Args:
+        costs (list): The estimated cost of each command.
+        nbatches (int): The number of batches to create.
+
+    Returns:
+        list: One list of command indices per batch, longest command first.
+
+    """
+    heap = [(0.0, i) for i in range(min(nbatches, len(costs)))]
+    batches = [[] for _ in heap]
+    for index in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        load, batch = heapq.heappop(heap)
+        batches[batch].append(index)
+        heapq.heappush(heap, (load + costs[index], batch))
+    return batches
+
+
+def batch_commands(commands, genome, gffs, per_batch, feature_weight, prefix):
+    """
+    Split an EvidenceModeler command list into batches of similar estimated runtime.
+
+    The number of batches is the same as when splitting the list into blocks of
+    ``per_batch`` commands, but commands are assigned by estimated cost instead of
+    by position, using the longest-processing-time-first heuristic.
+
+    Args:
+        commands (pathlib.Path): The command list written by ``write_EVM_commands.pl``.
+        genome (pathlib.Path): The assembly in FASTA format.
+        gffs (list): The evidence files given to EvidenceModeler.
+        per_batch (int): The average number of commands per batch.
+        feature_weight (float): The base-pair equivalent cost of a single feature.
+        prefix (str): The output file prefix; batches are named ``<prefix>.<n>.list``.
+
+    """
+    with commands.open() as handle:
+        lines = [line if line.endswith("\n") else line + "\n" for line in handle if line.strip()]
+    if not lines:
+        logger.critical(f"The command list {commands} is empty.")
+        sys.exit(1)
+    lengths = read_lengths(genome)
+    starts = read_features(gffs)
+    costs = []
+    for line in lines:
+        location = locate(line, lengths)
+        if location is None:
+            logger.warning(f"No execution directory found, assuming average cost for: {line.strip()}")
+        costs.append(None if location is None else estimate_cost(location, starts, feature_weight))
+    known = [cost for cost in costs if cost is not None]
+    average = sum(known) / len(known) if known else 1.0
+    costs = [average if cost is None else cost for cost in costs]
+    batches = pack(costs, math.ceil(len(lines) / per_batch))
+    for number, batch in enumerate(batches, start=1):
+        with open(f"{prefix}.{number}.list", "w") as handle:
+            handle.writelines(lines[i] for i in batch)
+        logger.info(f"Batch {number}: {len(batch)} commands, estimated cost {sum(costs[i] for i in batch):.0f}.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Pack EvidenceModeler partition commands into batches of similar estimated runtime.",
+        epilog="Example: python evm_batch_commands.py --commands commands.evm.list --genome genome.fa --gff genes.gff3 --per_batch 10",
+    )
+    parser.add_argument("--commands", metavar="LIST", type=Path, required=True, help="The EvidenceModeler command list.")
+    parser.add_argument("--genome", metavar="FASTA", type=Path, required=True, help="The assembly in FASTA format.")
+    parser.add_argument(
+        "--gff",
+        metavar="GFF",
+        type=Path,
+        nargs="+",
+        default=[],
+        help="Gene, protein and transcript evidence in GFF format.",
+    )
+    parser.add_argument(
+        "--per_batch",
+        metavar="N",
+        type=int,
+        default=10,
+        help="The average number of commands per batch (default 10).",
+    )
+    parser.add_argument(
+        "--feature_weight",
+        type=float,
+        default=2000.0,
+        help="Cost of a single evidence feature in base-pair equivalents (default 2000).",
+    )
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="evm_batch",
+        help="The prefix of the output files (default evm_batch).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for path in [args.commands, args.genome]:
+        if not path.is_file():
+            logger.error(f"The given input file {path} was not found!")
+            sys.exit(2)
+    if args.per_batch < 1:
+        logger.error("The number of commands per batch must be at least 1.")
+        sys.exit(2)
+    gffs = [gff for gff in args.gff if gff.is_file()]
+    batch_commands(args.commands, args.genome, gffs, args.per_batch, args.feature_weight, args.prefix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
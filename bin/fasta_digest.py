@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+
+"""Compute content digests of a FASTA file and of each of its sequences."""
+
+
+import argparse
+import hashlib
+import logging
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+def file_digest(fasta, block_size=1 << 20):
+    """
+    Compute the SHA-256 digest of the bytes of a file.
+
+    Args:
+        fasta (pathlib.Path): The file to digest.
+        block_size (int): The number of bytes to read at once.
+
+    Returns:
+        str: The hexadecimal digest.
+
+    """
+    digest = hashlib.sha256()
+    with fasta.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sequence_digests(fasta):
+    """
+    Compute the SHA-256 digest of each sequence, independent of its line wrapping.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+
+    Yields:
+        tuple: The name, length and hexadecimal digest of each sequence in file order.
+
+    """
+    name = None
+    length = 0
+    digest = None
+    with fasta.open("rb") as handle:
+        for line in handle:
+            if line.startswith(b">"):
+                if name is not None:
+                    yield name, length, digest.hexdigest()
+                name = line[1:].split(None, 1)[0].decode()
+                length = 0
+                digest = hashlib.sha256()
+            elif name is not None:
+                bases = line.rstrip(b"\r\n")
+                length += len(bases)
+                digest.update(bases)
+    if name is not None:
+        yield name, length, digest.hexdigest()
+
+
+def write_sequence_digests(fasta, output):
+    """
+    Write a tab-separated table with the name, length and digest of each sequence.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+        output (pathlib.Path): Where the table should be created.
+
+    """
+    with output.open("w") as handle:
+        handle.write("#sequence\tlength\tsha256\n")
+        for name, length, digest in sequence_digests(fasta):
+            handle.write(f"{name}\t{length}\t{digest}\n")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Print the digest of a FASTA file and optionally list the digest of each sequence.",
+        epilog="Example: python fasta_digest.py --fasta genome.fa --sequences genome.sequences.tsv",
+    )
+    parser.add_argument("--fasta", metavar="FASTA", type=Path, required=True, help="The file in FASTA format.")
+    parser.add_argument(
+        "--sequences",
+        metavar="TSV",
+        type=Path,
+        help="Where to write the digest of each sequence (optional).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.fasta.is_file():
+        logger.error(f"The given input file {args.fasta} was not found!")
+        sys.exit(2)
+    if args.sequences is not None:
+        write_sequence_digests(args.fasta, args.sequences)
+    print(file_digest(args.fasta))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,545 @@
+#!/usr/bin/env python
+
+
+"""Parse a GFF file once and derive stable IDs, sequences, training models and browser tracks from it."""
+
+
+import argparse
+import bisect
+import logging
+import sys
+from array import array
+from pathlib import Path
+from urllib.parse import unquote
+
+
+logger = logging.getLogger()
+
+
+MRNA_FEATURES = ("mRNA", "transcript")
+# The first stable ID is one past these, as in earlier releases of the pipeline.
+FIRST_GENE = 1000
+FIRST_MRNA = 1000
+
+BASES = "TCAG"
+AMINO_ACIDS = "FFLLSSSSYY..CC.WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG"
+CODONS = {
+    a + b + c: AMINO_ACIDS[16 * i + 4 * j + k]
+    for i, a in enumerate(BASES)
+    for j, b in enumerate(BASES)
+    for k, c in enumerate(BASES)
+}
+COMPLEMENT = str.maketrans("ACGTRYKMBVDHNacgtrykmbvdhn", "TGCAYRMKVBHDNtgcayrmkvbhdn")
+
+
+def parse_attributes(column):
+    """Parse a GFF attribute column into an ordered dictionary."""
+    attributes = {}
+    for field in column.strip().split(";"):
+        field = field.strip()
+        if "=" in field:
+            key, value = field.split("=", 1)
+            attributes[key] = value
+    return attributes
+
+
+def format_attributes(attributes):
+    """Format a dictionary of attributes as a GFF attribute column."""
+    return ";".join(f"{key}={value}" for key, value in attributes.items())
+
+
+class GffTable:
+    """
+    Hold the features of a GFF file column by column.
+
+    Sequence names, sources and feature types are interned and stored as codes,
+    coordinates as arrays of integers. The attribute column is kept as text and
+    only parsed for the features a transform looks at.
+
+    Attributes:
+        names (list): The interned sequence names, sources and feature types.
+        seqid (array.array): The code of the sequence name of each feature.
+        source (array.array): The code of the source of each feature.
+        feature (array.array): The code of the type of each feature.
+        start (array.array): The start of each feature (1-based).
+        end (array.array): The end of each feature (1-based, inclusive).
+        score (list): The score column of each feature.
+        strand (bytearray): The strand of each feature.
+        phase (bytearray): The phase of each feature.
+        raw (list): The attribute column of each feature.
+        comments (list): Tuples of the number of features before a comment line and the line.
+
+    """
+
+    def __init__(self):
+        self.names = []
+        self._codes = {}
+        self.seqid = array("l")
+        self.source = array("l")
+        self.feature = array("l")
+        self.start = array("l")
+        self.end = array("l")
+        self.score = []
+        self.strand = bytearray()
+        self.phase = bytearray()
+        self.raw = []
+        self.comments = []
+
+    def __len__(self):
+        return len(self.start)
+
+    def intern(self, value):
+        """Return the code of a string, adding it to the interned strings if needed."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.names)
+            self.names.append(value)
+        return code
+
+    def code(self, value):
+        """Return the code of an interned string, or -1 if no feature uses it."""
+        return self._codes.get(value, -1)
+
+    @classmethod
+    def read(cls, gff):
+        """
+        Read a GFF file.
+
+        Args:
+            gff (pathlib.Path): The features in GFF format.
+
+        Returns:
+            GffTable: The features and comment lines of the file.
+
+        """
+        table = cls()
+        with gff.open() as handle:
+            for line in handle:
+                if line.startswith("#"):
+                    table.comments.append((len(table), line.rstrip("\n")))
+                    continue
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 9:
+                    continue
+                table.seqid.append(table.intern(fields[0]))
+                table.source.append(table.intern(fields[1]))
+                table.feature.append(table.intern(fields[2]))
+                table.start.append(int(fields[3]))
+                table.end.append(int(fields[4]))
+                table.score.append(fields[5])
+                table.strand.append(ord(fields[6][:1] or "."))
+                table.phase.append(ord(fields[7][:1] or "."))
+                table.raw.append(fields[8])
+        logger.info(f"Read {len(table)} features.")
+        return table
+
+    def attributes(self, row):
+        """Parse the attributes of a feature."""
+        return parse_attributes(self.raw[row])
+
+    def fields(self, row):
+        """Return the columns of a feature."""
+        return [
+            self.names[self.seqid[row]],
+            self.names[self.source[row]],
+            self.names[self.feature[row]],
+            str(self.start[row]),
+            str(self.end[row]),
+            self.score[row],
+            chr(self.strand[row]),
+            chr(self.phase[row]),
+            self.raw[row],
+        ]
+
+    def line(self, row):
+        """Format a feature as a line of GFF."""
+        return "\t".join(self.fields(row)) + "\n"
+
+    def rows_of(self, *features):
+        """Return the rows of all features of the given types."""
+        codes = {self.code(feature) for feature in features}
+        return [row for row, code in enumerate(self.feature) if code in codes]
+
+    def write(self, handle):
+        """Write all features, with comment lines in their original place."""
+        comments = iter(self.comments)
+        comment = next(comments, None)
+        for row in range(len(self)):
+            while comment is not None and comment[0] <= row:
+                handle.write(comment[1] + "\n")
+                comment = next(comments, None)
+            handle.write(self.line(row))
+        while comment is not None:
+            handle.write(comment[1] + "\n")
+            comment = next(comments, None)
+
+
+def assign_stable_ids(table):
+    """
+    Number genes and transcripts and make every other feature a child of the last transcript.
+
+    Genes are named ``gene.<n>`` and transcripts ``mRNA.<n>``, counting from 1001;
+    a CDS is named after its transcript with a ``.cds`` suffix.
+
+    Args:
+        table (GffTable): The gene models, each gene followed by its transcripts and their features.
+
+    """
+    gene, mrna = FIRST_GENE, FIRST_MRNA
+    gene_code, cds_code = table.code("gene"), table.code("CDS")
+    mrna_codes = {table.code(feature) for feature in MRNA_FEATURES}
+    for row, code in enumerate(table.feature):
+        attributes = table.attributes(row)
+        if code == gene_code:
+            gene += 1
+            attributes["ID"] = f"gene.{gene}"
+        elif code in mrna_codes:
+            mrna += 1
+            attributes["ID"] = f"mRNA.{mrna}"
+            attributes["Parent"] = f"gene.{gene}"
+        elif code == cds_code:
+            attributes["ID"] = f"mRNA.{mrna}.cds"
+            attributes["Parent"] = f"mRNA.{mrna}"
+        else:
+            attributes["Parent"] = f"mRNA.{mrna}"
+        table.raw[row] = format_attributes(attributes)
+    logger.info(f"Assigned IDs to {gene - FIRST_GENE} genes and {mrna - FIRST_MRNA} transcripts.")
+
+
+def transcript_parts(table):
+    """
+    Collect the exons and CDS of each transcript.
+
+    Args:
+        table (GffTable): The gene models.
+
+    Returns:
+        dict: Tuples of the row of the transcript, its exon rows and its CDS rows, keyed
+        by transcript ID, in file order.
+
+    """
+    transcripts = {}
+    for row in table.rows_of(*MRNA_FEATURES):
+        transcripts[table.attributes(row).get("ID", "")] = (row, [], [])
+    for index, feature in ((1, "exon"), (2, "CDS")):
+        for row in table.rows_of(feature):
+            for parent in table.attributes(row).get("Parent", "").split(","):
+                if parent in transcripts:
+                    transcripts[parent][index].append(row)
+    return transcripts
+
+
+def read_sequences(fasta, names):
+    """
+    Read the given sequences of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+        names (set): The names of the sequences to read.
+
+    Returns:
+        dict: The sequences keyed by name.
+
+    """
+    sequences = {}
+    name = None
+    lines = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                if name in names:
+                    sequences[name] = "".join(lines)
+                name = line[1:].split(None, 1)[0]
+                lines = []
+            elif name in names:
+                lines.append(line.strip())
+    if name in names:
+        sequences[name] = "".join(lines)
+    return sequences
+
+
+def splice(table, sequence, rows, reverse):
+    """Join the bases of features in transcript order."""
+    rows = sorted(rows, key=lambda row: table.start[row], reverse=reverse)
+    bases = "".join(sequence[table.start[row] - 1 : table.end[row]] for row in rows)
+    return bases[::-1].translate(COMPLEMENT) if reverse else bases
+
+
+def translate(bases):
+    """Translate a coding sequence; stop codons are written as ``.``."""
+    bases = bases.upper()
+    return "".join(CODONS.get(bases[i : i + 3], "X") for i in range(0, len(bases) - 2, 3))
+
+
+def write_fasta(handle, name, sequence):
+    """Write a sequence in FASTA format, 60 characters per line."""
+    handle.write(f">{name}\n")
+    handle.writelines(f"{sequence[i : i + 60]}\n" for i in range(0, len(sequence), 60))
+
+
+def write_sequences(table, genome, proteins, cdna, cds):
+    """
+    Write the proteins, spliced transcripts and coding sequences of all transcripts.
+
+    Transcripts without exons use their CDS as exons; transcripts without CDS have
+    no protein or coding sequence. The phase of the first CDS is skipped.
+
+    Args:
+        table (GffTable): The gene models.
+        genome (pathlib.Path): The assembly in FASTA format.
+        proteins (str): Where to write the proteins, or None.
+        cdna (str): Where to write the spliced transcripts, or None.
+        cds (str): Where to write the coding sequences, or None.
+
+    """
+    transcripts = transcript_parts(table)
+    sequences = read_sequences(genome, {table.names[table.seqid[row]] for row, _, _ in transcripts.values()})
+    handles = {kind: open(path, "w") for kind, path in (("proteins", proteins), ("cdna", cdna), ("cds", cds)) if path}
+    try:
+        for name, (row, exons, coding) in transcripts.items():
+            sequence = sequences.get(table.names[table.seqid[row]])
+            if sequence is None:
+                logger.warning(f"The sequence of transcript {name} is not in the assembly.")
+                continue
+            reverse = table.strand[row] == ord("-")
+            if "cdna" in handles and (exons or coding):
+                write_fasta(handles["cdna"], name, splice(table, sequence, exons or coding, reverse))
+            if not coding:
+                continue
+            first = max(coding, key=table.end.__getitem__) if reverse else min(coding, key=table.start.__getitem__)
+            phase = int(chr(table.phase[first])) if chr(table.phase[first]) in "012" else 0
+            bases = splice(table, sequence, coding, reverse)[phase:]
+            if "cds" in handles:
+                write_fasta(handles["cds"], name, bases)
+            if "proteins" in handles:
+                write_fasta(handles["proteins"], name, translate(bases))
+    finally:
+        for handle in handles.values():
+            handle.close()
+    logger.info(f"Wrote the sequences of {len(transcripts)} transcripts.")
+
+
+def training_score(attributes):
+    """Return the score of a PASA gene, the last value of its URL-decoded attributes (``...,score=<n>``)."""
+    try:
+        return float(unquote(attributes).split("=")[-1])
+    except ValueError:
+        return 0.0
+
+
+def select_training(gff, nmodels):
+    """
+    Find the best scoring complete gene models of PASA that do not overlap each other.
+
+    The file is read in one streaming pass; each complete gene is held as its
+    location and the byte range of its lines in the file, not as text. Overlaps
+    are removed among all of them before the best ``nmodels`` are taken, so that
+    dropping an overlapping gene makes room for the next best one. Ties are broken
+    in favour of the earlier gene.
+
+    Args:
+        gff (pathlib.Path): The gene models, each gene followed by its features.
+        nmodels (int): The number of genes to select.
+
+    Returns:
+        list: Tuples of score, negated gene number, sequence name, start, end,
+        offset and length in bytes of each selected gene, best first.
+
+    """
+    genes = []
+    current = None
+    offset = 0
+
+    with gff.open("rb") as handle:
+        for line in handle:
+            fields = None if line.startswith(b"#") else line.split(b"\t")
+            if fields is not None and len(fields) >= 9 and fields[2] == b"gene":
+                if current is not None:
+                    genes.append(tuple(current))
+                current = None
+                attributes = fields[8].decode()
+                if "complete" in attributes:
+                    name = fields[0].decode()
+                    current = [training_score(attributes), -len(genes), name, int(fields[3]), int(fields[4]), offset, 0]
+            if current is not None:
+                current[6] += len(line)
+            offset += len(line)
+    if current is not None:
+        genes.append(tuple(current))
+    selected = remove_overlaps(genes)[:nmodels]
+    logger.info(f"Selected the best {len(selected)} of {len(genes)} complete gene models.")
+    return selected
+
+
+def remove_overlaps(models):
+    """
+    Drop gene models that overlap a better scoring one, on either strand.
+
+    Args:
+        models (list): Tuples of score, negated gene number, sequence name, start,
+            end, offset and length in bytes of each gene model.
+
+    Returns:
+        list: The remaining gene models, best first.
+
+    """
+    starts, ends, kept = {}, {}, []
+    for model in sorted(models, reverse=True):
+        _, _, name, start, end, _, _ = model
+        sequence_starts = starts.setdefault(name, [])
+        sequence_ends = ends.setdefault(name, [])
+        # Kept models do not overlap, so only the last one starting before this end can reach into it.
+        index = bisect.bisect_right(sequence_starts, end)
+        if index and sequence_ends[index - 1] >= start:
+            continue
+        sequence_starts.insert(index, start)
+        sequence_ends.insert(index, end)
+        kept.append(model)
+    logger.info(f"Removed {len(models) - len(kept)} overlapping gene models.")
+    return kept
+
+
+def write_training(gff, models, output):
+    """
+    Write gene models in genomic order, reading their lines back from the GFF file.
+
+    Sequences are ordered as they first appear among the models, genes on a sequence
+    by position. Features are written URL-decoded.
+
+    Args:
+        gff (pathlib.Path): The gene models the selection was made from.
+        models (list): The gene models to write, as returned by ``select_training``.
+        output (str): Where to write the gene models.
+
+    """
+    order = {}
+    for model in sorted(models, key=lambda m: m[5]):
+        order.setdefault(model[2], len(order))
+    with gff.open("rb") as source, open(output, "w") as handle:
+        handle.write("###gff-version 3\n")
+        for _, _, _, _, _, offset, length in sorted(models, key=lambda m: (order[m[2]], m[3], m[4])):
+            source.seek(offset)
+            lines = unquote(source.read(length).decode())
+            handle.write(lines if lines.endswith("\n") else lines + "\n")
+
+
+def write_match_track(table, output):
+    """
+    Write transcript alignments as matches with their parts, for genome browsers.
+
+    Consecutive features with the same ID form one alignment; its parts are
+    numbered in the direction of the strand.
+
+    Args:
+        table (GffTable): The alignments, e.g. as ``cDNA_match`` features.
+        output (str): Where to write the track.
+
+    """
+    groups = []
+    current = None
+    for row in range(len(table)):
+        alignment = table.attributes(row).get("ID", "")
+        if alignment != current:
+            groups.append((alignment, []))
+            current = alignment
+        groups[-1][1].append(row)
+    with open(output, "w") as handle:
+        for alignment, rows in groups:
+            first = rows[0]
+            seqid, source = table.names[table.seqid[first]], table.names[table.source[first]]
+            strand = chr(table.strand[first])
+            handle.write(
+                f"{seqid}\t{source}\texpressed_sequence_match\t{min(table.start[r] for r in rows)}\t"
+                f"{max(table.end[r] for r in rows)}\t{table.score[first]}\t{strand}\t.\t"
+                f"ID={alignment};Name={alignment}\n"
+            )
+            rows = sorted(rows, key=table.start.__getitem__, reverse=strand == "-")
+            for part, row in enumerate(rows, start=1):
+                handle.write(
+                    f"{seqid}\t{source}\tmatch_part\t{table.start[row]}\t{table.end[row]}\t{table.score[row]}\t"
+                    f"{chr(table.strand[row])}\t.\tID={alignment}.{part};Parent={alignment}\n"
+                )
+    logger.info(f"Wrote {len(groups)} alignments.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Parse a GFF file once and derive stable IDs, sequences, training models and browser tracks "
+        "from it. Outputs are named <prefix>.stable_id.gff, <prefix>.proteins.fasta, <prefix>.cdna.fasta, "
+        "<prefix>.cds.fasta, <prefix>.training.gff3 and <prefix>.gmod.gff3.",
+        epilog="Example: python gff_toolkit.py --gff augustus.gff --genome genome.fa --stable_ids --proteins",
+    )
+    parser.add_argument("--gff", metavar="GFF", type=Path, required=True, help="The features in GFF format.")
+    parser.add_argument(
+        "--genome",
+        metavar="FASTA",
+        type=Path,
+        help="The assembly in FASTA format; needed for --proteins, --cdna and --cds.",
+    )
+    parser.add_argument("--prefix", metavar="PREFIX", help="The prefix of the output files (default: the GFF name).")
+    parser.add_argument(
+        "--stable_ids",
+        action="store_true",
+        help="Number genes and transcripts; the sequences are named after the new IDs.",
+    )
+    parser.add_argument("--proteins", action="store_true", help="Write the protein of each transcript.")
+    parser.add_argument("--cdna", action="store_true", help="Write the spliced exons of each transcript.")
+    parser.add_argument("--cds", action="store_true", help="Write the coding sequence of each transcript.")
+    parser.add_argument(
+        "--training",
+        metavar="N",
+        type=int,
+        help="Select the N best scoring complete gene models of PASA for training, without overlapping models.",
+    )
+    parser.add_argument(
+        "--match_track",
+        action="store_true",
+        help="Write the alignments as matches with their parts, for genome browsers.",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.gff.is_file():
+        logger.error(f"The given input file {args.gff} was not found!")
+        sys.exit(2)
+    sequences = args.proteins or args.cdna or args.cds
+    if sequences and (args.genome is None or not args.genome.is_file()):
+        logger.error(f"The given input file {args.genome} was not found!")
+        sys.exit(2)
+    prefix = args.prefix or args.gff.stem
+    if args.training is not None:
+        models = select_training(args.gff, max(args.training, 1))
+        write_training(args.gff, models, f"{prefix}.training.gff3")
+    if not (args.stable_ids or sequences or args.match_track):
+        return
+    table = GffTable.read(args.gff)
+    if args.stable_ids:
+        assign_stable_ids(table)
+        with open(f"{prefix}.stable_id.gff", "w") as handle:
+            table.write(handle)
+    if sequences:
+        write_sequences(
+            table,
+            args.genome,
+            f"{prefix}.proteins.fasta" if args.proteins else None,
+            f"{prefix}.cdna.fasta" if args.cdna else None,
+            f"{prefix}.cds.fasta" if args.cds else None,
+        )
+    if args.match_track:
+        write_match_track(table, f"{prefix}.gmod.gff3")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
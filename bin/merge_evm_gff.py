@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+
+"""Merge the per-sequence EvidenceModeler outputs into one sorted GFF3 file."""
+
+
+import argparse
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+class GeneModel:
+    """
+    Describe one gene model of the EvidenceModeler output with all its child features.
+
+    Attributes:
+        seqid (str): The sequence the model is located on.
+        start (int): The start of the gene.
+        end (int): The end of the gene.
+        strand (str): The strand of the gene.
+        lines (list): The GFF3 lines of the gene and its children.
+
+    """
+
+    def __init__(self, fields, line):
+        self.seqid = fields[0]
+        self.start = int(fields[3])
+        self.end = int(fields[4])
+        self.strand = fields[6]
+        self.lines = [line]
+
+    @property
+    def structure(self):
+        """Return the location and exon-intron structure that identifies a model."""
+        features = []
+        for line in self.lines[1:]:
+            fields = line.split("\t", 7)
+            features.append((fields[2], int(fields[3]), int(fields[4])))
+        return (self.seqid, self.start, self.end, self.strand, tuple(sorted(features)))
+
+
+def read_models(folder):
+    """
+    Read the gene models EvidenceModeler wrote for one sequence.
+
+    Args:
+        folder (pathlib.Path): A sequence folder of the EvidenceModeler partitions.
+
+    Returns:
+        list: The ``GeneModel`` objects in file order.
+
+    """
+    gff = folder / "evm.out.gff3"
+    if not gff.is_file():
+        logger.warning(f"Could not find expected GFF file {gff}")
+        return []
+    models = []
+    with gff.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            fields = line.split("\t", 8)
+            if len(fields) < 9:
+                continue
+            if fields[2] == "gene" or not models:
+                models.append(GeneModel(fields, line if line.endswith("\n") else line + "\n"))
+            else:
+                models[-1].lines.append(line if line.endswith("\n") else line + "\n")
+    return models
+
+
+def read_folders(partitions):
+    """
+    List the sequence folders of an EvidenceModeler partition listing, in order.
+
+    Args:
+        partitions (pathlib.Path): The ``partitions_list.out`` file.
+
+    Returns:
+        list: The unique sequence folders.
+
+    """
+    folders = []
+    seen = set()
+    with partitions.open() as handle:
+        for line in handle:
+            elements = line.rstrip("\n").split("\t")
+            if len(elements) < 2 or elements[1] in seen:
+                continue
+            seen.add(elements[1])
+            folders.append(Path(elements[1]))
+    return folders
+
+
+def merge_evm_gff(partitions, gff, threads):
+    """
+    Merge all EvidenceModeler outputs into one GFF3 file.
+
+    The outputs are read concurrently. Gene models that were predicted more than
+    once with the same structure, such as in the overlap of two partitions, are
+    written only once. Models are written sorted by sequence, in the order of the
+    partition listing, and position.
+
+    Args:
+        partitions (pathlib.Path): The ``partitions_list.out`` file.
+        gff (pathlib.Path): Where the merged GFF3 file should be created.
+        threads (int): The number of files to read at the same time.
+
+    """
+    folders = read_folders(partitions)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(read_models, folders))
+    order = {}
+    models = []
+    for folder_models in results:
+        for model in folder_models:
+            order.setdefault(model.seqid, len(order))
+            models.append(model)
+    models.sort(key=lambda m: (order[m.seqid], m.start, m.end))
+    seen = set()
+    duplicates = 0
+    with gff.open("w", buffering=1 << 20) as handle:
+        for model in models:
+            structure = model.structure
+            if structure in seen:
+                duplicates += 1
+                continue
+            seen.add(structure)
+            handle.writelines(model.lines)
+            handle.write("\n")
+    logger.info(f"Merged {len(models) - duplicates} gene models from {len(folders)} folders.")
+    if duplicates:
+        logger.info(f"Removed {duplicates} duplicate gene models.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Merge the per-sequence EvidenceModeler outputs into one sorted GFF3 file.",
+        epilog="Example: python merge_evm_gff.py --partitions partitions_list.out --gff evm.gff3",
+    )
+    parser.add_argument(
+        "--partitions",
+        metavar="LIST",
+        type=Path,
+        required=True,
+        help="The partition listing written by EvidenceModeler.",
+    )
+    parser.add_argument("--gff", metavar="GFF", type=Path, required=True, help="The merged GFF3 file.")
+    parser.add_argument(
+        "--threads",
+        metavar="N",
+        type=int,
+        default=4,
+        help="The number of files to read at the same time (default 4).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.partitions.is_file():
+        logger.error(f"The given input file {args.partitions} was not found!")
+        sys.exit(2)
+    merge_evm_gff(args.partitions, args.gff, max(args.threads, 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
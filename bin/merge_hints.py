@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+
+"""Merge AUGUSTUS hint files into one sorted file and collapse identical hints."""
+
+
+import argparse
+import heapq
+import itertools
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+# Hints with a group describe a chain of evidence and must not be collapsed.
+GROUP_KEYS = ("grp", "group")
+
+
+class Hint:
+    """
+    Describe a single hint line of a GFF file.
+
+    Attributes:
+        fields (list): The nine columns of the GFF line.
+        attributes (list): The (key, value) pairs of the ninth column, in order.
+
+    """
+
+    __slots__ = ("fields", "attributes")
+
+    def __init__(self, line):
+        self.fields = line.rstrip("\r\n").split("\t")
+        self.attributes = []
+        for item in self.fields[8].split(";"):
+            item = item.strip()
+            if item:
+                key, _, value = item.partition("=")
+                self.attributes.append([key, value])
+
+    def get(self, key, default=None):
+        """Return the value of an attribute."""
+        for name, value in self.attributes:
+            if name == key:
+                return value
+        return default
+
+    def set(self, key, value):
+        """Set the value of an attribute, appending it if it does not exist yet."""
+        for pair in self.attributes:
+            if pair[0] == key:
+                pair[1] = value
+                return
+        self.attributes.append([key, value])
+
+    @property
+    def identity(self):
+        """Return the properties that make two hints interchangeable, or None for grouped hints."""
+        if any(self.get(key) is not None for key in GROUP_KEYS):
+            return None
+        seqid, _, feature, start, end, _, strand, frame = self.fields[:8]
+        return (seqid, feature, start, end, strand, frame, self.get("src"))
+
+    def __str__(self):
+        attributes = ";".join(f"{key}={value}" if value else key for key, value in self.attributes)
+        return "\t".join(self.fields[:8] + [attributes]) + "\n"
+
+
+def sort_key(line):
+    """Return the coordinate sort key of a GFF line."""
+    fields = line.split("\t", 7)
+    return (fields[0], int(fields[3]), int(fields[4]), fields[2], fields[6], line)
+
+
+def read_hints(hints):
+    """
+    Yield the hint lines of a GFF file, skipping comments and malformed lines.
+
+    Args:
+        hints (pathlib.Path): A hints file in GFF format.
+
+    """
+    with hints.open() as handle:
+        for number, line in enumerate(handle, start=1):
+            if line.startswith("#") or not line.strip():
+                continue
+            if line.count("\t") < 8:
+                logger.warning(f"Skipping malformed line {number} of {hints}.")
+                continue
+            yield line if line.endswith("\n") else line + "\n"
+
+
+def sorted_runs(lines, buffer_size, directory):
+    """
+    Sort a stream of lines in bounded memory.
+
+    Lines are sorted in blocks of ``buffer_size``; every block but the last is
+    written to a temporary file.
+
+    Args:
+        lines (iterator): The GFF lines to sort.
+        buffer_size (int): The number of lines to hold in memory at once.
+        directory (str): Where to create temporary files.
+
+    Returns:
+        list: Iterators that each yield a sorted run of lines.
+
+    """
+    lines = iter(lines)
+    runs = []
+    block = sorted(itertools.islice(lines, buffer_size), key=sort_key)
+    while True:
+        rest = sorted(itertools.islice(lines, buffer_size), key=sort_key)
+        if not rest:
+            runs.append(iter(block))
+            return runs
+        runs.append(spill(block, directory))
+        block = rest
+
+
+def spill(block, directory):
+    """Write a sorted block of lines to a temporary file and return an iterator over it."""
+    handle = tempfile.TemporaryFile(mode="w+", dir=directory)
+    handle.writelines(block)
+    handle.seek(0)
+    return handle
+
+
+def collapse(lines):
+    """
+    Collapse runs of identical hints into a single hint.
+
+    The multiplicity of the collapsed hint is the sum of the multiplicities of its
+    copies (``mult`` attribute, default 1) and its priority the highest ``pri``.
+
+    Args:
+        lines (iterator): Coordinate sorted GFF lines.
+
+    Yields:
+        Hint: The merged hints, in sorted order.
+
+    """
+    pending = {}
+    position = None
+    for line in lines:
+        hint = Hint(line)
+        here = (hint.fields[0], hint.fields[3], hint.fields[4])
+        if here != position:
+            yield from pending.values()
+            pending = {}
+            position = here
+        identity = hint.identity
+        if identity is None:
+            pending[id(hint)] = hint
+            continue
+        merged = pending.get(identity)
+        if merged is None:
+            pending[identity] = hint
+            continue
+        mult = int(merged.get("mult", 1)) + int(hint.get("mult", 1))
+        merged.set("mult", str(mult))
+        if hint.get("pri") is not None and int(hint.get("pri")) > int(merged.get("pri", -1)):
+            merged.set("pri", hint.get("pri"))
+    yield from pending.values()
+
+
+def merge_hints(inputs, output, buffer_size):
+    """
+    Merge hint files into one coordinate sorted file with identical hints collapsed.
+
+    Args:
+        inputs (list): The hint files in GFF format, sorted or not.
+        output (pathlib.Path): Where the merged hints should be created.
+        buffer_size (int): The number of lines to sort in memory at once.
+
+    """
+    total = written = 0
+
+    def count(lines):
+        nonlocal total
+        for line in lines:
+            total += 1
+            yield line
+
+    with tempfile.TemporaryDirectory(dir=".") as directory:
+        runs = []
+        for hints in inputs:
+            runs.extend(sorted_runs(count(read_hints(hints)), buffer_size, directory))
+        with output.open("w") as handle:
+            for hint in collapse(heapq.merge(*runs, key=sort_key)):
+                handle.write(str(hint))
+                written += 1
+        for run in runs:
+            if hasattr(run, "close"):
+                run.close()
+    logger.info(f"Merged {total} hints from {len(inputs)} files into {written} hints.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Merge hint files into one sorted file and collapse identical hints.",
+        epilog="Example: python merge_hints.py --output hints.gff rnaseq.gff proteins.gff",
+    )
+    parser.add_argument("inputs", metavar="HINTS", nargs="+", type=Path, help="Hint files in GFF format.")
+    parser.add_argument("--output", metavar="GFF", type=Path, required=True, help="The merged hints file.")
+    parser.add_argument(
+        "--buffer_size",
+        metavar="N",
+        type=int,
+        default=1000000,
+        help="The number of lines sorted in memory at once (default 1000000).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for hints in args.inputs:
+        if not hints.is_file():
+            logger.error(f"The given input file {hints} was not found!")
+            sys.exit(2)
+    merge_hints(args.inputs, args.output, args.buffer_size)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
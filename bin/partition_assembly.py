@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+
+
+"""Split an assembly into a fixed number of parts with balanced workload."""
+
+
+import argparse
+import heapq
+import logging
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+# Deleting all lower-case letters from a sequence line leaves the unmasked bases.
+LOWER_CASE = bytes(range(ord("a"), ord("z") + 1))
+
+
+class Sequence:
+    """
+    Describe one sequence of the assembly and where to find it on disk.
+
+    Attributes:
+        name (str): The sequence name (first word of the FASTA header).
+        length (int): The number of bases.
+        offset (int): The byte offset of the first base in the FASTA file.
+        span (int): The number of bytes from ``offset`` to the end of the record,
+            including line breaks.
+        masked (int): The number of soft-masked (lower-case) bases.
+        hints (int): The number of hints located on this sequence.
+        cost (float): The estimated workload of this sequence.
+
+    """
+
+    def __init__(self, name, length, offset, span, masked=0):
+        self.name = name
+        self.length = length
+        self.offset = offset
+        self.span = span
+        self.masked = masked
+        self.hints = 0
+        self.cost = 0.0
+
+    @property
+    def masked_fraction(self):
+        """Return the fraction of soft-masked bases."""
+        return self.masked / self.length if self.length else 0.0
+
+
+def scan_fasta(fasta):
+    """
+    Read the assembly once to locate each sequence and count its soft-masked bases.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+
+    Returns:
+        list: A list of ``Sequence`` objects in file order.
+
+    """
+    sequences = []
+    current = None
+    position = 0
+    with fasta.open("rb") as handle:
+        for line in handle:
+            if line.startswith(b">"):
+                if current is not None:
+                    current.span = position - current.offset
+                    sequences.append(current)
+                name = line[1:].split(None, 1)[0].decode()
+                current = Sequence(name, 0, position + len(line), 0)
+            elif current is not None:
+                bases = line.rstrip(b"\r\n")
+                current.length += len(bases)
+                current.masked += len(bases) - len(bases.translate(None, LOWER_CASE))
+            position += len(line)
+    if current is not None:
+        current.span = position - current.offset
+        sequences.append(current)
+    return sequences
+
+
+def count_hints(hints):
+    """
+    Count the hints per sequence in a GFF file.
+
+    Args:
+        hints (pathlib.Path): Hints in GFF format; may be empty.
+
+    Returns:
+        collections.Counter: The number of hints keyed by sequence name.
+
+    """
+    counts = Counter()
+    with hints.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            counts[line.split("\t", 1)[0]] += 1
+    return counts
+
+
+def estimate_costs(sequences, masked_weight, hint_weight, overhead):
+    """
+    Estimate the workload of each sequence in base-pair equivalents.
+
+    The cost grows with the sequence length, is reduced for soft-masked bases that
+    the gene finder skips over, and increases with the amount of evidence that has
+    to be processed. A fixed per-sequence overhead accounts for tool start-up, so
+    that thousands of tiny contigs are not mistaken for free work.
+
+    Args:
+        sequences (list): The ``Sequence`` objects to update in place.
+        masked_weight (float): The fraction of a masked base's cost that is saved.
+        hint_weight (float): The base-pair equivalent cost of a single hint.
+        overhead (float): The base-pair equivalent cost of starting a sequence.
+
+    """
+    for seq in sequences:
+        unmasked = seq.length * (1.0 - masked_weight * seq.masked_fraction)
+        seq.cost = unmasked + hint_weight * seq.hints + overhead
+
+
+def pack(sequences, nparts):
+    """
+    Assign sequences to parts so that the largest total cost is as small as possible.
+
+    Uses the longest-processing-time-first heuristic: sequences are visited by
+    decreasing cost and each one is placed in the part with the lowest total cost.
+
+    Args:
+        sequences (list): The ``Sequence`` objects to distribute.
+        nparts (int): The number of parts to create.
+
+    Returns:
+        list: One list of sequences per non-empty part, each in original file order.
+
+    """
+    order = {seq.name: i for i, seq in enumerate(sequences)}
+    heap = [(0.0, i) for i in range(min(nparts, len(sequences)))]
+    parts = [[] for _ in heap]
+    for seq in sorted(sequences, key=lambda s: s.cost, reverse=True):
+        load, index = heapq.heappop(heap)
+        parts[index].append(seq)
+        heapq.heappush(heap, (load + seq.cost, index))
+    return [sorted(part, key=lambda s: order[s.name]) for part in parts]
+
+
+def copy_range(source, target, offset, count):
+    """Copy ``count`` bytes starting at ``offset`` between two open files without buffering in Python."""
+    target.flush()
+    try:
+        while count > 0:
+            sent = os.sendfile(target.fileno(), source.fileno(), offset, count)
+            if sent == 0:
+                break
+            offset += sent
+            count -= sent
+    except (AttributeError, OSError):
+        source.seek(offset)
+        while count > 0:
+            block = source.read(min(count, 1 << 20))
+            if not block:
+                break
+            target.write(block)
+            count -= len(block)
+    if count > 0:
+        raise EOFError(f"Unexpected end of file while copying {count} remaining bytes.")
+
+
+def write_parts(fasta, parts, prefix):
+    """
+    Write each part as a FASTA file by copying the sequence blocks of the assembly.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+        parts (list): The sequences per part, as returned by ``pack``.
+        prefix (str): The output file prefix; parts are named ``<prefix>.part-<n>.fa``.
+
+    Returns:
+        list: The names of the written files.
+
+    """
+    names = []
+    size = fasta.stat().st_size
+    with fasta.open("rb") as source:
+        for number, part in enumerate(parts, start=1):
+            name = f"{prefix}.part-{number}.fa"
+            with open(name, "wb") as target:
+                for seq in part:
+                    target.write(f">{seq.name}\n".encode())
+                    span = min(seq.span, size - seq.offset)
+                    copy_range(source, target, seq.offset, span)
+                    # The last record of a file may lack its final line break.
+                    source.seek(seq.offset + span - 1)
+                    if span and source.read(1) != b"\n":
+                        target.write(b"\n")
+            names.append(name)
+    return names
+
+
+def write_manifest(manifest, parts, names):
+    """
+    Write a tab-separated table listing the part each sequence was assigned to.
+
+    Args:
+        manifest (pathlib.Path): Where the manifest should be created.
+        parts (list): The sequences per part, as returned by ``pack``.
+        names (list): The FASTA file name of each part.
+
+    """
+    with manifest.open("w") as handle:
+        handle.write("#part\tfile\tsequence\tlength\tmasked_fraction\thints\tcost\n")
+        for number, (part, name) in enumerate(zip(parts, names), start=1):
+            for seq in part:
+                handle.write(
+                    f"{number}\t{name}\t{seq.name}\t{seq.length}\t{seq.masked_fraction:.4f}\t{seq.hints}\t{seq.cost:.0f}\n"
+                )
+
+
+def partition_assembly(fasta, hints, nparts, prefix, manifest, masked_weight, hint_weight, overhead):
+    """
+    Split the assembly into ``nparts`` FASTA files of similar estimated workload.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format.
+        hints (pathlib.Path): Optional hints in GFF format to weight the sequences.
+        nparts (int): The number of parts to create.
+        prefix (str): The output file prefix.
+        manifest (pathlib.Path): Where the partition manifest should be created.
+        masked_weight (float): See ``estimate_costs``.
+        hint_weight (float): See ``estimate_costs``.
+        overhead (float): See ``estimate_costs``.
+
+    """
+    sequences = scan_fasta(fasta)
+    if not sequences:
+        logger.critical(f"The assembly {fasta} does not contain any sequences.")
+        sys.exit(1)
+    if hints is not None:
+        counts = count_hints(hints)
+        for seq in sequences:
+            seq.hints = counts.get(seq.name, 0)
+    estimate_costs(sequences, masked_weight, hint_weight, overhead)
+    parts = pack(sequences, nparts)
+    for number, part in enumerate(parts, start=1):
+        logger.info(
+            f"Part {number}: {len(part)} sequences, {sum(s.length for s in part)} bp, "
+            f"estimated cost {sum(s.cost for s in part):.0f}."
+        )
+    names = write_parts(fasta, parts, prefix)
+    write_manifest(manifest, parts, names)
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Split an assembly into a number of parts with balanced workload.",
+        epilog="Example: python partition_assembly.py --fasta genome.fa --parts 10 --prefix genome",
+    )
+    parser.add_argument("--fasta", metavar="FASTA", type=Path, required=True, help="The assembly in FASTA format.")
+    parser.add_argument("--hints", metavar="GFF", type=Path, help="Hints in GFF format used to weight sequences.")
+    parser.add_argument("--parts", metavar="N", type=int, required=True, help="The number of parts to create.")
+    parser.add_argument("--prefix", metavar="PREFIX", required=True, help="The prefix of the output files.")
+    parser.add_argument(
+        "--manifest",
+        metavar="TSV",
+        type=Path,
+        help="Where to write the partition manifest (default <PREFIX>.partitions.tsv).",
+    )
+    parser.add_argument(
+        "--masked-weight",
+        type=float,
+        default=0.5,
+        help="Fraction of the cost saved for each soft-masked base (default 0.5).",
+    )
+    parser.add_argument(
+        "--hint-weight",
+        type=float,
+        default=50.0,
+        help="Cost of a single hint in base-pair equivalents (default 50).",
+    )
+    parser.add_argument(
+        "--overhead",
+        type=float,
+        default=10000.0,
+        help="Fixed cost per sequence in base-pair equivalents (default 10000).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.fasta.is_file():
+        logger.error(f"The given input file {args.fasta} was not found!")
+        sys.exit(2)
+    if args.parts < 1:
+        logger.error("The number of parts must be at least 1.")
+        sys.exit(2)
+    hints = args.hints if args.hints is not None and args.hints.is_file() else None
+    manifest = args.manifest or Path(f"{args.prefix}.partitions.tsv")
+    partition_assembly(
+        args.fasta,
+        hints,
+        args.parts,
+        args.prefix,
+        manifest,
+        args.masked_weight,
+        args.hint_weight,
+        args.overhead,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+
+
+"""Cut an assembly into overlapping windows for RepeatMasker and soft-mask the assembly with the merged results."""
+
+
+import argparse
+import logging
+import mmap
+import shutil
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+# Bytes upper-cased at a time, to bound the memory used for long sequences.
+BLOCK_SIZE = 1 << 26
+
+
+def read_fasta(fasta):
+    """
+    Yield the records of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): A file in FASTA format.
+
+    Yields:
+        tuple: The sequence name and the lines of the record, including its header.
+
+    """
+    name = None
+    lines = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                if name is not None:
+                    yield name, lines
+                name = line[1:].split(None, 1)[0]
+                lines = []
+            lines.append(line if line.endswith("\n") else line + "\n")
+    if name is not None:
+        yield name, lines
+
+
+def windows_of(length, window, overlap):
+    """
+    Return the windows covering a sequence; consecutive windows overlap by ``overlap`` bases.
+
+    Args:
+        length (int): The length of the sequence.
+        window (int): The largest window size.
+        overlap (int): The number of bases shared by consecutive windows.
+
+    Returns:
+        list: Tuples of start and end (0-based, half-open).
+
+    """
+    step = max(window - overlap, 1)
+    windows = []
+    start = 0
+    while True:
+        end = min(start + window, length)
+        windows.append((start, end))
+        if end >= length:
+            return windows
+        start += step
+
+
+def split(args):
+    """
+    Write the windows of all sequences into batches of about ``window`` bases each.
+
+    Short sequences are combined into one batch; windows are named ``w<n>`` to stay
+    within the name length RepeatMasker accepts, and ``<prefix>.windows.tsv`` lists
+    the name, sequence and 0-based start of each.
+
+    """
+    batch = 0
+    size = args.window
+    count = 0
+    handle = None
+    with open(f"{args.prefix}.windows.tsv", "w") as table:
+        for name, lines in read_fasta(args.fasta):
+            bases = "".join(line.strip() for line in lines[1:])
+            for start, end in windows_of(len(bases), args.window, args.overlap):
+                if size >= args.window:
+                    if handle is not None:
+                        handle.close()
+                    batch += 1
+                    size = 0
+                    handle = open(f"{args.prefix}.{batch}.fa", "w")
+                count += 1
+                handle.write(f">w{count}\n")
+                handle.writelines(f"{bases[i : min(i + 80, end)]}\n" for i in range(start, end, 80))
+                table.write(f"w{count}\t{name}\t{start}\n")
+                size += end - start
+    if handle is not None:
+        handle.close()
+    logger.info(f"Wrote {count} windows in {batch} batches.")
+
+
+def read_windows(table):
+    """Read the sequence and 0-based start of each window, keyed by window name."""
+    windows = {}
+    with table.open() as handle:
+        for line in handle:
+            name, sequence, start = line.rstrip("\n").split("\t")
+            windows[name] = (sequence, int(start))
+    return windows
+
+
+def read_repeats(outs, windows):
+    """
+    Read the repeats RepeatMasker found in the windows and lift them to the assembly.
+
+    Repeats found twice, in the overlap of two windows, are reported once.
+
+    Args:
+        outs (list): The RepeatMasker annotations (``.out``) of all batches.
+        windows (dict): The windows, as returned by ``read_windows``.
+
+    Returns:
+        list: Tuples of sequence, start, end (1-based, inclusive), strand, divergence
+        and the name, start and end of the repeat, sorted by position.
+
+    """
+    repeats = set()
+    for out in outs:
+        with out.open() as handle:
+            for line in handle:
+                fields = line.split()
+                if len(fields) < 14 or not fields[0].isdigit() or fields[4] not in windows:
+                    continue
+                sequence, offset = windows[fields[4]]
+                strand = "+" if fields[8] == "+" else "-"
+                if strand == "+":
+                    target = (fields[11], fields[12])
+                else:
+                    target = (fields[13], fields[12])
+                repeats.add(
+                    (
+                        sequence,
+                        offset + int(fields[5]),
+                        offset + int(fields[6]),
+                        strand,
+                        fields[1],
+                        fields[9],
+                        target[0].strip("()"),
+                        target[1].strip("()"),
+                    )
+                )
+    return sorted(repeats)
+
+
+def merge_intervals(repeats):
+    """
+    Merge the repeats of each sequence into the union of their intervals.
+
+    Args:
+        repeats (list): The repeats, as returned by ``read_repeats``.
+
+    Returns:
+        dict: Lists of start and end (1-based, inclusive) keyed by sequence name.
+
+    """
+    merged = {}
+    for sequence, start, end, *_ in repeats:
+        intervals = merged.setdefault(sequence, [])
+        if intervals and start <= intervals[-1][1] + 1:
+            intervals[-1][1] = max(intervals[-1][1], end)
+        else:
+            intervals.append([start, end])
+    return merged
+
+
+def index_fasta(fasta):
+    """
+    Locate the sequences of a FASTA file, as ``samtools faidx`` does.
+
+    Args:
+        fasta (pathlib.Path): The assembly in FASTA format, with lines of equal length
+            within each sequence.
+
+    Returns:
+        dict: Tuples of byte offset of the first base, length, bases per line and
+        bytes per line, keyed by sequence name.
+
+    Raises:
+        ValueError: If the lines of a sequence differ in length.
+
+    """
+    index = {}
+    name = None
+    offset = 0
+    with fasta.open("rb") as handle:
+        for line in handle:
+            if line.startswith(b">"):
+                name = line[1:].split(None, 1)[0].decode()
+                index[name] = [offset + len(line), 0, 0, 0, False]
+            elif name is not None:
+                entry = index[name]
+                bases = len(line.rstrip(b"\r\n"))
+                if entry[4] or (entry[2] and bases > entry[2]):
+                    raise ValueError(f"The lines of sequence {name} differ in length.")
+                if entry[2] == 0:
+                    entry[2], entry[3] = bases, len(line)
+                elif bases < entry[2]:
+                    # Only the last line may be shorter
+                    entry[4] = True
+                entry[1] += bases
+            offset += len(line)
+    return {name: tuple(entry[:4]) for name, entry in index.items()}
+
+
+def mask(args):
+    """
+    Soft-mask the assembly with the union of the repeats of all windows.
+
+    The assembly is copied and changed in place through a memory map: all bases are
+    upper-cased and the repeats lower-cased, as RepeatMasker does with ``-xsmall``.
+
+    """
+    windows = read_windows(args.windows)
+    repeats = read_repeats(args.out, windows)
+    merged = merge_intervals(repeats)
+    index = index_fasta(args.fasta)
+    shutil.copyfile(args.fasta, args.output)
+    masked = 0
+    with open(args.output, "r+b") as handle, mmap.mmap(handle.fileno(), 0) as data:
+
+        def position(entry, base):
+            offset, _, line_bases, line_bytes = entry
+            return offset + (base // line_bases) * line_bytes + base % line_bases
+
+        for name, entry in index.items():
+            if entry[1] == 0:
+                continue
+            end = position(entry, entry[1] - 1) + 1
+            for start in range(entry[0], end, BLOCK_SIZE):
+                stop = min(start + BLOCK_SIZE, end)
+                data[start:stop] = data[start:stop].upper()
+            for start, stop in merged.get(name, []):
+                stop = min(stop, entry[1])
+                first, last = position(entry, start - 1), position(entry, stop - 1) + 1
+                data[first:last] = data[first:last].lower()
+                masked += stop - start + 1
+    logger.info(f"Masked {masked} bases in {sum(len(i) for i in merged.values())} intervals.")
+    with open(args.gff, "w") as handle:
+        handle.write("##gff-version 3\n")
+        order = {name: i for i, name in enumerate(index)}
+        for sequence, start, end, strand, divergence, repeat, first, last in sorted(
+            repeats, key=lambda r: (order.get(r[0], len(order)), r[1], r[2])
+        ):
+            handle.write(
+                f"{sequence}\tRepeatMasker\tsimilarity\t{start}\t{end}\t{divergence}\t{strand}\t.\t"
+                f'Target "Motif:{repeat}" {first} {last}\n'
+            )
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Cut an assembly into overlapping windows for RepeatMasker and soft-mask the assembly with the "
+        "merged results.",
+        epilog="Example: python repeat_windows.py split --fasta genome.fa --window 5000000 --prefix genome",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("split", help="Write overlapping windows of the assembly in batches.")
+    command.set_defaults(func=split, inputs=("fasta",))
+    command.add_argument("--fasta", type=Path, required=True, help="The assembly in FASTA format.")
+    command.add_argument(
+        "--window",
+        type=int,
+        required=True,
+        help="The largest window, and the number of bases per batch.",
+    )
+    command.add_argument(
+        "--overlap",
+        type=int,
+        default=20000,
+        help="The number of bases shared by consecutive windows; longer than most repeats (default 20000).",
+    )
+    command.add_argument("--prefix", default="windows", help="The prefix of the output files (default windows).")
+
+    command = commands.add_parser("mask", help="Soft-mask the assembly with the repeats found in the windows.")
+    command.set_defaults(func=mask, inputs=("fasta", "windows"))
+    command.add_argument("--fasta", type=Path, required=True, help="The assembly in FASTA format.")
+    command.add_argument("--windows", type=Path, required=True, help="The windows, as written by split.")
+    command.add_argument(
+        "--out",
+        type=Path,
+        nargs="+",
+        required=True,
+        help="The RepeatMasker annotations (.out) of all batches.",
+    )
+    command.add_argument("--output", type=Path, required=True, help="The soft-masked assembly.")
+    command.add_argument("--gff", type=Path, required=True, help="The repeats on the assembly in GFF format.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for name in args.inputs:
+        path = getattr(args, name)
+        if not path.is_file():
+            logger.error(f"The given input file {path} was not found!")
+            sys.exit(2)
+    if args.command == "split" and args.overlap >= args.window:
+        logger.error("The overlap must be shorter than the window.")
+        sys.exit(2)
+    try:
+        args.func(args)
+    except ValueError as error:
+        logger.error(str(error))
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
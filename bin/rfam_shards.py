@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+
+"""Split the Rfam covariance model database into shards of similar search cost."""
+
+
+import argparse
+import gzip
+import heapq
+import logging
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+def open_text(path):
+    """Open a plain or gzip compressed text file for reading."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt")
+    return path.open()
+
+
+def read_models(database):
+    """
+    Read the name and consensus length of each model in a CM file.
+
+    Each model consists of the covariance model and the profile HMM that
+    cmsearch uses as its filter, both ending in ``//``.
+
+    Args:
+        database (pathlib.Path): The covariance models, optionally gzip compressed.
+
+    Returns:
+        list: Tuples of consensus length, position in the file and name of each model.
+
+    """
+    models = []
+    with open_text(database) as handle:
+        for line in handle:
+            if line.startswith("INFERNAL"):
+                models.append([1, len(models), None])
+            elif models and models[-1][2] is None and line.startswith("NAME "):
+                models[-1][2] = line.split()[1]
+            elif models and line.startswith("CLEN "):
+                models[-1][0] = int(line.split()[1])
+    logger.info(f"Read {len(models)} models.")
+    return [tuple(model) for model in models]
+
+
+def pack(models, nshards):
+    """
+    Assign models to shards so that the largest total consensus length is as small as possible.
+
+    The consensus length is taken as the cost of searching a model, as both the
+    filter and the CM stages of cmsearch scale with it. Uses the longest-processing-time-first
+    heuristic: models are visited by decreasing cost and each one is placed in the
+    shard with the lowest total cost.
+
+    Args:
+        models (list): The models, as returned by ``read_models``.
+        nshards (int): The number of shards to create.
+
+    Returns:
+        list: The shard of each model, by position in the file.
+
+    """
+    heap = [(0, i) for i in range(min(nshards, len(models)))]
+    shards = [0] * len(models)
+    for cost, position, _ in sorted(models, key=lambda m: (-m[0], m[1])):
+        load, index = heapq.heappop(heap)
+        shards[position] = index
+        heapq.heappush(heap, (load + cost, index))
+    return shards
+
+
+def write_shards(database, shards, prefix):
+    """
+    Write one CM file per shard, named ``<prefix>.<n>.cm``, keeping the models in file order.
+
+    Args:
+        database (pathlib.Path): The covariance models, optionally gzip compressed.
+        shards (list): The shard of each model, as returned by ``pack``.
+        prefix (str): The output file prefix.
+
+    """
+    handles = [open(f"{prefix}.{number}.cm", "w") for number in range(1, max(shards, default=0) + 2)]
+    try:
+        position = -1
+        with open_text(database) as handle:
+            for line in handle:
+                if line.startswith("INFERNAL"):
+                    position += 1
+                if position >= 0:
+                    handles[shards[position]].write(line)
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Split the Rfam covariance model database into shards of similar search cost.",
+        epilog="Example: python rfam_shards.py --cm Rfam.cm.gz --shards 16 --prefix rfam",
+    )
+    parser.add_argument(
+        "--cm",
+        metavar="CM",
+        type=Path,
+        required=True,
+        help="The covariance models, optionally gzip compressed.",
+    )
+    parser.add_argument("--shards", metavar="N", type=int, required=True, help="The number of shards to create.")
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="rfam",
+        help="The prefix of the output files (default rfam).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    if not args.cm.is_file():
+        logger.error(f"The given input file {args.cm} was not found!")
+        sys.exit(2)
+    models = read_models(args.cm)
+    shards = pack(models, max(args.shards, 1))
+    write_shards(args.cm, shards, args.prefix)
+    for number in range(max(shards, default=0) + 1):
+        cost = sum(model[0] for model in models if shards[model[1]] == number)
+        logger.info(f"Shard {number + 1}: {shards.count(number)} models, consensus length {cost}.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+
+
+"""Convert SPALN alignments of a shard of scaffolds into gene models, EVM and GMOD tracks and AUGUSTUS hints in one pass."""
+
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+CDS_FEATURES = ("cds", "CDS")
+MRNA_FEATURES = ("mRNA", "transcript")
+
+# Hint settings of align2hints.pl for SPALN.
+HINT_SOURCE = "spn2h"
+CDSPART_CUTOFF = 15
+MIN_INTRON_LENGTH = 41
+MIN_INTRON_SCORE = 150
+
+
+def attributes_of(column):
+    """Parse a GFF attribute column into an ordered dictionary."""
+    attributes = {}
+    for field in column.strip().split(";"):
+        if "=" in field:
+            key, value = field.split("=", 1)
+            attributes[key] = value
+    return attributes
+
+
+def format_attributes(attributes):
+    """Format a dictionary of attributes as a GFF attribute column."""
+    return ";".join(f"{key}={value}" for key, value in attributes.items())
+
+
+def format_number(value):
+    """Format a score without a trailing ``.0``."""
+    return f"{value:.10g}"
+
+
+def score_of(fields):
+    """Return the score of a GFF record, treating a missing score as 0."""
+    try:
+        return float(fields[5])
+    except ValueError:
+        return 0.0
+
+
+def read_alignments(gffs):
+    """
+    Read the alignments of one shard, as split by sequence in the alignment jobs.
+
+    Args:
+        gffs (list): SPALN alignments in GFF format (``sortgrcd -O0``).
+
+    Returns:
+        list: One list of GFF records (lists of fields) per gene, sorted by position.
+
+    """
+    alignments = []
+    for gff in gffs:
+        current = None
+        with gff.open() as handle:
+            for line in handle:
+                if line.startswith("#") or not line.strip():
+                    continue
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 9:
+                    continue
+                if fields[2] == "gene" or current is None or (
+                    fields[2] in MRNA_FEATURES and any(f[2] in MRNA_FEATURES for f in current)
+                ):
+                    current = []
+                    alignments.append(current)
+                current.append(fields)
+    alignments.sort(key=lambda records: (records[0][0], int(records[0][3]), int(records[0][4])))
+    return alignments
+
+
+def write_models(alignments, handle):
+    """Write the alignments as gene models, with an exon for each CDS."""
+    for records in alignments:
+        for fields in records:
+            if fields[2] in CDS_FEATURES:
+                attributes = attributes_of(fields[8])
+                attributes["ID"] = attributes.get("ID", "") + "-E"
+                handle.write("\t".join(fields[:2] + ["exon"] + fields[3:8] + [format_attributes(attributes)]) + "\n")
+            elif fields[2] == "transcript":
+                fields = fields[:2] + ["mRNA"] + fields[3:]
+            handle.write("\t".join(fields) + "\n")
+
+
+def write_evm(alignments, handle):
+    """Write the CDS of each alignment as EVM protein evidence."""
+    for records in alignments:
+        for fields in records:
+            if fields[2] in CDS_FEATURES:
+                parent = attributes_of(fields[8]).get("Parent", "")
+                handle.write(
+                    "\t".join(fields[:1] + ["SPALN_OTHER", "nucleotide_to_protein_match"] + fields[3:7] + ["."])
+                    + f"\tID=TranscriptAlign.{parent};Target={parent}\n"
+                )
+
+
+def write_gmod(alignments, handle):
+    """Write each alignment as a protein match with its parts, for genome browsers."""
+    for records in alignments:
+        match = None
+        part = 0
+        for fields in records:
+            if fields[2] in MRNA_FEATURES:
+                mrna = attributes_of(fields[8]).get("ID", "")
+                match = f"ProteinAlign-{mrna}"
+                part = 0
+                handle.write(
+                    "\t".join(fields[:1] + ["protein2genome", "protein_match"] + fields[3:7] + ["."])
+                    + f"\tID={match};Target={mrna}\n"
+                )
+            elif fields[2] in CDS_FEATURES and match is not None:
+                part += 1
+                parent = attributes_of(fields[8]).get("Parent", "")
+                handle.write(
+                    "\t".join(fields[:1] + ["protein2genome", "match_part"] + fields[3:7] + ["."])
+                    + f"\tID={match}.{part};Parent={match};Target={parent}\n"
+                )
+
+
+def write_hints(alignments, handle, source, priority, max_intron):
+    """
+    Write CDSpart, intron, start and stop hints as align2hints.pl does for SPALN.
+
+    Args:
+        alignments (list): The alignments, as returned by ``read_alignments``.
+        handle (file): Where to write the hints.
+        source (str): The source of the hints in the AUGUSTUS extrinsic config.
+        priority (int): The priority of the hints.
+        max_intron (int): The longest intron to create a hint for.
+
+    """
+
+    def hint(seqname, feature, start, end, score, strand, frame, protein):
+        handle.write(
+            f"{seqname}\t{HINT_SOURCE}\t{feature}\t{start}\t{end}\t{score}\t{strand}\t{frame}\t"
+            f"src={source};grp={protein};pri={priority}\n"
+        )
+
+    for records in alignments:
+        mrna = None
+        previous = None
+        for fields in records:
+            if fields[2] in MRNA_FEATURES:
+                mrna = (int(fields[3]), int(fields[4]))
+                previous = None
+                continue
+            if fields[2] not in CDS_FEATURES:
+                continue
+            seqname, strand, frame = fields[0], fields[6], fields[7]
+            start, end = sorted((int(fields[3]), int(fields[4])))
+            target = attributes_of(fields[8]).get("Target", "").split()
+            protein = target[0] if target else ""
+            # A CDS aligned from the first residue of the protein marks its start;
+            # the end of the alignment is taken as its stop
+            if len(target) >= 2 and target[1] == "1" and mrna is not None:
+                if strand == "+":
+                    hint(seqname, "start", start, start + 2, ".", strand, 0, protein)
+                    hint(seqname, "stop", mrna[1] - 2, mrna[1], ".", strand, 0, protein)
+                else:
+                    hint(seqname, "start", end - 2, end, ".", strand, 0, protein)
+                    hint(seqname, "stop", mrna[0], mrna[0] + 2, ".", strand, 0, protein)
+            part_start, part_end = start + CDSPART_CUTOFF, end - CDSPART_CUTOFF
+            if part_start > part_end:
+                part_start = part_end = (start + end) // 2
+            hint(seqname, "CDSpart", part_start, part_end, fields[5], strand, frame, protein)
+            # SPALN lists the CDS of minus strand alignments from right to left
+            if previous is not None:
+                if strand == "-":
+                    intron_start, intron_end = end + 1, previous[0] - 1
+                else:
+                    intron_start, intron_end = previous[1] + 1, start - 1
+                intron_start, intron_end = sorted((intron_start, intron_end))
+                length = intron_end - intron_start + 1
+                score = previous[2] / 2 + score_of(fields) / 2
+                if MIN_INTRON_LENGTH <= length <= max_intron and score > MIN_INTRON_SCORE:
+                    hint(seqname, "intron", intron_start, intron_end, format_number(score), strand, ".", protein)
+            previous = (start, end, score_of(fields))
+
+
+def spaln_convert(gffs, prefix, source, priority, max_intron):
+    """
+    Convert the alignments of one shard and write all outputs.
+
+    Args:
+        gffs (list): SPALN alignments in GFF format, all on the sequences of the shard.
+        prefix (str): The prefix of the output files.
+        source (str): The source of the hints.
+        priority (int): The priority of the hints.
+        max_intron (int): The longest intron to create a hint for.
+
+    """
+    alignments = read_alignments(gffs)
+    logger.info(f"Read {len(alignments)} alignments.")
+    with open(f"{prefix}.spaln.gff", "w") as models, open(f"{prefix}.evm.gff3", "w") as evm, open(
+        f"{prefix}.gmod.gff3", "w"
+    ) as gmod, open(f"{prefix}.hints.gff", "w") as hints:
+        write_models(alignments, models)
+        write_evm(alignments, evm)
+        write_gmod(alignments, gmod)
+        write_hints(alignments, hints, source, priority, max_intron)
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Convert SPALN alignments of a shard of scaffolds into gene models, EVM and GMOD tracks and "
+        "AUGUSTUS hints in one pass.",
+        epilog="Example: python spaln_convert.py --prefix shard_0001 chunks/*.spaln.1.gff",
+    )
+    parser.add_argument("gff", metavar="GFF", type=Path, nargs="+", help="SPALN alignments in GFF format.")
+    parser.add_argument("--prefix", metavar="PREFIX", default="spaln", help="The prefix of the output files.")
+    parser.add_argument("--source", default="P", help="The source of the hints (default P).")
+    parser.add_argument("--priority", type=int, default=4, help="The priority of the hints (default 4).")
+    parser.add_argument(
+        "--max_intron",
+        type=int,
+        default=350000,
+        help="The longest intron to create a hint for (default 350000).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for gff in args.gff:
+        if not gff.is_file():
+            logger.error(f"The given input file {gff} was not found!")
+            sys.exit(2)
+    spaln_convert(args.gff, args.prefix, args.source, args.priority, args.max_intron)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
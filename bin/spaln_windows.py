@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+
+
+"""Group proteins by their candidate loci into batches of protein and genome window sequences for SPALN."""
+
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+def read_fasta(fasta):
+    """
+    Yield the records of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): A file in FASTA format.
+
+    Yields:
+        tuple: The sequence name and the lines of the record, including its header.
+
+    """
+    name = None
+    lines = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                if name is not None:
+                    yield name, lines
+                name = line[1:].split(None, 1)[0]
+                lines = []
+            lines.append(line if line.endswith("\n") else line + "\n")
+    if name is not None:
+        yield name, lines
+
+
+def merge_intervals(intervals):
+    """
+    Merge overlapping or adjacent intervals.
+
+    Args:
+        intervals (list): Tuples of start and end (0-based, half-open).
+
+    Returns:
+        list: The merged intervals, sorted by start.
+
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def read_loci(paf, flank):
+    """
+    Read the candidate loci of each protein from seed alignments in PAF format.
+
+    Args:
+        paf (pathlib.Path): The protein-to-genome alignments.
+        flank (int): The number of bases added on both sides of a locus, to catch
+            terminal exons the seeds missed.
+
+    Returns:
+        dict: Lists of sequence name, start and end keyed by protein.
+
+    """
+    loci = {}
+    with paf.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            fields = line.split("\t")
+            protein, sequence, length = fields[0], fields[5], int(fields[6])
+            start = max(0, int(fields[7]) - flank)
+            end = min(length, int(fields[8]) + flank)
+            loci.setdefault(protein, []).append((sequence, start, end))
+    return loci
+
+
+def group_loci(loci):
+    """
+    Group the proteins whose candidate loci overlap, so that they share their windows.
+
+    Args:
+        loci (dict): The candidate loci per protein, as returned by ``read_loci``.
+
+    Returns:
+        list: Tuples of the proteins of a group and its loci, merged per sequence as
+        a dictionary of intervals keyed by sequence name; sorted by position.
+
+    """
+    parent = {protein: protein for protein in loci}
+
+    def find(protein):
+        while parent[protein] != protein:
+            parent[protein] = parent[parent[protein]]
+            protein = parent[protein]
+        return protein
+
+    by_sequence = {}
+    for protein, intervals in loci.items():
+        for sequence, start, end in intervals:
+            by_sequence.setdefault(sequence, []).append((start, end, protein))
+    for intervals in by_sequence.values():
+        reach = None
+        for start, end, protein in sorted(intervals):
+            if reach is not None and start < reach[0]:
+                parent[find(protein)] = find(reach[1])
+                reach = (max(reach[0], end), reach[1])
+            else:
+                reach = (end, protein)
+
+    groups = {}
+    for protein, intervals in loci.items():
+        proteins, windows = groups.setdefault(find(protein), ([], {}))
+        proteins.append(protein)
+        for sequence, start, end in intervals:
+            windows.setdefault(sequence, []).append((start, end))
+    merged = [
+        (proteins, {sequence: merge_intervals(intervals) for sequence, intervals in windows.items()})
+        for proteins, windows in groups.values()
+    ]
+    return sorted(merged, key=lambda group: min((s, i[0][0]) for s, i in group[1].items()))
+
+
+def plan_batches(groups, batch_size):
+    """
+    Pack groups of proteins into batches of at most ``batch_size`` proteins.
+
+    A group with more proteins than fit into a batch is split; each of its parts
+    keeps all windows of the group.
+
+    Args:
+        groups (list): The groups, as returned by ``group_loci``.
+        batch_size (int): The largest number of proteins per batch.
+
+    Returns:
+        list: One list of groups per batch.
+
+    """
+    batches = []
+    size = batch_size
+    for proteins, windows in groups:
+        for first in range(0, len(proteins), batch_size):
+            part = proteins[first : first + batch_size]
+            if size + len(part) > batch_size:
+                batches.append([])
+                size = 0
+            batches[-1].append((part, windows))
+            size += len(part)
+    return batches
+
+
+def write_batches(proteins, genome, batches, prefix):
+    """
+    Write the proteins and genome windows of each group, in a directory per batch.
+
+    Each group of batch ``<n>`` is a directory ``<prefix>.<n>/<g>`` holding its
+    proteins in ``proteins.fa`` and its windows, named ``w<n>``, in ``windows.fa``;
+    ``windows.tsv`` lists the name, sequence and 0-based start of each window.
+
+    Args:
+        proteins (pathlib.Path): The proteins in FASTA format.
+        genome (pathlib.Path): The (masked) assembly in FASTA format.
+        batches (list): The groups of each batch, as returned by ``plan_batches``.
+        prefix (str): The prefix of the batch directories.
+
+    """
+    directories = {}
+    by_sequence = {}
+    for number, batch in enumerate(batches, start=1):
+        for group, (part, windows) in enumerate(batch, start=1):
+            directory = Path(f"{prefix}.{number}") / str(group)
+            directory.mkdir(parents=True, exist_ok=True)
+            for protein in part:
+                directories[protein] = directory
+            for sequence, intervals in windows.items():
+                by_sequence.setdefault(sequence, []).append((directory, intervals))
+
+    count = 0
+    for name, lines in read_fasta(proteins):
+        if name in directories:
+            with (directories[name] / "proteins.fa").open("a") as handle:
+                handle.writelines(lines)
+            count += 1
+    logger.info(f"Wrote {count} proteins in {len(batches)} batches; {len(directories) - count} proteins not found.")
+
+    counters = {}
+    for name, lines in read_fasta(genome):
+        if name not in by_sequence:
+            continue
+        bases = "".join(line.strip() for line in lines[1:])
+        for directory, intervals in by_sequence[name]:
+            with (directory / "windows.fa").open("a") as fasta, (directory / "windows.tsv").open("a") as table:
+                for start, end in intervals:
+                    counters[directory] = counters.get(directory, 0) + 1
+                    window = f"w{counters[directory]}"
+                    fasta.write(f">{window}\n")
+                    fasta.writelines(f"{bases[i : min(i + 80, end)]}\n" for i in range(start, end, 80))
+                    table.write(f"{window}\t{name}\t{start}\n")
+    logger.info(f"Wrote {sum(counters.values())} genome windows.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Group proteins by their candidate loci into batches of protein and genome window sequences for SPALN.",
+        epilog="Example: python spaln_windows.py --genome genome.fa --proteins proteins.fa --paf seeds.paf --batch_size 200",
+    )
+    parser.add_argument("--genome", metavar="FASTA", type=Path, required=True, help="The assembly in FASTA format.")
+    parser.add_argument("--proteins", metavar="FASTA", type=Path, required=True, help="The proteins in FASTA format.")
+    parser.add_argument(
+        "--paf",
+        metavar="PAF",
+        type=Path,
+        required=True,
+        help="Seed alignments of the proteins to the assembly in PAF format.",
+    )
+    parser.add_argument(
+        "--flank",
+        metavar="N",
+        type=int,
+        default=20000,
+        help="The number of bases added on both sides of each locus (default 20000).",
+    )
+    parser.add_argument(
+        "--batch_size",
+        metavar="N",
+        type=int,
+        default=200,
+        help="The largest number of proteins per batch (default 200).",
+    )
+    parser.add_argument(
+        "--prefix",
+        metavar="PREFIX",
+        default="spaln_windows",
+        help="The prefix of the batch directories (default spaln_windows).",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for path in (args.genome, args.proteins, args.paf):
+        if not path.is_file():
+            logger.error(f"The given input file {path} was not found!")
+            sys.exit(2)
+    loci = read_loci(args.paf, max(args.flank, 0))
+    groups = group_loci(loci)
+    logger.info(f"Found candidate loci for {len(loci)} proteins in {len(groups)} groups.")
+    write_batches(args.proteins, args.genome, plan_batches(groups, max(args.batch_size, 1)), args.prefix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+
+"""Plan an incremental re-annotation and splice its results into those of a previous run."""
+
+
+import argparse
+import logging
+import re
+import sys
+from pathlib import Path
+
+
+logger = logging.getLogger()
+
+
+# Identifiers written by gff_toolkit.py --stable_ids.
+STABLE_ID = re.compile(r"\b(gene|mRNA)\.(\d+)\b")
+
+
+def read_manifest(manifest):
+    """
+    Read the name and digest of each sequence from a manifest of ``fasta_digest.py``.
+
+    Args:
+        manifest (pathlib.Path): The sequence manifest in TSV format.
+
+    Returns:
+        dict: Sequence digests keyed by sequence name, in file order.
+
+    """
+    digests = {}
+    with manifest.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            name, _, digest = line.rstrip("\n").split("\t")[:3]
+            digests[name] = digest
+    return digests
+
+
+def read_names(names):
+    """Read a list of sequence names, one per line."""
+    with names.open() as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def write_names(names, output):
+    """Write a list of sequence names, one per line."""
+    with output.open("w") as handle:
+        handle.writelines(f"{name}\n" for name in names)
+
+
+def plan(args):
+    """Compare the current assembly to the previous one and list changed and unchanged sequences."""
+    current = read_manifest(args.current)
+    previous = read_manifest(args.previous)
+    changed = [name for name, digest in current.items() if previous.get(name) != digest]
+    unchanged = [name for name, digest in current.items() if previous.get(name) == digest]
+    removed = [name for name in previous if name not in current]
+    write_names(changed, args.changed)
+    write_names(unchanged, args.unchanged)
+    logger.info(
+        f"{len(changed)} new or changed, {len(unchanged)} unchanged and {len(removed)} removed sequences."
+    )
+
+
+def read_fasta(fasta):
+    """
+    Yield the records of a FASTA file.
+
+    Args:
+        fasta (pathlib.Path): A file in FASTA format.
+
+    Yields:
+        tuple: The sequence name and the lines of the record, including its header.
+
+    """
+    name = None
+    lines = []
+    with fasta.open() as handle:
+        for line in handle:
+            if line.startswith(">"):
+                if name is not None:
+                    yield name, lines
+                name = line[1:].split(None, 1)[0]
+                lines = []
+            lines.append(line if line.endswith("\n") else line + "\n")
+    if name is not None:
+        yield name, lines
+
+
+def subset(args):
+    """Write the sequences of a FASTA file that are on a list."""
+    names = set(read_names(args.names))
+    count = 0
+    with args.output.open("w") as handle:
+        for name, lines in read_fasta(args.fasta):
+            if name in names:
+                handle.writelines(lines)
+                count += 1
+    if count == 0:
+        logger.warning(f"None of the listed sequences were found in {args.fasta}.")
+    logger.info(f"Wrote {count} sequences.")
+
+
+def splice_fasta(args):
+    """Combine unchanged sequences of the previous run with the sequences of this run."""
+    unchanged = set(read_names(args.unchanged))
+    order = list(read_manifest(args.manifest))
+    records = {}
+    for name, lines in read_fasta(args.previous):
+        if name in unchanged:
+            records[name] = lines
+    for name, lines in read_fasta(args.current):
+        if name not in unchanged:
+            records[name] = lines
+    missing = [name for name in order if name not in records]
+    if missing:
+        logger.critical(f"No sequence found for {', '.join(missing[:10])}.")
+        sys.exit(1)
+    with args.output.open("w") as handle:
+        for name in order:
+            handle.writelines(records[name])
+
+
+def renumber(line, offsets):
+    """Shift the numbers of the stable gene and mRNA identifiers of a GFF line."""
+    return STABLE_ID.sub(lambda m: f"{m.group(1)}.{int(m.group(2)) + offsets[m.group(1)]}", line)
+
+
+def splice_gff(args):
+    """
+    Combine the features of unchanged sequences of the previous run with those of this run.
+
+    With ``--renumber``, the stable gene and mRNA identifiers of this run are shifted
+    past the highest identifier of the previous run, so that the identifiers of all
+    models on unchanged sequences stay the same.
+
+    """
+    unchanged = set(read_names(args.unchanged))
+    order = {name: i for i, name in enumerate(read_manifest(args.manifest))}
+    kept = []
+    highest = {"gene": 0, "mRNA": 0}
+    with args.previous.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            # Never hand out an identifier again, even that of a model that was replaced.
+            for match in STABLE_ID.finditer(line):
+                highest[match.group(1)] = max(highest[match.group(1)], int(match.group(2)))
+            if line.split("\t", 1)[0] in unchanged:
+                kept.append(line if line.endswith("\n") else line + "\n")
+    # gff_toolkit.py starts counting at 1000, i.e. the first model of this run is 1001.
+    offsets = {kind: max(number - 1000, 0) for kind, number in highest.items()}
+    added = []
+    with args.current.open() as handle:
+        for line in handle:
+            if line.startswith("#") or not line.strip():
+                continue
+            if line.split("\t", 1)[0] not in unchanged:
+                line = line if line.endswith("\n") else line + "\n"
+                added.append(renumber(line, offsets) if args.renumber else line)
+    # Keep the models of each sequence together and in their original order.
+    blocks = {}
+    for line in kept + added:
+        blocks.setdefault(line.split("\t", 1)[0], []).append(line)
+    with args.output.open("w") as handle:
+        handle.write("##gff-version 3\n")
+        for name in sorted(blocks, key=lambda n: order.get(n, len(order))):
+            handle.writelines(blocks[name])
+    logger.info(f"Kept {len(kept)} features of the previous run and added {len(added)}.")
+
+
+def parse_args(argv=None):
+    """Define and immediately parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Plan an incremental re-annotation and splice its results into those of a previous run.",
+        epilog="Example: python splice_annotation.py plan --current new.tsv --previous old.tsv "
+        "--changed changed.txt --unchanged unchanged.txt",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        help="The desired log level (default WARNING).",
+        choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+        default="WARNING",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("plan", help="List new or changed and unchanged sequences.")
+    command.set_defaults(func=plan, inputs=("current", "previous"))
+    command.add_argument("--current", type=Path, required=True, help="Sequence manifest of this run.")
+    command.add_argument("--previous", type=Path, required=True, help="Sequence manifest of the previous run.")
+    command.add_argument("--changed", type=Path, required=True, help="Where to list new or changed sequences.")
+    command.add_argument("--unchanged", type=Path, required=True, help="Where to list unchanged sequences.")
+
+    command = commands.add_parser("subset", help="Extract listed sequences from a FASTA file.")
+    command.set_defaults(func=subset, inputs=("fasta", "names"))
+    command.add_argument("--fasta", type=Path, required=True, help="The sequences in FASTA format.")
+    command.add_argument("--names", type=Path, required=True, help="The names of the sequences to extract.")
+    command.add_argument("--output", type=Path, required=True, help="The extracted sequences.")
+
+    for name, func, kind in [("fasta", splice_fasta, "FASTA"), ("gff", splice_gff, "GFF")]:
+        command = commands.add_parser(name, help=f"Splice {kind} results of this and the previous run.")
+        command.set_defaults(func=func, inputs=("current", "previous", "unchanged", "manifest"))
+        command.add_argument("--current", type=Path, required=True, help=f"The {kind} results of this run.")
+        command.add_argument("--previous", type=Path, required=True, help=f"The {kind} results of the previous run.")
+        command.add_argument("--unchanged", type=Path, required=True, help="The list of unchanged sequences.")
+        command.add_argument("--manifest", type=Path, required=True, help="Sequence manifest of this run.")
+        command.add_argument("--output", type=Path, required=True, help="The spliced results.")
+        if name == "gff":
+            command.add_argument(
+                "--renumber",
+                action="store_true",
+                help="Shift the gene and mRNA identifiers of this run past those of the previous run.",
+            )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Coordinate argument parsing and program execution."""
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="[%(levelname)s] %(message)s")
+    for name in args.inputs:
+        path = getattr(args, name)
+        if not path.is_file():
+            logger.error(f"The given input file {path} was not found!")
+            sys.exit(2)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
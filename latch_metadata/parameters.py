@@ -26,6 +26,30 @@ generated_parameters = {
         section_title=None,
         description='The output directory where the results will be saved. You have to use absolute paths to storage on Cloud infrastructure.',
     ),
+    'result_cache': NextflowParameter(
+        type=typing.Optional[LatchDir],
+        default=None,
+        section_title=None,
+        description='Directory on Latch to keep the results of expensive steps in, so that reruns of the same assembly can reuse them.',
+    ),
+    'result_cache_size': NextflowParameter(
+        type=typing.Optional[int],
+        default=500,
+        section_title=None,
+        description='Maximum size of the result cache in GiB; the least recently used assemblies are evicted first.',
+    ),
+    'previous_run': NextflowParameter(
+        type=typing.Optional[LatchDir],
+        default=None,
+        section_title=None,
+        description='Output directory of an earlier run on a previous version of the assembly; only new or changed sequences are annotated again.',
+    ),
+    'resource_history': NextflowParameter(
+        type=typing.Optional[LatchDir],
+        default=None,
+        section_title=None,
+        description='Directory on Latch to keep the execution traces of past runs in; resource requests of this run are tuned from them.',
+    ),
     'email': NextflowParameter(
         type=typing.Optional[str],
         default=None,
@@ -44,6 +68,24 @@ generated_parameters = {
         section_title=None,
         description='Path to samplesheet for RNAseq data.',
     ),
+    'validate_fastq': NextflowParameter(
+        type=typing.Optional[bool],
+        default=False,
+        section_title=None,
+        description='Check that all FASTQ files of the RNAseq samplesheet exist, are complete and that read pairs are in sync before starting.',
+    ),
+    'rnaseq_norm_depth': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Normalise RNAseq reads to this k-mer depth before alignment.',
+    ),
+    'star_batch_size': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Align this many RNAseq libraries per STAR job, sharing one copy of the genome index in memory.',
+    ),
     'proteins': NextflowParameter(
         type=typing.Optional[LatchFile],
         default=None,
@@ -80,6 +122,12 @@ generated_parameters = {
         section_title='Options for pipeline behavior',
         description='Chunk size for splitting the assembly.',
     ),
+    'npart': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Number of parts with balanced workload to split the assembly into.',
+    ),
     'max_intron_size': NextflowParameter(
         type=typing.Optional[int],
         default=None,
@@ -104,6 +152,12 @@ generated_parameters = {
         section_title=None,
         description='A database of curated repeats in EMBL format.',
     ),
+    'rm_window_size': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Size of the overlapping windows masked in parallel by RepeatMasker.',
+    ),
     'busco_lineage': NextflowParameter(
         type=typing.Optional[str],
         default=None,
@@ -158,12 +212,30 @@ generated_parameters = {
         section_title=None,
         description='Length of annotation chunks in AUGUSTUS',
     ),
+    'aug_njobs': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Number of jobs to share all AUGUSTUS chunks of the genome across.',
+    ),
     'aug_training': NextflowParameter(
         type=typing.Optional[bool],
         default=False,
         section_title=None,
         description='Enable training of a new AUGUSTUS profile.',
     ),
+    'aug_training_rounds': NextflowParameter(
+        type=typing.Optional[int],
+        default=5,
+        section_title=None,
+        description='Largest number of rounds of AUGUSTUS parameter optimisation; training stops early once a round no longer improves accuracy.',
+    ),
+    'aug_training_kfold': NextflowParameter(
+        type=typing.Optional[int],
+        default=8,
+        section_title=None,
+        description='Number of folds of the cross-validation during AUGUSTUS parameter optimisation; the folds are evaluated in parallel.',
+    ),
     'pri_prot': NextflowParameter(
         type=typing.Optional[int],
         default=3,
@@ -248,12 +320,24 @@ generated_parameters = {
         section_title=None,
         description='Numbe of proteins per alignment job.',
     ),
+    'protein_cluster_id': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Cluster proteins at this percent identity with CD-HIT and align one representative per cluster.',
+    ),
     'spaln_q': NextflowParameter(
         type=typing.Optional[int],
         default=5,
         section_title=None,
         description='Q value for the SPALN alignment algorithm.',
     ),
+    'spaln_prefilter': NextflowParameter(
+        type=typing.Optional[bool],
+        default=False,
+        section_title=None,
+        description='Align each protein with SPALN only against the genome windows of its seed hits.',
+    ),
     'spaln_protein_id_targeted': NextflowParameter(
         type=typing.Optional[int],
         default=90,
@@ -264,7 +348,7 @@ generated_parameters = {
         type=typing.Optional[int],
         default=1000,
         section_title='Options for PASA behavior',
-        description='Number of PASA models to select for AUGUSTUS training.',
+        description='Number of PASA models to select for AUGUSTUS training; the best scoring complete models are kept and overlapping models dropped.',
     ),
     'pasa_config_file': NextflowParameter(
         type=typing.Optional[str],
@@ -284,12 +368,30 @@ generated_parameters = {
         section_title=None,
         description='Number of EVM jobs per chunk.',
     ),
+    'evm_segment_size': NextflowParameter(
+        type=typing.Optional[int],
+        default=2000000,
+        section_title=None,
+        description='Size of the genome segments EVM works on, in bp.',
+    ),
+    'evm_overlap_size': NextflowParameter(
+        type=typing.Optional[int],
+        default=200000,
+        section_title=None,
+        description='Overlap between neighboring EVM segments, in bp.',
+    ),
     'trinity': NextflowParameter(
         type=typing.Optional[bool],
         default=None,
         section_title='Options for tool behavior',
         description='Activate the trinity assembly sub-pipeline',
     ),
+    'trinity_parts': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Assemble transcripts in this many parallel Trinity jobs, each on a balanced set of read clusters.',
+    ),
     'pasa': NextflowParameter(
         type=typing.Optional[bool],
         default=None,
@@ -308,5 +410,11 @@ generated_parameters = {
         section_title=None,
         description='Activate search for ncRNAs with RFam/infernal',
     ),
+    'ncrna_shards': NextflowParameter(
+        type=typing.Optional[int],
+        default=None,
+        section_title=None,
+        description='Number of shards of Rfam families to search in parallel.',
+    ),
 }
 
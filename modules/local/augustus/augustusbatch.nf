@@ -2,12 +2,12 @@ process AUGUSTUS_AUGUSTUSBATCH {
     tag "$meta.id"
     label 'process_high'
     
-    conda (params.enable_conda ? "bioconda::augustus=3.4.0 bioconda::exonerate=2.4.0 bioconda::samtools=1.14" : null)
+    conda (params.enable_conda ? "bioconda::augustus=3.4.0 bioconda::exonerate=2.4.0 bioconda::samtools=1.14 bioconda::htslib=1.14" : null)
     container 'ikmb/esga:aug_1.3'
 
     input:
     tuple val(meta), path(genome)
-    path(hints)
+    tuple path(hints), path(hints_tbi)
     env AUGUSTUS_CONFIG_PATH
     path aug_config
     val aug_chunk_length
@@ -24,9 +24,11 @@ process AUGUSTUS_AUGUSTUSBATCH {
     augustus_result = "augustus.${chunk_name}.out.gff"
 
     """
+    # Each chunk reads its hints with tabix
+    command -v tabix > /dev/null || { echo "ERROR: tabix was not found in the container" >&2; exit 1; }
     samtools faidx $genome
     fastaexplode -f $genome -d .
-    augustus_from_chunks.pl --chunk_length $aug_chunk_length --genome_fai ${genome}.fai --model $aug_species --utr false --options '${args}' --aug_conf ${aug_config} --hints $hints > commands.txt
+    augustus_from_chunks.pl --chunk_length $aug_chunk_length --genome_fai ${genome}.fai --model $aug_species --utr false --options '${args}' --aug_conf ${aug_config} --hints_index $hints > commands.txt
     parallel -j ${task.cpus} < commands.txt
     for i in \$(ls *.out | sort -n); do echo \$i >> files.txt ; done;
     joingenes -f files.txt -o ${augustus_result}
@@ -34,6 +36,7 @@ process AUGUSTUS_AUGUSTUSBATCH {
     cat <<-END_VERSIONS > versions.yml
     "${task.process}":
         augustus: \$(echo \$(augustus  | head -n1 | cut -f2 -d " " | sed "s/[)]//" | sed "s/[(]//" ))
+        tabix: \$(echo \$(tabix -h 2>&1) | sed 's/^.*Version: //; s/ .*\$//')
     END_VERSIONS
     """
 }
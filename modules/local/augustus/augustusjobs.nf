@@ -0,0 +1,38 @@
+process AUGUSTUS_AUGUSTUSJOBS {
+    tag "$meta.id - $jobs"
+    label 'process_high'
+    
+    conda (params.enable_conda ? "bioconda::augustus=3.4.0 bioconda::exonerate=2.4.0 bioconda::samtools=1.14 bioconda::htslib=1.14" : null)
+    container 'ikmb/esga:aug_1.3'
+
+    input:
+    tuple val(meta), path(genome), path(jobs)
+    tuple path(hints), path(hints_tbi)
+    env AUGUSTUS_CONFIG_PATH
+    path aug_config
+    val aug_chunk_length
+    val aug_species
+
+    output:
+    tuple val(meta), path("*_augustus_chunk.out"), emit: chunks
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    """
+    # Each chunk reads its hints with tabix
+    command -v tabix > /dev/null || { echo "ERROR: tabix was not found in the container" >&2; exit 1; }
+    cut -f2 $jobs | sort -u > scaffolds.txt
+    samtools faidx $genome
+    samtools faidx -r scaffolds.txt $genome > scaffolds.fa
+    fastaexplode -f scaffolds.fa -d .
+    augustus_from_chunks.pl --chunk_length $aug_chunk_length --jobs $jobs --model $aug_species --utr false --options '${args}' --aug_conf ${aug_config} --hints_index $hints > commands.txt
+    parallel -j ${task.cpus} < commands.txt
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        augustus: \$(echo \$(augustus  | head -n1 | cut -f2 -d " " | sed "s/[)]//" | sed "s/[(]//" ))
+        tabix: \$(echo \$(tabix -h 2>&1) | sed 's/^.*Version: //; s/ .*\$//')
+    END_VERSIONS
+    """
+}
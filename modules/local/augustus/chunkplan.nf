@@ -0,0 +1,34 @@
+process AUGUSTUS_CHUNKPLAN {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(genome)
+    val aug_chunk_length
+    val njobs
+
+    output:
+    tuple val(meta), path("augustus_jobs.*.tsv"), emit: jobs
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    """
+    augustus_chunk_plan.py \\
+        --fasta $genome \\
+        --chunk_length $aug_chunk_length \\
+        --jobs $njobs \\
+        --prefix augustus_jobs \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,28 @@
+process AUGUSTUS_HINTSINDEX {
+    label 'process_low'
+    
+    conda (params.enable_conda ? "bioconda::tabix=1.11" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/tabix:1.11--hdfd78af_0' :
+        'quay.io/biocontainers/tabix:1.11--hdfd78af_0' }"
+
+    input:
+    path(hints)
+
+    output:
+    tuple path(hints_gz), path("${hints_gz}.tbi"), emit: index
+    path "versions.yml"           , emit: versions
+
+    script:
+    hints_gz = hints.getBaseName() + ".sorted.gff.gz"
+
+    """
+    awk '!/^#/' $hints | sort -k1,1 -k4,4n -k5,5n | bgzip -c > $hints_gz
+    tabix -p gff $hints_gz
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        tabix: \$(echo \$(tabix -h 2>&1) | sed 's/^.*Version: //; s/ .*\$//')
+    END_VERSIONS
+    """
+}
@@ -1,26 +1,26 @@
-process AUGUSTUS_BAM2HINTS {
+process AUGUSTUS_JOINGENES {
     tag "$meta.id"
-    label 'process_long'
+    label 'process_low'
     
     conda (params.enable_conda ? "bioconda::augustus=3.4.0" : null)
     container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
-        'https://depot.galaxyproject.org/singularity/augustus:3.4.0--pl5321hd8b735c_3':
-        'quay.io/biocontainers/augustus:3.4.0--pl5321hd8b735c_3' }"
+        'https://depot.galaxyproject.org/singularity/augustus:3.4.0--pl5262h5a9fe7b_2':
+        'quay.io/biocontainers/augustus:3.4.0--pl5262h5a9fe7b_2' }"
 
     input:
-    tuple val(meta), path(bam)
-    val(priority)
+    tuple val(meta), path(chunks)
 
     output:
-    path("*.gff"), emit: gff
+    tuple val(meta), path(augustus_result), emit: gff
     path "versions.yml"           , emit: versions
 
     script:
-    def args = task.ext.args ?: ''
     def prefix = task.ext.prefix ?: "${meta.id}"
-    gff = prefix + ".hints.gff"
+    augustus_result = "augustus.${prefix}.out.gff"
+
     """
-    bam2hints --intronsonly 0 -p $priority -s 'E' --in=$bam --out=$gff
+    for i in \$(ls *_augustus_chunk.out | sort -n); do echo \$i >> files.txt ; done;
+    joingenes -f files.txt -o ${augustus_result}
 
     cat <<-END_VERSIONS > versions.yml
     "${task.process}":
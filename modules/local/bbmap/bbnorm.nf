@@ -0,0 +1,47 @@
+process BBMAP_BBNORM {
+    tag "$meta.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::bbmap=38.90" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/bbmap:38.90--he522d1c_1':
+        'quay.io/biocontainers/bbmap:38.90--he522d1c_1' }"
+
+    input:
+    tuple val(meta), path(reads)
+    val(target)
+
+    output:
+    tuple val(meta), path("*_norm.fastq.gz"), emit: reads
+    path("*.bbnorm.log")                    , emit: log
+    path "versions.yml"                     , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    // k-mer counts are kept in a sketch sized to the heap, so memory use is fixed
+    def avail_mem = task.memory ? "-Xmx${task.memory.toGiga() - 1}g" : ''
+    left = file(reads[0]).getBaseName() + "_norm.fastq.gz"
+    if (meta.single_end) {
+       input = "in=${reads[0]}"
+       output = "out=${left}"
+    } else {
+       right = file(reads[1]).getBaseName() + "_norm.fastq.gz"
+       input = "in=${reads[0]} in2=${reads[1]}"
+       output = "out=${left} out2=${right}"
+    }
+    """
+    bbnorm.sh \\
+       $avail_mem \\
+       $input \\
+       $output \\
+       target=$target \\
+       threads=${task.cpus} \\
+       $args &> ${prefix}.bbnorm.log
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        bbmap: \$(bbversion.sh)
+    END_VERSIONS
+    """
+}
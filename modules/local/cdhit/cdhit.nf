@@ -0,0 +1,42 @@
+process CDHIT {
+    tag "$meta.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::cd-hit=4.8.1" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/cd-hit:4.8.1--h5b5514e_7':
+        'quay.io/biocontainers/cd-hit:4.8.1--h5b5514e_7' }"
+
+    input:
+    tuple val(meta), path(fasta)
+    val(identity)
+
+    output:
+    tuple val(meta), path(representatives), emit: fasta
+    path(clusters)                         , emit: clusters
+    path "versions.yml"                    , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    representatives = prefix + ".nr${identity}.fa"
+    clusters = representatives + ".clstr"
+    // cd-hit requires shorter words for lower identity thresholds
+    def word_size = identity >= 70 ? 5 : identity >= 60 ? 4 : identity >= 50 ? 3 : 2
+    """
+    cd-hit \\
+        -i $fasta \\
+        -o $representatives \\
+        -c ${identity / 100} \\
+        -n $word_size \\
+        -d 0 \\
+        -T ${task.cpus} \\
+        -M ${task.memory.toMega()} \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        cd-hit: \$(cd-hit -h | head -n 1 | sed 's/^.*CD-HIT version //; s/ .*\$//')
+    END_VERSIONS
+    """
+}
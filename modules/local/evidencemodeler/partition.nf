@@ -13,6 +13,8 @@ process EVIDENCEMODELER_PARTITION {
     path(proteins)
     path(transcripts)
     path(weights)
+    val(segment_size)
+    val(overlap_size)
 
     output:
     tuple val(meta), path(partitions), emit: partitions
@@ -36,7 +38,7 @@ process EVIDENCEMODELER_PARTITION {
     """
     /usr/local/opt/evidencemodeler-1.1.1/EvmUtils/partition_EVM_inputs.pl --genome $genome \
        --gene_predictions $genes \
-       --segmentSize 2000000 --overlapSize 200000 --partition_listing $partitions \
+       --segmentSize $segment_size --overlapSize $overlap_size --partition_listing $partitions \
        $protein_options $transcript_options
 
     /usr/local/opt/evidencemodeler-1.1.1/EvmUtils/write_EVM_commands.pl --genome $genome \
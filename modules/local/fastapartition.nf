@@ -0,0 +1,41 @@
+process FASTAPARTITION {
+    tag "$meta.id - $fasta"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(fasta)
+    path(hints) // hints to weight the workload of each sequence, may be empty
+    val(nparts) // number of balanced parts to produce
+
+    output:
+    tuple val(meta), path("*.part-*.fa"), emit: chunks
+    tuple val(meta), path(manifest), emit: manifest
+    tuple val(meta), path(digests), emit: digests
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    manifest = prefix + ".partitions.tsv"
+    digests = prefix + ".digests.txt"
+    """
+    partition_assembly.py \\
+        --fasta $fasta \\
+        --hints $hints \\
+        --parts $nparts \\
+        --prefix $prefix \\
+        --manifest $manifest \\
+        $args
+    sha256sum ${prefix}.part-*.fa > $digests
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -13,13 +13,16 @@ process FASTASPLITTER {
 
     output:
     tuple val(meta), path("*.part-*.*"), emit: chunks
+    tuple val(meta), path(digests), emit: digests
     path "versions.yml"           , emit: versions
 
     script:
     def args = task.ext.args ?: ''
     def prefix = task.ext.prefix ?: "${meta.id}"
+    digests = prefix + ".digests.txt"
     """
        fasta-splitter.pl -part-sequence-size $fsize $fasta
+       sha256sum *.part-*.* > $digests
 
     cat <<-END_VERSIONS > versions.yml
     "${task.process}":
@@ -0,0 +1,38 @@
+process HELPER_BAMCLUSTERS {
+    tag "$meta.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::pysam=0.19.1" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/pysam:0.19.1--py39h5030a8b_0' :
+        'quay.io/biocontainers/pysam:0.19.1--py39h5030a8b_0' }"
+
+    input:
+    tuple val(meta), path(bam)
+    val(nparts)
+    val(max_intron_size)
+
+    output:
+    tuple val(meta), path(bam), path(bai), path("*.clusters.*.bed"), emit: regions
+    path "versions.yml"                                            , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    bai = bam.getName() + ".bai"
+    """
+    bam_clusters.py \\
+        --bam $bam \\
+        --parts $nparts \\
+        --max_gap $max_intron_size \\
+        --prefix ${prefix}.clusters \\
+        --threads ${task.cpus} \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+        pysam: \$(python -c "import pysam; print(pysam.__version__)")
+    END_VERSIONS
+    """
+}
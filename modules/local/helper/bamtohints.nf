@@ -0,0 +1,39 @@
+process HELPER_BAMTOHINTS {
+    tag "$meta.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::pysam=0.19.1" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/pysam:0.19.1--py39h5030a8b_0' :
+        'quay.io/biocontainers/pysam:0.19.1--py39h5030a8b_0' }"
+
+    input:
+    tuple val(meta), path(bams, stageAs: "bams/*")
+    val(priority)
+    val(wiggle_priority)
+
+    output:
+    path(gff)                     , emit: gff
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    gff = prefix + ".hints.gff"
+    """
+    bam_to_hints.py \\
+        --bam $bams \\
+        --out $gff \\
+        --priority $priority \\
+        --wiggle_priority $wiggle_priority \\
+        --max_intron $params.max_intron_size \\
+        --threads ${task.cpus} \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+        pysam: \$(python -c "import pysam; print(pysam.__version__)")
+    END_VERSIONS
+    """
+}
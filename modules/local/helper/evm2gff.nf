@@ -2,10 +2,10 @@ process HELPER_EVM2GFF {
     tag "$meta.id"
     label 'process_low'
     
-    conda (params.enable_conda ? "bioconda::perl-bioperl=1.7.8" : null)
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
     container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
-        'https://depot.galaxyproject.org/singularity/perl-bioperl:1.7.2--pl526_11':
-        'quay.io/biocontainers/perl-bioperl:1.7.2--pl526_11' }"
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
 
     input:
     tuple val(meta), path(partitions)
@@ -19,7 +19,7 @@ process HELPER_EVM2GFF {
     def prefix = task.ext.prefix ?: "${meta.id}"
     def gff = prefix + ".evm.gff3"
     """
-    merge_evm_gff.pl --partitions $partitions --gff $gff
+    merge_evm_gff.py --partitions $partitions --gff $gff --threads ${task.cpus} $args
 
     cat <<-END_VERSIONS > versions.yml
     "${task.process}":
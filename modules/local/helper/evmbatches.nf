@@ -0,0 +1,37 @@
+process HELPER_EVMBATCHES {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(commands), path(genome)
+    path(genes)
+    path(proteins)
+    path(transcripts)
+    val(per_batch)
+
+    output:
+    tuple val(meta), path("evm_batch.*.list"), emit: batches
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    """
+    evm_batch_commands.py \\
+        --commands $commands \\
+        --genome $genome \\
+        --gff $genes $proteins $transcripts \\
+        --per_batch $per_batch \\
+        --prefix evm_batch \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,30 @@
+process HELPER_FASTADIGEST {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(fasta)
+
+    output:
+    tuple val(meta), env(DIGEST), emit: digest
+    tuple val(meta), path(sequences), emit: sequences
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    sequences = prefix + ".sequences.tsv"
+    """
+    DIGEST=\$(fasta_digest.py --fasta $fasta --sequences $sequences $args)
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
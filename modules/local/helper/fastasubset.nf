@@ -0,0 +1,33 @@
+process HELPER_FASTASUBSET {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(fasta), path(names)
+
+    output:
+    tuple val(meta), path(subset_fasta), emit: fasta
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    subset_fasta = prefix + ".subset.fa"
+    """
+    splice_annotation.py -l INFO subset \\
+        --fasta $fasta \\
+        --names $names \\
+        --output $subset_fasta \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
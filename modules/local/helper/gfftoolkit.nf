@@ -0,0 +1,35 @@
+process HELPER_GFFTOOLKIT {
+    tag "$meta.id"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(gff), path(fasta)
+
+    output:
+    tuple val(meta), path("*.stable_id.gff")  , optional: true, emit: gff
+    tuple val(meta), path("*.proteins.fasta") , optional: true, emit: proteins
+    tuple val(meta), path("*.cdna.fasta")     , optional: true, emit: cdna
+    tuple val(meta), path("*.cds.fasta")      , optional: true, emit: cds
+    tuple val(meta), path("*.training.gff3")  , optional: true, emit: training
+    tuple val(meta), path("*.gmod.gff3")      , optional: true, emit: track
+    path "versions.yml"                       , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: gff.getBaseName()
+    def genome = fasta ? "--genome $fasta" : ''
+    """
+    gff_toolkit.py --gff $gff $genome --prefix $prefix $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        helper: ${workflow.manifest.version}
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
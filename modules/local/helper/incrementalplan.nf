@@ -0,0 +1,37 @@
+process HELPER_INCREMENTALPLAN {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(manifest)
+    path(previous_manifest, stageAs: "previous/*")
+
+    output:
+    tuple val(meta), path(changed), emit: changed
+    tuple val(meta), path(unchanged), emit: unchanged
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta.id}"
+    changed = prefix + ".changed.txt"
+    unchanged = prefix + ".unchanged.txt"
+    """
+    splice_annotation.py -l INFO plan \\
+        --current $manifest \\
+        --previous $previous_manifest \\
+        --changed $changed \\
+        --unchanged $unchanged \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
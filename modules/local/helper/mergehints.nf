@@ -0,0 +1,30 @@
+process HELPER_MERGEHINTS {
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    path(hints, stageAs: "hints/hints_*.gff")
+
+    output:
+    path(merged_hints), emit: gff
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    merged_hints = "hints.gff"
+    """
+    merge_hints.py \\
+        --output $merged_hints \\
+        $args \\
+        $hints
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,38 @@
+process HELPER_REPEATSOFTMASK {
+    tag "$meta.id"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(fasta), path(windows), path(rm_out)
+
+    output:
+    tuple val(meta), path(masked), emit: fasta
+    tuple val(meta), path(gff)   , emit: gff
+    path "versions.yml"          , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ? "${meta.id}.${task.ext.prefix}" : "${meta.id}.masked"
+    masked = prefix + ".fasta"
+    gff = prefix + ".gff"
+    """
+    repeat_windows.py -l INFO mask \\
+        --fasta $fasta \\
+        --windows $windows \\
+        --out $rm_out \\
+        --output $masked \\
+        --gff $gff \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        helper: ${workflow.manifest.version}
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,38 @@
+process HELPER_REPEATWINDOWS {
+    tag "$meta.id"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(fasta)
+    val(window)
+
+    output:
+    tuple val(meta), path("${meta.id}.*.fa"), emit: chunks
+    tuple val(meta), path(windows)          , emit: windows
+    tuple val(meta), path(digests)          , emit: digests
+    path "versions.yml"                     , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    windows = "${meta.id}.windows.tsv"
+    digests = "${meta.id}.digests.txt"
+    """
+    repeat_windows.py -l INFO split \\
+        --fasta $fasta \\
+        --window $window \\
+        --prefix ${meta.id} \\
+        $args
+    sha256sum ${meta.id}.*.fa > $digests
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        helper: ${workflow.manifest.version}
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
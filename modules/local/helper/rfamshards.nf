@@ -0,0 +1,34 @@
+process HELPER_RFAMSHARDS {
+    tag "$cm"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    path(cm)
+    val(shards)
+
+    output:
+    path("rfam.*.cm")   , emit: shards
+    path "versions.yml" , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    """
+    rfam_shards.py \\
+        --cm $cm \\
+        --shards $shards \\
+        --prefix rfam \\
+        -l INFO \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        helper: ${workflow.manifest.version}
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
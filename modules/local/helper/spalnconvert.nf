@@ -0,0 +1,35 @@
+process HELPER_SPALNCONVERT {
+    tag "$meta_p.id | shard $shard"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta_p), val(shard), path(gffs, stageAs: "chunks/*")
+    val(priority)
+    val(max_intron_size)
+
+    output:
+    tuple val(meta_p), path("shard_*"), emit: shard
+    path "versions.yml"              , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = "shard_" + String.format("%04d", shard)
+    """
+    spaln_convert.py \\
+        --prefix $prefix \\
+        --priority $priority \\
+        --max_intron $max_intron_size \\
+        $args \\
+        chunks/*
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,42 @@
+process HELPER_SPALNGATHER {
+    tag "$meta_p.id"
+    label 'process_low'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    val(meta)
+    tuple val(meta_p), path(shards, stageAs: "shards/*")
+    val(similarity)
+
+    output:
+    tuple val(meta), path(spaln_final), emit: gff
+    tuple val(meta), path(spaln_evm)  , emit: evm
+    path(spaln_track)                 , emit: gmod
+    path(hints)                       , emit: hints
+    path "versions.yml"               , emit: versions
+
+    script:
+    def base = meta_p.id + "-" + meta.id + ".${similarity}.spaln_merged"
+    spaln_final = base + ".gff"
+    spaln_evm = base + ".spaln.gff3"
+    spaln_track = base + ".gmod.gff3"
+    hints = base + ".hints.gff3"
+    """
+    # Without any shard (e.g. no protein passed the seed prefilter) the results are written empty
+    mkdir -p shards
+    echo "##gff-version 3" > $spaln_final
+    find shards/ -name '*.spaln.gff' | sort | xargs -r cat >> $spaln_final
+    find shards/ -name '*.evm.gff3' | sort | xargs -r cat > $spaln_evm
+    find shards/ -name '*.gmod.gff3' | sort | xargs -r cat > $spaln_track
+    find shards/ -name '*.hints.gff' | sort | xargs -r cat > $hints
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,38 @@
+process HELPER_SPALNWINDOWS {
+    tag "$meta_p.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(genome)
+    tuple val(meta_p), path(proteins), path(paf)
+    val(batch_size)
+    val(flank)
+
+    output:
+    tuple val(meta_p), path("*.windows.*", type: 'dir'), optional: true, emit: batches
+    path "versions.yml"                                                , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta_p.id}"
+    """
+    spaln_windows.py \\
+        --genome $genome \\
+        --proteins $proteins \\
+        --paf $paf \\
+        --batch_size $batch_size \\
+        --flank $flank \\
+        --prefix ${prefix}.windows \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,35 @@
+process HELPER_SPLICEGFF {
+    tag "$meta.id"
+    label 'process_low'
+    
+    conda (params.enable_conda ? "conda-forge::python=3.9.5" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/python:3.9--1' :
+        'quay.io/biocontainers/python:3.9--1' }"
+
+    input:
+    tuple val(meta), path(current, stageAs: "current/*"), path(unchanged), path(manifest)
+    path(previous, stageAs: "previous/*")
+
+    output:
+    tuple val(meta), path(spliced), emit: gff
+    path "versions.yml"           , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    spliced = current.getName()
+    """
+    splice_annotation.py -l INFO gff \\
+        --current $current \\
+        --previous $previous \\
+        --unchanged $unchanged \\
+        --manifest $manifest \\
+        --output $spliced \\
+        $args
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        python: \$(python --version | sed 's/Python //g')
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,40 @@
+process INFERNAL_SHARDSEARCH {
+    tag "$meta.id"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::infernal=1.1.4" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/infernal:1.1.4--h779adbc_0':
+        'quay.io/biocontainers/infernal:1.1.4--h779adbc_0' }"
+
+    input:
+    tuple val(meta), path(fasta), path(cm)
+
+    output:
+    tuple val(meta), path(rfam_tbl), emit: tbl
+    path "versions.yml"            , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def args2 = task.ext.args2 ?: ''
+    rfam_tbl = fasta.getBaseName() + "." + cm.getBaseName() + ".rfam.tbl"
+    rfam_txt = fasta.getBaseName() + "." + cm.getBaseName() + ".rfam.out"
+    // Only the families whose filter HMM has a hit in this part are searched with their CM
+    """
+    cmsearch --hmmonly --noali --cpu ${task.cpus} -E 1000 --tblout prefilter.tblout -o /dev/null $args2 $cm $fasta
+    grep -v '^#' prefilter.tblout | awk '{ print \$3 }' | sort -u > families.txt
+
+    if [ -s families.txt ]; then
+        cmfetch --index $cm
+        cmfetch -f $cm families.txt > families.cm
+        cmsearch --rfam --cpu ${task.cpus} --cut_tc --tblout $rfam_tbl -o $rfam_txt $args families.cm $fasta
+    else
+        touch $rfam_tbl
+    fi
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        cmsearch: \$(echo \$(cmsearch -h) | head -n2 | tail -n1  | cut -f3 -d " " ))
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,31 @@
+process MINIPROT_ALIGN {
+    tag "$meta.id | $meta_p.id"
+    label 'process_high'
+
+    conda (params.enable_conda ? "bioconda::miniprot=0.7" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/miniprot:0.7--h7132678_0':
+        'quay.io/biocontainers/miniprot:0.7--h7132678_0' }"
+
+    input:
+    tuple val(meta), path(genome)
+    tuple val(meta_p), path(proteins)
+    val(max_intron_size)
+
+    output:
+    tuple val(meta_p), path(paf), emit: paf
+    path "versions.yml"          , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def prefix = task.ext.prefix ?: "${meta_p.id}"
+    paf = prefix + ".seeds.paf"
+    """
+    miniprot -t ${task.cpus} -G $max_intron_size $args $genome $proteins > $paf
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        miniprot: \$(miniprot --version)
+    END_VERSIONS
+    """
+}
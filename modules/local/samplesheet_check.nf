@@ -11,11 +11,14 @@ process SAMPLESHEET_CHECK {
 
     output:
     path 'samplesheet.valid.csv'       , emit: csv
+    path 'samplesheet.stats.tsv'       , emit: stats, optional: true
     path "versions.yml", emit: versions
 
     script: // This script is bundled with the pipeline, in nf-core/rnaseq/bin/
+    def args = task.ext.args ?: ''
     """
     check_samplesheet.py \\
+        $args \\
         $samplesheet \\
         samplesheet.valid.csv
 
@@ -9,13 +9,14 @@ process SPALN_ALIGN {
 
     input:
     tuple val(meta), path(spaln_index)
-    tuple val(meta_p), path(proteins)
+    tuple val(meta_p), path(proteins), val(nshards)
     val spaln_q
     val spaln_taxon
     val spaln_options
+    val(similarity)
 
     output:
-    tuple val(meta_p),path("${chunk_name}.*rd"), emit: align
+    tuple val(meta_p), path("${chunk_name}.spaln.*.gff"), emit: gff
     path "versions.yml"           , emit: versions
 
     script:
@@ -26,6 +27,24 @@ process SPALN_ALIGN {
     """
     spaln -o $chunk_name -Q${spaln_q} -T${spaln_taxon} ${spaln_options} -O12 -t${task.cpus} -Dgenome_spaln $proteins
 
+    # Filter by identity here rather than after all chunks are gathered; prefix identifiers to keep them unique
+    # across chunks and write the alignments of each shard of sequences to a file of its own
+    touch ${chunk_name}.spaln.1.gff
+    sortgrcd -I${similarity} -O0 -n0 ${chunk_name}.grd | awk -F'\\t' -v OFS='\\t' -v chunk=${chunk_name} -v nshards=${nshards} '
+       BEGIN { for (i = 1; i < 256; i++) ord[sprintf("%c", i)] = i }
+       /^#/ { next }
+       {
+          gsub(/ID=/, "ID=" chunk ".", \$9); gsub(/Parent=/, "Parent=" chunk ".", \$9)
+          # Split by sequence with a hash of its name that every alignment job computes alike
+          if (!(\$1 in shard)) {
+             h = 0
+             for (i = 1; i <= length(\$1); i++) h = (h * 31 + ord[substr(\$1, i, 1)]) % 2147483647
+             shard[\$1] = h % nshards + 1
+          }
+          print > (chunk ".spaln." shard[\$1] ".gff")
+       }
+    '
+
     cat <<-END_VERSIONS > versions.yml
     "${task.process}":
         spaln: \$(echo \$( spaln 2>&1 | head -n3 | tail -n1 | cut -f4 -d " " ))
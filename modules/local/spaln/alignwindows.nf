@@ -0,0 +1,58 @@
+process SPALN_ALIGNWINDOWS {
+    tag "$meta_p.id | ${batch.getName()}"
+    label 'process_low'
+
+    conda (params.enable_conda ? "bioconda::spaln=2.4.7" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/spaln:2.4.7--pl5321h9a82719_1':
+        'quay.io/biocontainers/spaln:2.4.7--pl5321h9a82719_1' }"
+
+    input:
+    tuple val(meta_p), path(batch), val(nshards)
+    val spaln_q
+    val spaln_taxon
+    val spaln_options
+    val(similarity)
+
+    output:
+    tuple val(meta_p), path("${chunk_name}.spaln.*.gff"), emit: gff
+    path "versions.yml"                                , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    chunk_name = batch.getName()
+    """
+    # Align each group of proteins only against the candidate windows of its loci instead of the whole genome.
+    # Move alignments from window to genome coordinates; prefix identifiers to keep them unique across groups
+    # and append the alignments of each shard of sequences to a file of its own, as SPALN_ALIGN does
+    touch ${chunk_name}.spaln.1.gff
+    for group in $batch/*/; do
+        name=\$(basename \$group)
+        cp \$group/windows.fa windows_\$name.fa
+        spaln -W -KP -t${task.cpus} windows_\$name.fa
+        spaln -o group_\$name -Q${spaln_q} -T${spaln_taxon} ${spaln_options} -O12 -t${task.cpus} -Dwindows_\$name $args \$group/proteins.fa
+        sortgrcd -I${similarity} -O0 -n0 group_\$name.grd > group_\$name.gff
+
+        awk -F'\\t' -v OFS='\\t' -v chunk=${chunk_name} -v group=${chunk_name}.\$name -v nshards=${nshards} '
+           BEGIN { for (i = 1; i < 256; i++) ord[sprintf("%c", i)] = i }
+           NR == FNR { sequence[\$1] = \$2; offset[\$1] = \$3; next }
+           /^#/ { next }
+           (\$1 in sequence) {
+              \$4 += offset[\$1]; \$5 += offset[\$1]; \$1 = sequence[\$1]
+              gsub(/ID=/, "ID=" group ".", \$9); gsub(/Parent=/, "Parent=" group ".", \$9)
+              if (!(\$1 in shard)) {
+                 h = 0
+                 for (i = 1; i <= length(\$1); i++) h = (h * 31 + ord[substr(\$1, i, 1)]) % 2147483647
+                 shard[\$1] = h % nshards + 1
+              }
+              print >> (chunk ".spaln." shard[\$1] ".gff")
+           }
+        ' \$group/windows.tsv group_\$name.gff
+    done
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        spaln: \$(echo \$( spaln 2>&1 | head -n3 | tail -n1 | cut -f4 -d " " ))
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,57 @@
+process STAR_ALIGNBATCH {
+    tag "$meta.id"
+    label 'process_high'
+
+    conda (params.enable_conda ? "bioconda::star=2.6.1d" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/mulled-v2-1fa26d1ce03c295fe2fdcf85831a92fbcbd7e8c2:59cdd445419f14abac76b31dd0d71217994cbcc9-0' :
+        'quay.io/biocontainers/mulled-v2-1fa26d1ce03c295fe2fdcf85831a92fbcbd7e8c2:59cdd445419f14abac76b31dd0d71217994cbcc9-0' }"
+
+    input:
+    tuple val(meta_g), path(star_index)
+    tuple val(meta), path(reads, stageAs: "reads*/*")
+
+    output:
+    tuple val(meta), path('*.bam'), emit: bam
+    path "versions.yml"           , emit: versions
+    path '*.wig'                  , emit: wiggle, optional: true
+
+    script:
+    def args = task.ext.args ?: ''
+    // Sorting into BAM with the index in shared memory needs an explicit sort buffer
+    def options = "--outFilterType BySJout --outFilterMultimapNmax 5 --outSAMstrandField intronMotif --outSAMtype BAM SortedByCoordinate --limitBAMsortRAM ${task.memory.toBytes()/4} --outWigType wiggle"
+    // Samples of the batch are staged one after the other, each with its own number of files
+    def files = [ reads ].flatten()
+    def offset = 0
+    def commands = meta.samples.collect { s ->
+       def sample_reads = files[offset..<(offset + s.nfiles)].join(' ')
+       offset += s.nfiles
+       s.meta.ref = meta_g.id
+       def command = """
+    STAR --runThreadN ${task.cpus} \\
+       --genomeDir $star_index \\
+       --genomeLoad \$GENOME_LOAD \\
+       --readFilesCommand zcat \\
+       --readFilesIn $sample_reads \\
+       --alignIntronMin 20 \\
+       --alignIntronMax $params.max_intron_size \\
+       --outFileNamePrefix ${s.prefix}. \\
+       $options $args
+"""
+       command + "    mv ${s.prefix}.Aligned.sortedByCoord.out.bam ${s.prefix}.with_juncs.aligned.bam\n"
+    }.join('')
+    """
+    # Load the index into shared memory once for all samples of the batch; fall back to
+    # loading it per sample where shared memory is not available
+    GENOME_LOAD=LoadAndKeep
+    STAR --genomeDir $star_index --genomeLoad LoadAndExit --outFileNamePrefix load. || GENOME_LOAD=NoSharedMemory
+    if [ "\$GENOME_LOAD" = "LoadAndKeep" ]; then
+       trap 'STAR --genomeDir $star_index --genomeLoad Remove --outFileNamePrefix remove. || true' EXIT
+    fi
+    $commands
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        star: \$(echo \$(STAR --version) )
+    END_VERSIONS
+    """
+}
@@ -0,0 +1,46 @@
+process TRINITY_GENOMEGUIDEDREGIONS {
+    tag "${regions.getBaseName()}"
+    label 'process_medium'
+
+    conda (params.enable_conda ? "bioconda::trinity=2.13.2" : null)
+    container "${ workflow.containerEngine == 'singularity' && !task.ext.singularity_pull_docker_container ?
+        'https://depot.galaxyproject.org/singularity/trinity:2.13.2--h00214ad_1':
+        'quay.io/biocontainers/trinity:2.13.2--h00214ad_1' }"
+
+    input:
+    tuple val(meta), path(bam), path(bai), path(regions)
+    val(max_intron_size)
+
+    output:
+    tuple val(meta), path(fasta), emit: fasta
+    path "versions.yml"          , emit: versions
+
+    script:
+    def args = task.ext.args ?: ''
+    def part = regions.getBaseName()
+    def number = part.tokenize('.').last()
+    fasta = part + ".Trinity-GG.fasta"
+    trinity_option = ( meta.strandedness == "unstranded" ) ? "" : "--SS_lib_type RF"
+    """
+    samtools view -@ ${task.cpus} -b -M -L $regions -o region.bam $bam
+
+    Trinity --genome_guided_bam region.bam \
+       --genome_guided_max_intron ${max_intron_size} \
+       --CPU ${task.cpus} \
+       --max_memory ${task.memory.toGiga()-1}G \
+       --output transcriptome_trinity \
+       $trinity_option $args
+
+    # Trinity numbers its clusters per run; keep transcript names unique across parts
+    if [ -f transcriptome_trinity/Trinity-GG.fasta ]; then
+       sed "s/^>TRINITY_GG_/>TRINITY_GG_p${number}_/" transcriptome_trinity/Trinity-GG.fasta > $fasta
+    else
+       touch $fasta
+    fi
+
+    cat <<-END_VERSIONS > versions.yml
+    "${task.process}":
+        trinity: \$(echo \$(Trinity --version ) | grep "Trinity version" | cut -f3 -d" " | sed "s/Trinity-//" )
+    END_VERSIONS
+    """
+}
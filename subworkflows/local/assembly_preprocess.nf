@@ -5,6 +5,8 @@
 include { GAAS_FASTACLEANER } from '../../modules/local/gaas/fastacleaner'
 include { GAAS_FASTASTATISTICS } from '../../modules/local/gaas/fastastatistics'
 include { GAAS_FASTAFILTERBYSIZE as GAAS_ASSEMBLYFILTERBYSIZE } from '../../modules/local/gaas/fastafilterbysize'
+include { HELPER_FASTADIGEST } from '../../modules/local/helper/fastadigest'
+include { HELPER_FASTADIGEST as ASSEMBLY_MANIFEST } from '../../modules/local/helper/fastadigest'
 
 workflow ASSEMBLY_PREPROCESS {
     take:
@@ -19,8 +21,32 @@ workflow ASSEMBLY_PREPROCESS {
     GAAS_FASTACLEANER(GAAS_ASSEMBLYFILTERBYSIZE.out.fasta)
     GAAS_FASTASTATISTICS(GAAS_FASTACLEANER.out.fasta)
 
+    ch_fasta = GAAS_FASTACLEANER.out.fasta
+
+    //
+    // MODULE: Digest the input assembly to key cached results of expensive steps
+    //
+    if (params.cache_dir) {
+       HELPER_FASTADIGEST(
+          create_genome_channel(genome)
+       )
+       ch_fasta = ch_fasta.join(HELPER_FASTADIGEST.out.digest).map { m, fasta, digest ->
+          def meta = m.clone()
+          meta.digest = digest
+          tuple(meta, fasta)
+       }
+    }
+
+    //
+    // MODULE: List the digest of each sequence, to find changed sequences in later runs
+    //
+    ASSEMBLY_MANIFEST(
+       ch_fasta
+    )
+
     emit:
-    fasta = GAAS_FASTACLEANER.out.fasta
+    fasta = ch_fasta
+    manifest = ASSEMBLY_MANIFEST.out.sequences
     stats = GAAS_FASTASTATISTICS.out.stats
     versions = GAAS_ASSEMBLYFILTERBYSIZE.out.versions
 }
@@ -0,0 +1,50 @@
+//
+// Split the assembly into parts for parallel processing
+//
+
+include { FASTASPLITTER } from '../../modules/local/fastasplitter'
+include { FASTAPARTITION } from '../../modules/local/fastapartition'
+
+workflow ASSEMBLY_SPLIT {
+    take:
+    genome // tuple: [ meta, fasta ]
+    hints  // file: hints in GFF format to weight the partitioning, may be empty
+
+    main:
+
+    ch_manifest = Channel.empty()
+
+    //
+    // MODULE: Balance the parts by estimated workload, or split by sequence size
+    //
+    if (params.npart) {
+       FASTAPARTITION(
+          genome,
+          hints,
+          params.npart
+       )
+       ch_chunks = FASTAPARTITION.out.chunks
+       ch_manifest = FASTAPARTITION.out.manifest
+       ch_digests = FASTAPARTITION.out.digests
+       ch_versions = FASTAPARTITION.out.versions
+    } else {
+       FASTASPLITTER(
+          genome,
+          params.npart_size
+       )
+       ch_chunks = FASTASPLITTER.out.chunks
+       ch_digests = FASTASPLITTER.out.digests
+       ch_versions = FASTASPLITTER.out.versions
+    }
+
+    // map list of fasta chunks to meta<->fasta pairs
+    ch_chunks.flatMap { meta, chunks ->
+       [ chunks ].flatten().collect { [ meta.clone(), it ] }
+    }.set { genome_chunks }
+
+    emit:
+    chunks = genome_chunks // channel: [ val(meta), path(fasta) ], one per part
+    manifest = ch_manifest // channel: [ val(meta), path(tsv) ], part, file, length, masked fraction, hints and cost of each sequence; only with --npart
+    digests = ch_digests   // channel: [ val(meta), path(txt) ], sha256sum of the parts
+    versions = ch_versions
+}
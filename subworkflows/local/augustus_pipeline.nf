@@ -2,11 +2,14 @@
 // Clean and filter assembly
 //
 
-include { FASTASPLITTER } from '../../modules/local/fastasplitter'
+include { ASSEMBLY_SPLIT } from './assembly_split'
 include { AUGUSTUS_AUGUSTUSBATCH } from '../../modules/local/augustus/augustusbatch'
+include { AUGUSTUS_HINTSINDEX } from '../../modules/local/augustus/hintsindex'
+include { AUGUSTUS_CHUNKPLAN } from '../../modules/local/augustus/chunkplan'
+include { AUGUSTUS_AUGUSTUSJOBS } from '../../modules/local/augustus/augustusjobs'
+include { AUGUSTUS_JOINGENES } from '../../modules/local/augustus/joingenes'
 include { AUGUSTUS_FIXJOINGENES } from '../../modules/local/augustus/fixjoingenes'
-include { HELPER_CREATEGFFIDS as AUGUSTUS_CREATEGFFIDS } from '../../modules/local/helper/creategffids'
-include { GFFREAD as AUGUSTUS_GFF2PROTEINS } from '../../modules/local/gffread'
+include { HELPER_GFFTOOLKIT as AUGUSTUS_GFFTOOLKIT } from '../../modules/local/helper/gfftoolkit'
 include { CAT_GFF as AUGUSTUS_MERGE_CHUNKS } from '../../modules/local/cat/gff'
 
 workflow AUGUSTUS_PIPELINE {
@@ -18,20 +21,61 @@ workflow AUGUSTUS_PIPELINE {
 
     main:
 
-    FASTASPLITTER(
-       genome,
-       params.npart_size
-    )           
-    AUGUSTUS_AUGUSTUSBATCH(
-       FASTASPLITTER.out.chunks,
-       hints.collect(),
-       aug_config_folder.collect().map{ it[0].toString() },
-       aug_extrinsic_cfg.collect(),
-       params.aug_chunk_length,
-       params.aug_species
+    // Sort and index the hints once, so each chunk only reads the hints of its own region
+    AUGUSTUS_HINTSINDEX(
+       hints.collect()
     )
+    ch_hints_index = AUGUSTUS_HINTSINDEX.out.index.collect()
+
+    if (params.aug_njobs) {
+       // Plan the chunks of the whole genome once and share them evenly across jobs
+       AUGUSTUS_CHUNKPLAN(
+          genome,
+          params.aug_chunk_length,
+          params.aug_njobs
+       )
+       AUGUSTUS_CHUNKPLAN.out.jobs.flatMap { m, jobs ->
+          [ jobs ].flatten().collect { [ m, it ] }
+       }.set { ch_jobs }
+
+       AUGUSTUS_AUGUSTUSJOBS(
+          genome.combine(ch_jobs, by: 0),
+          ch_hints_index,
+          aug_config_folder.collect().map{ it[0].toString() },
+          aug_extrinsic_cfg.collect(),
+          params.aug_chunk_length,
+          params.aug_species
+       )
+       AUGUSTUS_AUGUSTUSJOBS.out.chunks.flatMap { m, chunks ->
+          [ chunks ].flatten().collect { [ m, it ] }
+       }
+       .groupTuple()
+       .set { ch_aug_chunks }
+
+       AUGUSTUS_JOINGENES(
+          ch_aug_chunks
+       )
+       ch_aug_gff = AUGUSTUS_JOINGENES.out.gff
+       ch_versions = AUGUSTUS_CHUNKPLAN.out.versions
+    } else {
+       ASSEMBLY_SPLIT(
+          genome,
+          hints.collect()
+       )
+       AUGUSTUS_AUGUSTUSBATCH(
+          ASSEMBLY_SPLIT.out.chunks,
+          ch_hints_index,
+          aug_config_folder.collect().map{ it[0].toString() },
+          aug_extrinsic_cfg.collect(),
+          params.aug_chunk_length,
+          params.aug_species
+       )
+       ch_aug_gff = AUGUSTUS_AUGUSTUSBATCH.out.gff
+       ch_versions = ASSEMBLY_SPLIT.out.versions
+    }
+
     AUGUSTUS_FIXJOINGENES(
-       AUGUSTUS_AUGUSTUSBATCH.out.gff
+       ch_aug_gff
     )
 
     AUGUSTUS_FIXJOINGENES.out.gff
@@ -50,15 +94,13 @@ workflow AUGUSTUS_PIPELINE {
     .map { k,m,f -> tuple(m,f) }
     .set { ch_genome_gff }
 
-    AUGUSTUS_CREATEGFFIDS(
-       ch_genome_gff
-    )    
-    AUGUSTUS_GFF2PROTEINS(
-       AUGUSTUS_CREATEGFFIDS.out.gff.join(genome)
+    // Assign stable IDs and extract the proteins from a single parse of the gene models
+    AUGUSTUS_GFFTOOLKIT(
+       ch_genome_gff.join(genome)
     )
 
     emit:
-    gff = AUGUSTUS_CREATEGFFIDS.out.gff
-    proteins = AUGUSTUS_GFF2PROTEINS.out.proteins
-    versions = FASTASPLITTER.out.versions
+    gff = AUGUSTUS_GFFTOOLKIT.out.gff
+    proteins = AUGUSTUS_GFFTOOLKIT.out.proteins
+    versions = ch_versions
 }
@@ -5,8 +5,9 @@
 include { EVIDENCEMODELER_MERGE } from '../../modules/local/evidencemodeler/merge'
 include { EVIDENCEMODELER_PARTITION } from '../../modules/local/evidencemodeler/partition'
 include { EVIDENCEMODELER_EXECUTE } from '../../modules/local/evidencemodeler/execute'
+include { HELPER_EVMBATCHES } from '../../modules/local/helper/evmbatches'
 include { HELPER_EVM2GFF } from '../../modules/local/helper/evm2gff'
-include { GFFREAD as EVIDENCEMODELER_GFF2PROTEINS } from '../../modules/local/gffread'
+include { HELPER_GFFTOOLKIT as EVIDENCEMODELER_GFF2PROTEINS } from '../../modules/local/helper/gfftoolkit'
 
 workflow EVM {
 
@@ -24,10 +25,24 @@ workflow EVM {
        genes_gff,
        proteins_gff,
        transcripts_gff,
-       params.evm_weights
+       params.evm_weights,
+       params.evm_segment_size,
+       params.evm_overlap_size
     )
+    // Pack the partition commands into batches of similar estimated runtime
+    HELPER_EVMBATCHES(
+       EVIDENCEMODELER_PARTITION.out.commands.join(genome),
+       genes_gff,
+       proteins_gff,
+       transcripts_gff,
+       params.nevm
+    )
+    HELPER_EVMBATCHES.out.batches.flatMap { m, batches ->
+       [ batches ].flatten().collect { [ m, it ] }
+    }.set { ch_evm_batches }
+
     EVIDENCEMODELER_EXECUTE(
-        EVIDENCEMODELER_PARTITION.out.commands.splitText(by: params.nevm, file: true)
+        ch_evm_batches
     )
     
     EVIDENCEMODELER_MERGE(
@@ -43,6 +58,7 @@ workflow EVM {
     )
        
     emit:
+    gff = HELPER_EVM2GFF.out.gff
     proteins = EVIDENCEMODELER_GFF2PROTEINS.out.proteins
     versions = EVIDENCEMODELER_PARTITION.out.versions
 
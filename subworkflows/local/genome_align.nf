@@ -2,7 +2,7 @@
 // Align genomes and map annotations
 //
 
-include { FASTASPLITTER } from '../../modules/local/fastasplitter'
+include { ASSEMBLY_SPLIT } from './assembly_split'
 include { SATSUMA2_SATSUMASYNTENY2 } from '../../modules/local/satsuma2/satsumasynteny2'
 include { KRAKEN } from '../../modules/local/kraken'
 include { HELPER_KRAKEN2GFF as SATSUMA_KRAKEN2GFF } from '../../modules/local/helper/kraken2gff'
@@ -53,14 +53,11 @@ workflow GENOME_ALIGN {
     // MODULE: Split fasta file into chunks
     //
 
-    FASTASPLITTER(
+    ASSEMBLY_SPLIT(
        genome,
-       params.npart_size
+       file(params.dummy_gff)
     )
-    // map list of fasta chunks to meta<->fasta pairs
-    FASTASPLITTER.out.chunks.flatMap{ row ->
-       row[1..-1].collect { [row[0].clone(), it]  }
-    }.set {genome_chunks}
+    genome_chunks = ASSEMBLY_SPLIT.out.chunks
 
     //
     // MODULE: Align two genome sequences
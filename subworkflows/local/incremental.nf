@@ -0,0 +1,51 @@
+//
+// Find the sequences that changed since a previous run
+//
+
+include { HELPER_INCREMENTALPLAN } from '../../modules/local/helper/incrementalplan'
+include { HELPER_FASTASUBSET } from '../../modules/local/helper/fastasubset'
+include { HELPER_FASTADIGEST as SUBSET_DIGEST } from '../../modules/local/helper/fastadigest'
+
+workflow INCREMENTAL {
+    take:
+    genome            // tuple: [ meta, fasta ]
+    manifest          // tuple: [ meta, sequence digests of this run ]
+    previous_manifest // file: sequence digests of the previous run
+
+    main:
+
+    HELPER_INCREMENTALPLAN(
+       manifest,
+       previous_manifest
+    )
+
+    //
+    // MODULE: Keep only new or changed sequences
+    //
+    HELPER_FASTASUBSET(
+       genome.join(HELPER_INCREMENTALPLAN.out.changed)
+    )
+    ch_fasta = HELPER_FASTASUBSET.out.fasta
+    ch_versions = HELPER_INCREMENTALPLAN.out.versions.mix(HELPER_FASTASUBSET.out.versions)
+
+    //
+    // MODULE: Digest the subset, so that cached results of the whole assembly are never served for it
+    //
+    if (params.cache_dir) {
+       SUBSET_DIGEST(
+          ch_fasta
+       )
+       ch_fasta = ch_fasta.join(SUBSET_DIGEST.out.digest).map { m, fasta, digest ->
+          def meta = m.clone()
+          meta.digest = digest
+          tuple(meta, fasta)
+       }
+       ch_versions = ch_versions.mix(SUBSET_DIGEST.out.versions)
+    }
+
+    emit:
+    fasta = ch_fasta // channel: [ val(meta), path(fasta) ], new or changed sequences, with a digest of their own
+    unchanged = HELPER_INCREMENTALPLAN.out.unchanged
+    manifest = manifest
+    versions = ch_versions
+}
@@ -1,6 +1,8 @@
 include { INFERNAL_PRESS } from '../../modules/local/infernal/press'
 include { INFERNAL_SEARCH } from '../../modules/local/infernal/search'
-include { FASTASPLITTER } from '../../modules/local/fastasplitter'
+include { INFERNAL_SHARDSEARCH } from '../../modules/local/infernal/shardsearch'
+include { HELPER_RFAMSHARDS } from '../../modules/local/helper/rfamshards'
+include { ASSEMBLY_SPLIT } from './assembly_split'
 include { HELPER_RFAMTOGFF } from '../../modules/local/helper/rfamtogff'
 include { GUNZIP as GUNZIP_RFAM_CM; GUNZIP as GUNZIP_RFAM_FAMILY } from '../../modules/nf-core/modules/gunzip/main'
 
@@ -12,29 +14,44 @@ workflow NCRNA {
    rfam_family_gz
 
    main:
-   FASTASPLITTER(
+   ASSEMBLY_SPLIT(
       genome,
-      params.npart_size
+      file(params.dummy_gff)
    )
 
-   GUNZIP_RFAM_CM(
-      create_file_channel(rfam_cm_gz)
-   )
-   
    GUNZIP_RFAM_FAMILY(
       create_file_channel(rfam_family_gz)
    )
 
-   INFERNAL_PRESS(
-      GUNZIP_RFAM_CM.out.gunzip.map {m,f -> f}
-   )
-  
-   INFERNAL_SEARCH(
-      FASTASPLITTER.out.chunks,
-      INFERNAL_PRESS.out.cm.collect()
-   )
+   //
+   // Search each part against shards of the Rfam families in parallel, or against all of Rfam at once
+   //
+   if (params.ncrna_shards) {
+      HELPER_RFAMSHARDS(
+         rfam_cm_gz,
+         params.ncrna_shards
+      )
+      INFERNAL_SHARDSEARCH(
+         ASSEMBLY_SPLIT.out.chunks.combine(HELPER_RFAMSHARDS.out.shards.flatten())
+      )
+      ch_tbl = INFERNAL_SHARDSEARCH.out.tbl
+   } else {
+      GUNZIP_RFAM_CM(
+         create_file_channel(rfam_cm_gz)
+      )
+
+      INFERNAL_PRESS(
+         GUNZIP_RFAM_CM.out.gunzip.map {m,f -> f}
+      )
+
+      INFERNAL_SEARCH(
+         ASSEMBLY_SPLIT.out.chunks,
+         INFERNAL_PRESS.out.cm.collect()
+      )
+      ch_tbl = INFERNAL_SEARCH.out.tbl
+   }
 
-    INFERNAL_SEARCH.out.tbl
+    ch_tbl
     .multiMap { m,t ->
        metadata: [m.id, m]
        tbl: [m.id,t ]
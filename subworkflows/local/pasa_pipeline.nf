@@ -7,7 +7,7 @@ include { EXONERATE_FASTACLEAN } from '../../modules/local/exonerate/fastaclean'
 include { PASA_SEQCLEAN } from '../../modules/local/pasa/seqclean'
 include { PASA_ALIGNASSEMBLE } from '../../modules/local/pasa/alignassemble'
 include { PASA_ASMBLSTOTRAINING } from '../../modules/local/pasa/asmblstotraining'
-include { HELPER_PASA2TRAINING } from '../../modules/local/helper/pasa2training'
+include { HELPER_GFFTOOLKIT as HELPER_PASA2TRAINING } from '../../modules/local/helper/gfftoolkit'
 
 workflow PASA_PIPELINE {
 
@@ -36,13 +36,12 @@ workflow PASA_PIPELINE {
           PASA_ALIGNASSEMBLE.out.pasa_out
        )
        HELPER_PASA2TRAINING(
-           PASA_ASMBLSTOTRAINING.out.gff,
-           params.pasa_nmodels
+           PASA_ASMBLSTOTRAINING.out.gff.map { m, gff -> [ m, gff, [] ] }
        )
   
     emit:
        gff = PASA_ASMBLSTOTRAINING.out.gff
-       gff_training = HELPER_PASA2TRAINING.out.gff
+       gff_training = HELPER_PASA2TRAINING.out.training
        versions = PASA_ALIGNASSEMBLE.out.versions
 
 }
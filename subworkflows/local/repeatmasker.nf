@@ -4,9 +4,11 @@
 
 include { REPEATMASKER_STAGELIB } from '../../modules/local/repeatmasker/stagelib'
 include { REPEATMASKER_REPEATMASK } from '../../modules/local/repeatmasker/repeatmask'
-include { FASTASPLITTER } from '../../modules/local/fastasplitter'
+include { ASSEMBLY_SPLIT } from './assembly_split'
 include { CAT_FASTA as REPEATMASKER_CAT_FASTA} from '../../modules/local/cat/fasta'
 include { GUNZIP } from '../../modules/nf-core/modules/gunzip/main'
+include { HELPER_REPEATWINDOWS } from '../../modules/local/helper/repeatwindows'
+include { HELPER_REPEATSOFTMASK as REPEATMASKER_SOFTMASK } from '../../modules/local/helper/repeatsoftmask'
 
 workflow REPEATMASKER {
     take:
@@ -16,7 +18,38 @@ workflow REPEATMASKER {
     rm_db
 
     main:
-    FASTASPLITTER(genome,params.npart_size)
+    //
+    // Mask overlapping windows of long sequences in parallel instead of whole parts,
+    // so that no single scaffold determines the run time
+    //
+    if (params.rm_window_size) {
+       HELPER_REPEATWINDOWS(
+          genome,
+          params.rm_window_size
+       )
+       HELPER_REPEATWINDOWS.out.chunks.flatMap { meta, chunks ->
+          [ chunks ].flatten().collect { [ meta.clone(), it ] }
+       }.set { ch_chunks }
+       ch_digests = HELPER_REPEATWINDOWS.out.digests
+       ch_versions = HELPER_REPEATWINDOWS.out.versions
+    } else {
+       ASSEMBLY_SPLIT(genome,file(params.dummy_gff))
+       ch_chunks = ASSEMBLY_SPLIT.out.chunks
+       ch_digests = ASSEMBLY_SPLIT.out.digests
+       ch_versions = ASSEMBLY_SPLIT.out.versions
+    }
+
+    //
+    // Carry the digests of each part and of the repeat library, so that cached results
+    // are keyed on what is masked instead of on the assembly the part came from
+    //
+    ch_chunks
+       .combine(ch_digests, by: 0)
+       .combine(rm_lib.map { lib -> lib.text.md5() })
+       .map { meta, chunk, digests, lib_digest ->
+          [ meta + [ part_digest: part_digest(digests, chunk), rm_lib_digest: lib_digest ], chunk ]
+       }.set { ch_parts }
+
     GUNZIP(
        create_meta_channel(rm_db)
     )
@@ -26,20 +59,51 @@ workflow REPEATMASKER {
        GUNZIP.out.gunzip.map {m,g -> g}
     )
     REPEATMASKER_REPEATMASK( 
-       FASTASPLITTER.out.chunks,
+       ch_parts,
        REPEATMASKER_STAGELIB.out.library.collect().map{it[0].toString()},
        rm_lib.collect(),
        rm_species
     )
     
-    REPEATMASKER_CAT_FASTA(REPEATMASKER_REPEATMASK.out.masked)
-    
+    //
+    // Soft-mask the assembly with the union of the repeats of all windows, or join the masked parts
+    //
+    if (params.rm_window_size) {
+       REPEATMASKER_SOFTMASK(
+          genome.join(HELPER_REPEATWINDOWS.out.windows).join(
+             REPEATMASKER_REPEATMASK.out.rm_out.map { m,out -> [ assembly_meta(m), out ] }.groupTuple()
+          )
+       )
+       ch_masked = REPEATMASKER_SOFTMASK.out.fasta
+       ch_versions = ch_versions.mix(REPEATMASKER_SOFTMASK.out.versions)
+    } else {
+       REPEATMASKER_CAT_FASTA(
+          REPEATMASKER_REPEATMASK.out.masked.map { m,fasta -> [ assembly_meta(m), fasta ] }.groupTuple().map { m,fastas -> tuple(m,fastas.sort { it.name }) }
+       )
+       ch_masked = REPEATMASKER_CAT_FASTA.out.fasta
+       ch_versions = ch_versions.mix(REPEATMASKER_CAT_FASTA.out.versions)
+    }
+
     emit:
-    fasta = REPEATMASKER_CAT_FASTA.out.fasta
-    versions = REPEATMASKER_STAGELIB.out.versions.mix(REPEATMASKER_REPEATMASK.out.versions,FASTASPLITTER.out.versions,REPEATMASKER_CAT_FASTA.out.versions)
+    fasta = ch_masked
+    versions = ch_versions.mix(REPEATMASKER_STAGELIB.out.versions,REPEATMASKER_REPEATMASK.out.versions)
 }
 
 
+// Look up the digest of a part in the sha256sum output of the split step
+def part_digest(digests, part) {
+    def line = digests.readLines().find { it.tokenize()[-1] == part.name }
+    if (!line) {
+       exit 1, "ERROR: No digest was computed for part ${part.name}"
+    }
+    return line.tokenize()[0]
+}
+
+// Drop the keys of a single part, so that the parts of an assembly group together again
+def assembly_meta(meta) {
+    return meta.findAll { !(it.key in [ 'part_digest', 'rm_lib_digest' ]) }
+}
+
 def create_meta_channel(f) {
     def meta = [:]
     meta.id           = file(f).getSimpleName()
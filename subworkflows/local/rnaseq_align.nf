@@ -5,7 +5,9 @@
 include { SAMPLESHEET_CHECK } from '../../modules/local/samplesheet_check'
 include { STAR_INDEX } from '../../modules/local/star/index'
 include { STAR_ALIGN as STAR_ALIGN_PASS_ONE ; STAR_ALIGN as STAR_ALIGN_PASS_TWO } from '../../modules/local/star/align'
+include { STAR_ALIGNBATCH } from '../../modules/local/star/alignbatch'
 include { FASTP } from '../../modules/local/fastp'
+include { BBMAP_BBNORM } from '../../modules/local/bbmap/bbnorm'
 include { CAT_FASTQ } from '../../modules/nf-core/modules/cat/fastq/main'
 
 workflow RNASEQ_ALIGN {
@@ -28,56 +30,100 @@ workflow RNASEQ_ALIGN {
     FASTP(
        reads
     )
-    
-    FASTP.out.reads
-        .map {
-           meta,fastq ->
-               meta.id = (meta.id.contains("SRR")) ? meta.id : meta.id.split('_')[0..-2].join('_')
-           [ meta , fastq ] }
-        .groupTuple(by: [0])
-        .branch {
-           meta, fastq ->
-              single: fastq.size() == 1
-                 return [ meta, fastq.flatten() ]
-              multiple: fastq.size() > 1
-                 return [ meta, fastq.flatten() ]
-              
-        }
-        .set { ch_fastq }
+    ch_versions = FASTP.out.versions
+    ch_reads = FASTP.out.reads
 
     //
-    // MODULE: concatenate reads per library
-    CAT_FASTQ(
-       ch_fastq.multiple
-    ).reads
-    .mix( ch_fastq.single )
-    .set { ch_cat_fastq }
+    // MODULE: Normalise read depth, so that highly expressed genes do not dominate alignment and assembly time
+    if (params.rnaseq_norm_depth) {
+       BBMAP_BBNORM(
+          FASTP.out.reads,
+          params.rnaseq_norm_depth
+       )
+       ch_versions = ch_versions.mix(BBMAP_BBNORM.out.versions)
+       ch_reads = BBMAP_BBNORM.out.reads
+    }
+    
+    if (params.star_batch_size) {
+       //
+       // MODULE: Align reads once, in batches that share one copy of the index in memory. STAR cannot
+       // insert junctions into an index held in shared memory, so a second pass would mean aligning
+       // every read again against an index loaded per library; junctions are found de novo instead
+       STAR_ALIGNBATCH(
+          STAR_INDEX.out.star_index.collect(),
+          ch_reads.collate(params.star_batch_size).map { create_star_batch(it) }
+       )
+       STAR_ALIGNBATCH.out.bam
+          .flatMap { m, bams ->
+             [ bams ].flatten().collect { bam -> [ m.samples.find { s -> bam.name == s.prefix + ".with_juncs.aligned.bam" }.meta, bam ] }
+          }
+          .set { ch_bam }
+       ch_versions = ch_versions.mix(STAR_ALIGNBATCH.out.versions)
+    } else {
+       ch_reads
+           .map {
+              meta,fastq ->
+                  meta.id = (meta.id.contains("SRR")) ? meta.id : meta.id.split('_')[0..-2].join('_')
+              [ meta , fastq ] }
+           .groupTuple(by: [0])
+           .branch {
+              meta, fastq ->
+                 single: fastq.size() == 1
+                    return [ meta, fastq.flatten() ]
+                 multiple: fastq.size() > 1
+                    return [ meta, fastq.flatten() ]
+                 
+           }
+           .set { ch_fastq }
 
-    //
-    // MODULE: Align reads, first pass to produce junction information
-    STAR_ALIGN_PASS_ONE(
-       STAR_INDEX.out.star_index.collect(),
-       ch_cat_fastq,
-       Channel.from(params.dummy_gff).collect(),
-       true
-    )
+       //
+       // MODULE: concatenate reads per library
+       CAT_FASTQ(
+          ch_fastq.multiple
+       ).reads
+       .mix( ch_fastq.single )
+       .set { ch_cat_fastq }
+
+       //
+       // MODULE: Align reads, first pass to produce junction information
+       STAR_ALIGN_PASS_ONE(
+          STAR_INDEX.out.star_index.collect(),
+          ch_cat_fastq,
+          Channel.from(params.dummy_gff).collect(),
+          true
+       )
 
-    junctions = STAR_ALIGN_PASS_ONE.out.junctions.collectFile(name: 'all_juncs.gtf')
+       junctions = STAR_ALIGN_PASS_ONE.out.junctions.collectFile(name: 'all_juncs.gtf')
    
-    //
-    // MODULE: Align reads with junction information
-    STAR_ALIGN_PASS_TWO(
-       STAR_INDEX.out.star_index.collect(),
-       FASTP.out.reads,
-       junctions.collect(),
-       false
-    )
+       //
+       // MODULE: Align reads with junction information
+       STAR_ALIGN_PASS_TWO(
+          STAR_INDEX.out.star_index.collect(),
+          ch_reads,
+          junctions.collect(),
+          false
+       )
+       ch_bam = STAR_ALIGN_PASS_TWO.out.bam
+       ch_versions = ch_versions.mix(STAR_ALIGN_PASS_ONE.out.versions)
+    }
  
     emit:
-    bam = STAR_ALIGN_PASS_TWO.out.bam
+    bam = ch_bam
     json = FASTP.out.json
     html = FASTP.out.html
-    versions = STAR_INDEX.out.versions.mix(STAR_ALIGN_PASS_ONE.out.versions,FASTP.out.versions)
+    versions = STAR_INDEX.out.versions.mix(ch_versions)
+}
+
+// Function to get [ meta, [ reads ] ] of a batch of runs for STAR_ALIGNBATCH; the runs of one
+// library share its name, so each output prefix is numbered within the batch
+def create_star_batch(ArrayList batch) {
+    def meta = [:]
+    meta.id      = "batch_" + batch[0][0].id
+    meta.samples = batch.withIndex().collect { run, i ->
+       [ meta: run[0], prefix: "${run[0].id}.${i + 1}".toString(), nfiles: [ run[1] ].flatten().size() ]
+    }
+
+    return [ meta, batch.collect { m, reads -> reads }.flatten() ]
 }
 
 def create_fastq_channel(LinkedHashMap row) {
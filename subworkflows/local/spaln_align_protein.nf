@@ -5,13 +5,15 @@
 include { GAAS_FASTACLEANER } from '../../modules/local/gaas/fastacleaner'
 include { EXONERATE_FASTACLEAN } from '../../modules/local/exonerate/fastaclean'
 include { GAAS_FASTAFILTERBYSIZE } from '../../modules/local/gaas/fastafilterbysize'
+include { CDHIT } from '../../modules/local/cdhit/cdhit'
+include { HELPER_CHUNKPROTEINS } from '../../modules/local/helper/chunkproteins'
 include { SPALN_MAKEINDEX } from '../../modules/local/spaln/makeindex'
 include { SPALN_ALIGN } from '../../modules/local/spaln/align'
-include { SPALN_MERGE } from '../../modules/local/spaln/merge'
-include { HELPER_SPALNTOEVM } from '../../modules/local/helper/spalntoevm'
-include { HELPER_SPALNTOGMOD } from '../../modules/local/helper/spalntogmod'
-include { HELPER_SPALNTOTRAINING } from '../../modules/local/helper/spalntotraining'
-include { AUGUSTUS_ALIGNTOHINTS } from '../../modules/local/augustus/aligntohints'
+include { MINIPROT_ALIGN } from '../../modules/local/miniprot/align'
+include { HELPER_SPALNWINDOWS } from '../../modules/local/helper/spalnwindows'
+include { SPALN_ALIGNWINDOWS } from '../../modules/local/spaln/alignwindows'
+include { HELPER_SPALNCONVERT } from '../../modules/local/helper/spalnconvert'
+include { HELPER_SPALNGATHER } from '../../modules/local/helper/spalngather'
 
 workflow SPALN_ALIGN_PROTEIN {
 
@@ -32,48 +34,108 @@ workflow SPALN_ALIGN_PROTEIN {
           EXONERATE_FASTACLEAN.out.fasta,
           params.min_prot_length
        )
-       SPALN_MAKEINDEX(genome)  
-
-       ch_fasta_chunks = GAAS_FASTAFILTERBYSIZE.out.fasta.splitFasta(by: params.nproteins, file: true, elem: [1])       
-       SPALN_ALIGN(
-          SPALN_MAKEINDEX.out.spaln_index,
-          ch_fasta_chunks,
-          params.spaln_q,
-          params.spaln_taxon,
-          params.spaln_options
-       )
+       ch_proteins = GAAS_FASTAFILTERBYSIZE.out.fasta
 
-       SPALN_MERGE(
-          SPALN_MAKEINDEX.out.spaln_index,
-          SPALN_ALIGN.out.align.groupTuple().map { m,files -> tuple(m,files.flatten()) },
-          protein_identity
-       )
+       //
+       // Align one representative of each group of near-identical proteins
+       //
+       if (params.protein_cluster_id) {
+          CDHIT(
+             ch_proteins,
+             params.protein_cluster_id
+          )
+          ch_proteins = CDHIT.out.fasta
+       }
 
-       AUGUSTUS_ALIGNTOHINTS(
-          SPALN_MERGE.out.gff,
-         "spaln",
-          params.max_intron_size,
-          params.pri_prot
-       )
+       if (params.spaln_prefilter) {
+          //
+          // Find candidate loci of all proteins with a fast seed search and let SPALN
+          // align each group of proteins with overlapping loci only against the genome
+          // windows of these loci; without any candidate locus, no batch is emitted
+          //
+          MINIPROT_ALIGN(
+             genome,
+             ch_proteins,
+             params.max_intron_size
+          )
+          HELPER_SPALNWINDOWS(
+             genome,
+             ch_proteins.join(MINIPROT_ALIGN.out.paf),
+             params.nproteins,
+             params.max_intron_size
+          )
+          SPALN_ALIGNWINDOWS(
+             with_shards(HELPER_SPALNWINDOWS.out.batches),
+             params.spaln_q,
+             params.spaln_taxon,
+             params.spaln_options,
+             protein_identity
+          )
+          ch_aligned = SPALN_ALIGNWINDOWS.out.gff
+       } else {
+          SPALN_MAKEINDEX(genome)  
 
-       HELPER_SPALNTOGMOD(
-          SPALN_MERGE.out.gff
-       )
-       HELPER_SPALNTOEVM(
-          SPALN_MERGE.out.gff
+          //
+          // Pack proteins into chunks of similar total length rather than count
+          //
+          HELPER_CHUNKPROTEINS(
+             ch_proteins,
+             params.nproteins
+          )
+          SPALN_ALIGN(
+             SPALN_MAKEINDEX.out.spaln_index,
+             with_shards(HELPER_CHUNKPROTEINS.out.chunks),
+             params.spaln_q,
+             params.spaln_taxon,
+             params.spaln_options,
+             protein_identity
+          )
+          ch_aligned = SPALN_ALIGN.out.gff
+       }
+
+       //
+       // Convert the identity-filtered alignments into models, tracks and hints, one shard
+       // of scaffolds per job; each job only reads the files its shard was written to
+       //
+       ch_aligned.flatMap { m,gffs ->
+          [ gffs ].flatten().collect { gff -> tuple(m, gff.name.tokenize('.')[-2].toInteger(), gff) }
+       }.groupTuple(by: [0,1]).set { ch_shards }
+
+       HELPER_SPALNCONVERT(
+          ch_shards,
+          params.pri_prot,
+          params.max_intron_size
        )
-       HELPER_SPALNTOTRAINING(
-          SPALN_MERGE.out.gff
+       //
+       // Gather for every protein set, so that a set without any alignment still gives (empty) results
+       //
+       HELPER_SPALNGATHER(
+          genome.map { m,f -> m },
+          ch_proteins.map { m,f -> m }.join(
+             HELPER_SPALNCONVERT.out.shard.groupTuple().map { m,files -> tuple(m,files.flatten()) },
+             remainder: true
+          ).map { m,files -> tuple(m, files ?: []) },
+          protein_identity
        )
     emit:
-       hints = AUGUSTUS_ALIGNTOHINTS.out.gff
-       gff = SPALN_MERGE.out.gff
-       gff_training = HELPER_SPALNTOTRAINING.out.gff
-       evm = HELPER_SPALNTOEVM.out.gff
+       hints = HELPER_SPALNGATHER.out.hints
+       gff = HELPER_SPALNGATHER.out.gff
+       gff_training = HELPER_SPALNGATHER.out.gff
+       evm = HELPER_SPALNGATHER.out.evm
        versions = GAAS_FASTACLEANER.out.versions
 
 }
 
+// Pair each alignment job with the number of shards of scaffolds its results are split into,
+// one shard per 50 jobs
+def with_shards(jobs) {
+    return jobs.flatMap { m, files ->
+       def batch = [ files ].flatten()
+       def nshards = Math.max(1, batch.size().intdiv(50))
+       batch.collect { [ m, it, nshards ] }
+    }
+}
+
 def create_fasta_channel(fasta) {
     def meta = [:]
     meta.id           = file(fasta).getSimpleName()
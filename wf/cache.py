@@ -0,0 +1,104 @@
+import hashlib
+import shutil
+import time
+import typing
+from pathlib import Path
+
+from latch.ldata.path import LPath
+from latch_cli.utils import urljoins
+
+# The cache keeps one entry per assembly digest (plus one for shared databases)
+# and an index with the size and last use of each entry, so that the least
+# recently used entries can be evicted without listing the remote directory.
+index_name = "index.tsv"
+
+
+def assembly_digest(assembly: Path) -> str:
+    # Must match bin/fasta_digest.py, which keys the entries inside the pipeline
+    digest = hashlib.sha256()
+    with assembly.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _entry_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _entry_modified(path: Path) -> float:
+    return max((p.stat().st_mtime for p in path.rglob("*") if p.is_file()), default=0.0)
+
+
+def read_index(remote: str, local: Path) -> typing.Dict[str, typing.Tuple[int, float]]:
+    index = {}
+    try:
+        LPath(urljoins(remote, index_name)).download(local / index_name)
+    except Exception:
+        return index
+
+    for line in (local / index_name).read_text().splitlines():
+        if line.startswith("#") or line.strip() == "":
+            continue
+        key, size, last_used = line.split("\t")
+        index[key] = (int(size), float(last_used))
+
+    return index
+
+
+def restore_cache(remote: str, local: Path, keys: typing.List[str]) -> typing.Dict[str, float]:
+    local.mkdir(parents=True, exist_ok=True)
+    index = read_index(remote, local)
+
+    for key in keys:
+        if key not in index:
+            print(f"No cached results for {key}")
+            continue
+
+        print(f"Restoring cached results for {key}... ", end="", flush=True)
+        try:
+            LPath(urljoins(remote, key)).download(local / key)
+            print("Done.")
+        except Exception as e:
+            print(f"Failed: {e}")
+            shutil.rmtree(local / key, ignore_errors=True)
+
+    # The state of each entry before the run, to upload only what the run changed
+    return {key: _entry_modified(local / key) for key in keys if (local / key).exists()}
+
+
+def save_cache(remote: str, local: Path, keys: typing.List[str], restored: typing.Dict[str, float], max_bytes: int) -> None:
+    index = read_index(remote, local)
+    now = time.time()
+
+    for key in keys:
+        entry = local / key
+        if not entry.exists():
+            continue
+
+        # Entries that are already up to date only need their last use refreshed
+        if key not in index or _entry_modified(entry) != restored.get(key):
+            print(f"Uploading cached results for {key}... ", end="", flush=True)
+            LPath(urljoins(remote, key)).upload_from(entry)
+            print("Done.")
+
+        index[key] = (_entry_size(entry), now)
+
+    total = sum(size for size, _ in index.values())
+    for key, (size, _) in sorted(index.items(), key=lambda x: x[1][1]):
+        if total <= max_bytes or key in keys:
+            continue
+
+        print(f"Evicting least recently used cache entry {key}")
+        try:
+            LPath(urljoins(remote, key)).rmr()
+        except Exception as e:
+            print(f"Failed to evict {key}: {e}")
+            continue
+
+        total -= size
+        del index[key]
+
+    lines = ["#key\tsize\tlast_used"] + [f"{k}\t{s}\t{t}" for k, (s, t) in index.items()]
+    (local / index_name).write_text("\n".join(lines) + "\n")
+    LPath(urljoins(remote, index_name)).upload_from(local / index_name)
@@ -21,24 +21,46 @@ from flytekit.core.annotation import FlyteAnnotation
 
 from latch_cli.services.register.utils import import_module_by_path
 
+from wf.cache import assembly_digest, restore_cache, save_cache
+from wf.telemetry import performance_report, print_report, write_report
+from wf.resource_advisor import genome_size, read_runs, recommend, sequence_count, write_overlay, write_runs
+from wf.prefetch import localize_samplesheet, prefetch, remote_inputs
+from wf.workspace import remote_size, samplesheet_files, stage_pipeline, workspace_gib
+
 meta = Path("latch_metadata") / "__init__.py"
 import_module_by_path(meta)
 import latch_metadata
 
 @custom_task(cpu=0.25, memory=0.5, storage_gib=1)
-def initialize() -> str:
+def initialize(assembly: LatchFile, rnaseq_samples: typing.Optional[LatchFile], proteins: typing.Optional[LatchFile], proteins_targeted: typing.Optional[LatchFile], transcripts: typing.Optional[LatchFile], rm_db: typing.Optional[LatchFile], references: typing.Optional[LatchFile]) -> str:
     token = os.environ.get("FLYTE_INTERNAL_EXECUTION_ID")
     if token is None:
         raise RuntimeError("failed to get execution token")
 
     headers = {"Authorization": f"Latch-Execution-Token {token}"}
 
-    print("Provisioning shared storage volume... ", end="")
+    # Size the volume from the inputs; the sample sheets only list the large files
+    input_bytes = {
+        "assembly": remote_size(assembly.remote_path),
+        "proteins": sum(remote_size(f.remote_path) for f in [proteins, proteins_targeted] if f is not None),
+        "transcripts": remote_size(transcripts.remote_path) if transcripts is not None else 0,
+        "rm_db": remote_size(rm_db.remote_path) if rm_db is not None else 0,
+        "reads": 0,
+        "references": 0,
+    }
+    if rnaseq_samples is not None:
+        input_bytes["reads"] = sum(remote_size(f) for f in samplesheet_files(Path(rnaseq_samples), ["fastq_1", "fastq_2"]))
+    if references is not None:
+        input_bytes["references"] = sum(remote_size(f) for f in samplesheet_files(Path(references), ["fasta", "gtf"]))
+    storage_gib = workspace_gib(input_bytes)
+    print(f"Input sizes: {', '.join(f'{k} {v / 2**30:.1f} GiB' for k, v in input_bytes.items())}")
+
+    print(f"Provisioning shared storage volume of {storage_gib} GiB... ", end="")
     resp = requests.post(
         "http://nf-dispatcher-service.flyte.svc.cluster.local/provision-storage",
         headers=headers,
         json={
-            "storage_gib": 100,
+            "storage_gib": storage_gib,
         }
     )
     resp.raise_for_status()
@@ -52,31 +74,52 @@ def initialize() -> str:
 
 
 @nextflow_runtime_task(cpu=4, memory=8, storage_gib=100)
-def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensions.Annotated[LatchDir, FlyteAnnotation({'output': True})], email: typing.Optional[str], multiqc_title: typing.Optional[str], rnaseq_samples: typing.Optional[LatchFile], proteins: typing.Optional[LatchFile], proteins_targeted: typing.Optional[LatchFile], transcripts: typing.Optional[LatchFile], rm_lib: typing.Optional[LatchFile], references: typing.Optional[LatchFile], max_intron_size: typing.Optional[int], rm_species: typing.Optional[str], rm_db: typing.Optional[LatchFile], busco_lineage: typing.Optional[str], busco_db_path: typing.Optional[str], aug_species: typing.Optional[str], aug_config_dir: typing.Optional[str], aug_extrinsic_cfg: typing.Optional[str], spaln_taxon: typing.Optional[str], trinity: typing.Optional[bool], pasa: typing.Optional[bool], evm: typing.Optional[bool], ncrna: typing.Optional[bool], npart_size: typing.Optional[int], min_contig_size: typing.Optional[int], dummy_gff: typing.Optional[str], aug_options: typing.Optional[str], aug_config_container: typing.Optional[str], aug_chunk_length: typing.Optional[int], aug_training: typing.Optional[bool], pri_prot: typing.Optional[int], pri_prot_target: typing.Optional[int], pri_est: typing.Optional[int], pri_rnaseq: typing.Optional[int], pri_wiggle: typing.Optional[int], pri_trans: typing.Optional[int], t_est: typing.Optional[str], t_prot: typing.Optional[str], t_rnaseq: typing.Optional[str], spaln_options: typing.Optional[str], spaln_protein_id: typing.Optional[int], min_prot_length: typing.Optional[int], nproteins: typing.Optional[int], spaln_q: typing.Optional[int], spaln_protein_id_targeted: typing.Optional[int], pasa_nmodels: typing.Optional[int], pasa_config_file: typing.Optional[str], evm_weights: typing.Optional[str], nevm: typing.Optional[int]) -> None:
+def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensions.Annotated[LatchDir, FlyteAnnotation({'output': True})], email: typing.Optional[str], multiqc_title: typing.Optional[str], rnaseq_samples: typing.Optional[LatchFile], proteins: typing.Optional[LatchFile], proteins_targeted: typing.Optional[LatchFile], transcripts: typing.Optional[LatchFile], rm_lib: typing.Optional[LatchFile], references: typing.Optional[LatchFile], max_intron_size: typing.Optional[int], rm_species: typing.Optional[str], rm_db: typing.Optional[LatchFile], busco_lineage: typing.Optional[str], busco_db_path: typing.Optional[str], aug_species: typing.Optional[str], aug_config_dir: typing.Optional[str], aug_extrinsic_cfg: typing.Optional[str], spaln_taxon: typing.Optional[str], trinity: typing.Optional[bool], pasa: typing.Optional[bool], evm: typing.Optional[bool], ncrna: typing.Optional[bool], npart_size: typing.Optional[int], min_contig_size: typing.Optional[int], dummy_gff: typing.Optional[str], aug_options: typing.Optional[str], aug_config_container: typing.Optional[str], aug_chunk_length: typing.Optional[int], aug_training: typing.Optional[bool], pri_prot: typing.Optional[int], pri_prot_target: typing.Optional[int], pri_est: typing.Optional[int], pri_rnaseq: typing.Optional[int], pri_wiggle: typing.Optional[int], pri_trans: typing.Optional[int], t_est: typing.Optional[str], t_prot: typing.Optional[str], t_rnaseq: typing.Optional[str], spaln_options: typing.Optional[str], spaln_protein_id: typing.Optional[int], min_prot_length: typing.Optional[int], nproteins: typing.Optional[int], spaln_q: typing.Optional[int], spaln_protein_id_targeted: typing.Optional[int], pasa_nmodels: typing.Optional[int], pasa_config_file: typing.Optional[str], evm_weights: typing.Optional[str], nevm: typing.Optional[int], npart: typing.Optional[int], aug_njobs: typing.Optional[int], evm_segment_size: typing.Optional[int], evm_overlap_size: typing.Optional[int], result_cache: typing.Optional[LatchDir], result_cache_size: typing.Optional[int], previous_run: typing.Optional[LatchDir], resource_history: typing.Optional[LatchDir], validate_fastq: typing.Optional[bool], rnaseq_norm_depth: typing.Optional[int], star_batch_size: typing.Optional[int], trinity_parts: typing.Optional[int], spaln_prefilter: typing.Optional[bool], protein_cluster_id: typing.Optional[int], aug_training_rounds: typing.Optional[int], aug_training_kfold: typing.Optional[int], rm_window_size: typing.Optional[int], ncrna_shards: typing.Optional[int]) -> None:
+    shared_dir = Path("/nf-workdir")
+    cache_dir = shared_dir / "result_cache"
+    trace_file = shared_dir / "execution_trace.txt"
+    dag_file = shared_dir / "pipeline_dag.dot"
+    history_dir = shared_dir / "resource_history"
+    history_runs = []
+    run_sizes = {}
+    cache_keys = []
+    restored = {}
+
     try:
-        shared_dir = Path("/nf-workdir")
 
 
 
-        ignore_list = [
-            "latch",
-            ".latch",
-            "nextflow",
-            ".nextflow",
-            "work",
-            "results",
-            "miniconda",
-            "anaconda3",
-            "mambaforge",
-        ]
+        print("Staging pipeline files... ", end="", flush=True)
+        copied, skipped = stage_pipeline(Path("/root"), shared_dir)
+        print(f"Done ({copied} copied, {skipped} unchanged).")
 
-        shutil.copytree(
-            Path("/root"),
-            shared_dir,
-            ignore=lambda src, names: ignore_list,
-            ignore_dangling_symlinks=True,
-            dirs_exist_ok=True,
-        )
+        # Fetch the large inputs concurrently, before the first task needs them
+        input_dir = shared_dir / "inputs"
+        remotes = remote_inputs({
+            "assembly": assembly.remote_path,
+            "proteins": proteins.remote_path if proteins is not None else None,
+            "proteins_targeted": proteins_targeted.remote_path if proteins_targeted is not None else None,
+            "transcripts": transcripts.remote_path if transcripts is not None else None,
+            "rm_lib": rm_lib.remote_path if rm_lib is not None else None,
+            "rm_db": rm_db.remote_path if rm_db is not None else None,
+            "busco_db_path": busco_db_path,
+        })
+        print(f"Prefetching {len(remotes)} inputs... ", end="", flush=True)
+        fetched = prefetch(remotes.values(), input_dir)
+        local_inputs = {name: fetched[remote][0] for name, remote in remotes.items()}
+        if references is not None:
+            local_inputs["references"] = localize_samplesheet(Path(references), ["fasta", "gtf"], input_dir)
+        # The reads can only be validated on the volume, not at their latch:// paths
+        if rnaseq_samples is not None and validate_fastq:
+            local_inputs["rnaseq_samples"] = localize_samplesheet(Path(rnaseq_samples), ["fastq_1", "fastq_2"], input_dir)
+        print("Done.")
+
+        def input_flag(name, value):
+            if name in local_inputs:
+                return [f"--{name}", str(local_inputs[name])]
+            return get_flag(name, value)
+
+        local_assembly = local_inputs["assembly"] if "assembly" in local_inputs else Path(assembly)
 
         cmd = [
             "/root/nextflow",
@@ -88,23 +131,27 @@ def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensio
             "docker",
             "-c",
             "latch.config",
-                *get_flag('assembly', assembly),
+            "-with-trace",
+            str(trace_file),
+            "-with-dag",
+            str(dag_file),
+                *input_flag('assembly', assembly),
                 *get_flag('outdir', outdir),
                 *get_flag('email', email),
                 *get_flag('multiqc_title', multiqc_title),
-                *get_flag('rnaseq_samples', rnaseq_samples),
-                *get_flag('proteins', proteins),
-                *get_flag('proteins_targeted', proteins_targeted),
-                *get_flag('transcripts', transcripts),
-                *get_flag('rm_lib', rm_lib),
-                *get_flag('references', references),
+                *input_flag('rnaseq_samples', rnaseq_samples),
+                *input_flag('proteins', proteins),
+                *input_flag('proteins_targeted', proteins_targeted),
+                *input_flag('transcripts', transcripts),
+                *input_flag('rm_lib', rm_lib),
+                *input_flag('references', references),
                 *get_flag('npart_size', npart_size),
                 *get_flag('max_intron_size', max_intron_size),
                 *get_flag('min_contig_size', min_contig_size),
                 *get_flag('rm_species', rm_species),
-                *get_flag('rm_db', rm_db),
+                *input_flag('rm_db', rm_db),
                 *get_flag('busco_lineage', busco_lineage),
-                *get_flag('busco_db_path', busco_db_path),
+                *input_flag('busco_db_path', busco_db_path),
                 *get_flag('dummy_gff', dummy_gff),
                 *get_flag('aug_species', aug_species),
                 *get_flag('aug_options', aug_options),
@@ -136,9 +183,58 @@ def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensio
                 *get_flag('trinity', trinity),
                 *get_flag('pasa', pasa),
                 *get_flag('evm', evm),
-                *get_flag('ncrna', ncrna)
+                *get_flag('ncrna', ncrna),
+                *get_flag('npart', npart),
+                *get_flag('aug_njobs', aug_njobs),
+                *get_flag('evm_segment_size', evm_segment_size),
+                *get_flag('evm_overlap_size', evm_overlap_size),
+                *get_flag('previous_run', previous_run),
+                *get_flag('validate_fastq', validate_fastq),
+                *get_flag('rnaseq_norm_depth', rnaseq_norm_depth),
+                *get_flag('star_batch_size', star_batch_size),
+                *get_flag('trinity_parts', trinity_parts),
+                *get_flag('spaln_prefilter', spaln_prefilter),
+                *get_flag('protein_cluster_id', protein_cluster_id),
+                *get_flag('aug_training_rounds', aug_training_rounds),
+                *get_flag('aug_training_kfold', aug_training_kfold),
+                *get_flag('rm_window_size', rm_window_size),
+                *get_flag('ncrna_shards', ncrna_shards)
         ]
 
+        if result_cache is not None:
+            assembly_remote = fetched.get(assembly.remote_path)
+            cache_keys = [assembly_remote[1] if assembly_remote is not None else assembly_digest(local_assembly), "rfam"]
+            restored = restore_cache(result_cache.remote_path, cache_dir, cache_keys)
+            cmd += ["--cache_dir", str(cache_dir)]
+
+        if resource_history is not None:
+            history_dir.mkdir(parents=True, exist_ok=True)
+            # Compressed size of the RNA-seq reads, as counting them would mean reading them all
+            read_bytes = sum(remote_size(f) for f in samplesheet_files(Path(rnaseq_samples), ["fastq_1", "fastq_2"])) if rnaseq_samples is not None else 0
+            run_sizes = {
+                "genome_size": float(genome_size(local_assembly)),
+                "read_bytes": float(read_bytes) if read_bytes > 0 else None,
+                "proteins": float(sequence_count(local_inputs["proteins"] if "proteins" in local_inputs else Path(proteins))) if proteins is not None else None,
+            }
+            try:
+                LPath(urljoins(resource_history.remote_path, "runs.csv")).download(history_dir / "runs.csv")
+                history_runs = read_runs(history_dir / "runs.csv")
+            except Exception:
+                print("No resource history yet, using the default resource requests")
+
+            if len(history_runs) > 0:
+                for trace, _ in history_runs:
+                    # recommend() skips runs whose trace could not be fetched
+                    try:
+                        LPath(urljoins(resource_history.remote_path, trace.name)).download(trace)
+                    except Exception as e:
+                        print(f"Failed to fetch trace {trace.name}: {e}")
+                        trace.unlink(missing_ok=True)
+                recommendations = recommend(history_runs, run_sizes)
+                write_overlay(recommendations, run_sizes, history_dir / "tuned_resources.config")
+                print(f"Tuned resource requests of {len(recommendations)} processes from {len(history_runs)} previous runs")
+                cmd += ["-c", str(history_dir / "tuned_resources.config")]
+
         print("Launching Nextflow Runtime")
         print(' '.join(cmd))
         print(flush=True)
@@ -159,6 +255,34 @@ def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensio
     finally:
         print()
 
+        if result_cache is not None and len(cache_keys) > 0:
+            try:
+                save_cache(result_cache.remote_path, cache_dir, cache_keys, restored, result_cache_size * 2**30)
+            except Exception as e:
+                print(f"Failed to save the result cache: {e}")
+
+        if resource_history is not None and trace_file.exists():
+            name = _get_execution_name()
+            if name is not None:
+                try:
+                    trace = history_dir / f"{name}.trace.txt"
+                    shutil.copyfile(trace_file, trace)
+                    LPath(urljoins(resource_history.remote_path, trace.name)).upload_from(trace)
+                    write_runs(history_dir / "runs.csv", history_runs + [(trace, run_sizes)])
+                    LPath(urljoins(resource_history.remote_path, "runs.csv")).upload_from(history_dir / "runs.csv")
+                except Exception as e:
+                    print(f"Failed to add this run to the resource history: {e}")
+
+        report_file = shared_dir / "performance_report.json"
+        if trace_file.exists():
+            try:
+                report = performance_report(trace_file, dag_file)
+                write_report(report, report_file)
+                print("Performance summary:")
+                print_report(report)
+            except Exception as e:
+                print(f"Failed to create the performance report: {e}")
+
         nextflow_log = shared_dir / ".nextflow.log"
         if nextflow_log.exists():
             name = _get_execution_name()
@@ -169,16 +293,22 @@ def nextflow_runtime(pvc_name: str, assembly: LatchFile, outdir: typing_extensio
                 print(f"Uploading .nextflow.log to {remote.path}")
                 remote.upload_from(nextflow_log)
 
+                for f in [trace_file, report_file]:
+                    if f.exists():
+                        remote = LPath(urljoins("latch:///your_log_dir/nf_nf_core_genomeannotator", name, f.name))
+                        print(f"Uploading {f.name} to {remote.path}")
+                        remote.upload_from(f)
+
 
 
 @workflow(metadata._nextflow_metadata)
-def nf_nf_core_genomeannotator(assembly: LatchFile, outdir: typing_extensions.Annotated[LatchDir, FlyteAnnotation({'output': True})], email: typing.Optional[str], multiqc_title: typing.Optional[str], rnaseq_samples: typing.Optional[LatchFile], proteins: typing.Optional[LatchFile], proteins_targeted: typing.Optional[LatchFile], transcripts: typing.Optional[LatchFile], rm_lib: typing.Optional[LatchFile], references: typing.Optional[LatchFile], max_intron_size: typing.Optional[int], rm_species: typing.Optional[str], rm_db: typing.Optional[LatchFile], busco_lineage: typing.Optional[str], busco_db_path: typing.Optional[str], aug_species: typing.Optional[str], aug_config_dir: typing.Optional[str], aug_extrinsic_cfg: typing.Optional[str], spaln_taxon: typing.Optional[str], trinity: typing.Optional[bool], pasa: typing.Optional[bool], evm: typing.Optional[bool], ncrna: typing.Optional[bool], npart_size: typing.Optional[int] = 200000000, min_contig_size: typing.Optional[int] = 5000, dummy_gff: typing.Optional[str] = 'PIPELINE_BASE/assets/empty.gff3', aug_options: typing.Optional[str] = '--alternatives-from-evidence=on --minexonintronprob=0.08 --minmeanexonintronprob=0.4 --maxtracks=3', aug_config_container: typing.Optional[str] = '/usr/local/config', aug_chunk_length: typing.Optional[int] = 3000000, aug_training: typing.Optional[bool] = False, pri_prot: typing.Optional[int] = 3, pri_prot_target: typing.Optional[int] = 5, pri_est: typing.Optional[int] = 4, pri_rnaseq: typing.Optional[int] = 4, pri_wiggle: typing.Optional[int] = 2, pri_trans: typing.Optional[int] = 4, t_est: typing.Optional[str] = 'E', t_prot: typing.Optional[str] = 'P', t_rnaseq: typing.Optional[str] = 'E', spaln_options: typing.Optional[str] = '-M', spaln_protein_id: typing.Optional[int] = 60, min_prot_length: typing.Optional[int] = 35, nproteins: typing.Optional[int] = 200, spaln_q: typing.Optional[int] = 5, spaln_protein_id_targeted: typing.Optional[int] = 90, pasa_nmodels: typing.Optional[int] = 1000, pasa_config_file: typing.Optional[str] = 'PIPELINE_BASE/assets/pasa/alignAssembly.config', evm_weights: typing.Optional[str] = 'None', nevm: typing.Optional[int] = 10) -> None:
+def nf_nf_core_genomeannotator(assembly: LatchFile, outdir: typing_extensions.Annotated[LatchDir, FlyteAnnotation({'output': True})], email: typing.Optional[str], multiqc_title: typing.Optional[str], rnaseq_samples: typing.Optional[LatchFile], proteins: typing.Optional[LatchFile], proteins_targeted: typing.Optional[LatchFile], transcripts: typing.Optional[LatchFile], rm_lib: typing.Optional[LatchFile], references: typing.Optional[LatchFile], max_intron_size: typing.Optional[int], rm_species: typing.Optional[str], rm_db: typing.Optional[LatchFile], busco_lineage: typing.Optional[str], busco_db_path: typing.Optional[str], aug_species: typing.Optional[str], aug_config_dir: typing.Optional[str], aug_extrinsic_cfg: typing.Optional[str], spaln_taxon: typing.Optional[str], trinity: typing.Optional[bool], pasa: typing.Optional[bool], evm: typing.Optional[bool], ncrna: typing.Optional[bool], npart_size: typing.Optional[int] = 200000000, min_contig_size: typing.Optional[int] = 5000, dummy_gff: typing.Optional[str] = 'PIPELINE_BASE/assets/empty.gff3', aug_options: typing.Optional[str] = '--alternatives-from-evidence=on --minexonintronprob=0.08 --minmeanexonintronprob=0.4 --maxtracks=3', aug_config_container: typing.Optional[str] = '/usr/local/config', aug_chunk_length: typing.Optional[int] = 3000000, aug_training: typing.Optional[bool] = False, pri_prot: typing.Optional[int] = 3, pri_prot_target: typing.Optional[int] = 5, pri_est: typing.Optional[int] = 4, pri_rnaseq: typing.Optional[int] = 4, pri_wiggle: typing.Optional[int] = 2, pri_trans: typing.Optional[int] = 4, t_est: typing.Optional[str] = 'E', t_prot: typing.Optional[str] = 'P', t_rnaseq: typing.Optional[str] = 'E', spaln_options: typing.Optional[str] = '-M', spaln_protein_id: typing.Optional[int] = 60, min_prot_length: typing.Optional[int] = 35, nproteins: typing.Optional[int] = 200, spaln_q: typing.Optional[int] = 5, spaln_protein_id_targeted: typing.Optional[int] = 90, pasa_nmodels: typing.Optional[int] = 1000, pasa_config_file: typing.Optional[str] = 'PIPELINE_BASE/assets/pasa/alignAssembly.config', evm_weights: typing.Optional[str] = 'None', nevm: typing.Optional[int] = 10, npart: typing.Optional[int] = None, aug_njobs: typing.Optional[int] = None, evm_segment_size: typing.Optional[int] = 2000000, evm_overlap_size: typing.Optional[int] = 200000, result_cache: typing.Optional[LatchDir] = None, result_cache_size: typing.Optional[int] = 500, previous_run: typing.Optional[LatchDir] = None, resource_history: typing.Optional[LatchDir] = None, validate_fastq: typing.Optional[bool] = False, rnaseq_norm_depth: typing.Optional[int] = None, star_batch_size: typing.Optional[int] = None, trinity_parts: typing.Optional[int] = None, spaln_prefilter: typing.Optional[bool] = False, protein_cluster_id: typing.Optional[int] = None, aug_training_rounds: typing.Optional[int] = 5, aug_training_kfold: typing.Optional[int] = 8, rm_window_size: typing.Optional[int] = None, ncrna_shards: typing.Optional[int] = None) -> None:
     """
     nf-core/genomeannotator
 
     Sample Description
     """
 
-    pvc_name: str = initialize()
-    nextflow_runtime(pvc_name=pvc_name, assembly=assembly, outdir=outdir, email=email, multiqc_title=multiqc_title, rnaseq_samples=rnaseq_samples, proteins=proteins, proteins_targeted=proteins_targeted, transcripts=transcripts, rm_lib=rm_lib, references=references, npart_size=npart_size, max_intron_size=max_intron_size, min_contig_size=min_contig_size, rm_species=rm_species, rm_db=rm_db, busco_lineage=busco_lineage, busco_db_path=busco_db_path, dummy_gff=dummy_gff, aug_species=aug_species, aug_options=aug_options, aug_config_container=aug_config_container, aug_config_dir=aug_config_dir, aug_extrinsic_cfg=aug_extrinsic_cfg, aug_chunk_length=aug_chunk_length, aug_training=aug_training, pri_prot=pri_prot, pri_prot_target=pri_prot_target, pri_est=pri_est, pri_rnaseq=pri_rnaseq, pri_wiggle=pri_wiggle, pri_trans=pri_trans, t_est=t_est, t_prot=t_prot, t_rnaseq=t_rnaseq, spaln_taxon=spaln_taxon, spaln_options=spaln_options, spaln_protein_id=spaln_protein_id, min_prot_length=min_prot_length, nproteins=nproteins, spaln_q=spaln_q, spaln_protein_id_targeted=spaln_protein_id_targeted, pasa_nmodels=pasa_nmodels, pasa_config_file=pasa_config_file, evm_weights=evm_weights, nevm=nevm, trinity=trinity, pasa=pasa, evm=evm, ncrna=ncrna)
+    pvc_name: str = initialize(assembly=assembly, rnaseq_samples=rnaseq_samples, proteins=proteins, proteins_targeted=proteins_targeted, transcripts=transcripts, rm_db=rm_db, references=references)
+    nextflow_runtime(pvc_name=pvc_name, assembly=assembly, outdir=outdir, email=email, multiqc_title=multiqc_title, rnaseq_samples=rnaseq_samples, proteins=proteins, proteins_targeted=proteins_targeted, transcripts=transcripts, rm_lib=rm_lib, references=references, npart_size=npart_size, max_intron_size=max_intron_size, min_contig_size=min_contig_size, rm_species=rm_species, rm_db=rm_db, busco_lineage=busco_lineage, busco_db_path=busco_db_path, dummy_gff=dummy_gff, aug_species=aug_species, aug_options=aug_options, aug_config_container=aug_config_container, aug_config_dir=aug_config_dir, aug_extrinsic_cfg=aug_extrinsic_cfg, aug_chunk_length=aug_chunk_length, aug_training=aug_training, pri_prot=pri_prot, pri_prot_target=pri_prot_target, pri_est=pri_est, pri_rnaseq=pri_rnaseq, pri_wiggle=pri_wiggle, pri_trans=pri_trans, t_est=t_est, t_prot=t_prot, t_rnaseq=t_rnaseq, spaln_taxon=spaln_taxon, spaln_options=spaln_options, spaln_protein_id=spaln_protein_id, min_prot_length=min_prot_length, nproteins=nproteins, spaln_q=spaln_q, spaln_protein_id_targeted=spaln_protein_id_targeted, pasa_nmodels=pasa_nmodels, pasa_config_file=pasa_config_file, evm_weights=evm_weights, nevm=nevm, trinity=trinity, pasa=pasa, evm=evm, ncrna=ncrna, npart=npart, aug_njobs=aug_njobs, evm_segment_size=evm_segment_size, evm_overlap_size=evm_overlap_size, result_cache=result_cache, result_cache_size=result_cache_size, previous_run=previous_run, resource_history=resource_history, validate_fastq=validate_fastq, rnaseq_norm_depth=rnaseq_norm_depth, star_batch_size=star_batch_size, trinity_parts=trinity_parts, spaln_prefilter=spaln_prefilter, protein_cluster_id=protein_cluster_id, aug_training_rounds=aug_training_rounds, aug_training_kfold=aug_training_kfold, rm_window_size=rm_window_size, ncrna_shards=ncrna_shards)
 
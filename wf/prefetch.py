@@ -0,0 +1,112 @@
+import csv
+import hashlib
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from latch.ldata.path import LPath
+
+# The inputs are fetched onto the shared volume before Nextflow starts, so that
+# no task waits for them and each is fetched only once, however many tasks read
+# it. The manifest records the remote path, size and sha256 of every fetched
+# file; a file already on the volume with a matching entry is not fetched again.
+manifest_name = "manifest.tsv"
+
+
+def _digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest(manifest: Path) -> typing.Dict[str, typing.Tuple[str, int, str]]:
+    entries = {}
+    if not manifest.exists():
+        return entries
+
+    for line in manifest.read_text().splitlines():
+        if line.startswith("#") or line.strip() == "":
+            continue
+        remote, name, size, digest = line.split("\t")
+        entries[remote] = (name, int(size), digest)
+
+    return entries
+
+
+def _local_name(remote: str) -> str:
+    # Inputs from different directories may share a file name; the name itself is
+    # kept, as the pipeline derives sample and output names from it
+    return hashlib.sha1(remote.encode()).hexdigest()[:12] + "/" + remote.rstrip("/").split("/")[-1]
+
+
+def _fetch(remote: str, target: Path, known: typing.Optional[typing.Tuple[str, int, str]]) -> typing.Tuple[str, int, str]:
+    lpath = LPath(remote)
+    if lpath.is_dir():
+        local = target / _local_name(remote)
+        if known is None or not local.exists():
+            local.parent.mkdir(parents=True, exist_ok=True)
+            lpath.download(local)
+        return _local_name(remote), 0, ""
+
+    size = lpath.size()
+    if known is not None and known[0] == _local_name(remote) and known[1] == size:
+        local = target / known[0]
+        if local.exists() and local.stat().st_size == size and _digest(local) == known[2]:
+            return known
+
+    local = target / _local_name(remote)
+    local.parent.mkdir(parents=True, exist_ok=True)
+    lpath.download(local)
+    if local.stat().st_size != size:
+        raise RuntimeError(f"Fetched {local.stat().st_size} of {size} bytes of {remote}")
+
+    return _local_name(remote), size, _digest(local)
+
+
+def remote_inputs(inputs: typing.Dict[str, typing.Optional[str]]) -> typing.Dict[str, str]:
+    return {name: path for name, path in inputs.items() if path is not None and path.startswith("latch://")}
+
+
+def prefetch(remotes: typing.Iterable[str], target: Path, workers: int = 8) -> typing.Dict[str, typing.Tuple[Path, str]]:
+    target.mkdir(parents=True, exist_ok=True)
+    manifest = target / manifest_name
+    previous = _read_manifest(manifest)
+    remotes = sorted(set(remotes))
+    if len(remotes) == 0:
+        return {}
+
+    with ThreadPoolExecutor(min(workers, len(remotes))) as pool:
+        fetched = dict(zip(remotes, pool.map(lambda r: _fetch(r, target, previous.get(r)), remotes)))
+
+    previous.update(fetched)
+    lines = ["#remote\tname\tsize\tsha256"] + [f"{r}\t{n}\t{s}\t{d}" for r, (n, s, d) in sorted(previous.items())]
+    manifest.write_text("\n".join(lines) + "\n")
+
+    return {remote: (target / name, digest) for remote, (name, _, digest) in fetched.items()}
+
+
+def localize_samplesheet(samplesheet: Path, columns: typing.List[str], target: Path, workers: int = 8) -> Path:
+    # Fetch the files a sample sheet lists and write a copy that points to them
+    with samplesheet.open() as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        rows = list(reader)
+
+    remotes = [row[c].strip() for row in rows for c in columns if (row.get(c) or "").strip().startswith("latch://")]
+    local = prefetch(remotes, target, workers)
+
+    for row in rows:
+        for c in columns:
+            value = (row.get(c) or "").strip()
+            if value in local:
+                row[c] = str(local[value][0])
+
+    localized = target / f"{samplesheet.stem}.local{samplesheet.suffix}"
+    with localized.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return localized
@@ -0,0 +1,255 @@
+import argparse
+import csv
+import math
+import typing
+from dataclasses import dataclass
+from pathlib import Path
+
+from wf.telemetry import Task, read_trace
+
+# Input sizes a process' resource use may scale with. The best fitting one is
+# chosen per process; processes that fit none are sized from the largest use seen.
+covariates = ["genome_size", "read_bytes", "proteins"]
+runs_header = ["trace"] + covariates
+
+# Exit codes of tasks killed for exceeding their memory
+oom_exit_codes = {137, 139, 140}
+
+memory_margin = 1.25
+time_margin = 2.0
+min_memory_mb = 1024
+min_r_squared = 0.5
+min_runs_for_fit = 3
+
+
+@dataclass
+class Observation:
+    # Largest use of any task of a process in one run
+    run: typing.Dict[str, typing.Optional[float]]
+    memory: float
+    time: float
+    cpus: float
+    allocated_cpus: int
+
+
+@dataclass
+class Recommendation:
+    process: str
+    cpus: int
+    memory_mb: int
+    time_h: int
+    covariate: typing.Optional[str]
+    runs: int
+
+
+def genome_size(assembly: Path) -> int:
+    size = 0
+    with assembly.open() as f:
+        for line in f:
+            if not line.startswith(">"):
+                size += len(line.strip())
+    return size
+
+
+def sequence_count(fasta: Path) -> int:
+    with fasta.open() as f:
+        return sum(line.startswith(">") for line in f)
+
+
+def _manifest_genome_size(trace: Path) -> typing.Optional[float]:
+    # Runs write a manifest of the assembly next to pipeline_info/
+    for manifest in (trace.parent.parent / "assembly").glob("*.sequences.tsv"):
+        with manifest.open() as f:
+            return float(sum(int(line.split("\t")[1]) for line in f if not line.startswith("#")))
+    return None
+
+
+def read_runs(runs: Path) -> typing.List[typing.Tuple[Path, typing.Dict[str, typing.Optional[float]]]]:
+    records = []
+    with runs.open() as f:
+        for row in csv.DictReader(f):
+            trace = Path(row["trace"])
+            if not trace.is_absolute():
+                trace = runs.parent / trace
+            values = {c: float(row[c]) if row.get(c) not in (None, "") else None for c in covariates}
+            if values["genome_size"] is None:
+                values["genome_size"] = _manifest_genome_size(trace)
+            records.append((trace, values))
+    return records
+
+
+def write_runs(runs: Path, records: typing.List[typing.Tuple[Path, typing.Dict[str, typing.Optional[float]]]]) -> None:
+    with runs.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(runs_header)
+        for trace, values in records:
+            # Keep traces next to the run list relative, so that both can be moved together
+            name = trace.relative_to(runs.parent) if runs.parent in trace.parents else trace
+            writer.writerow([str(name)] + ["" if values[c] is None else f"{values[c]:g}" for c in covariates])
+
+
+def observe(tasks: typing.List[Task], run: typing.Dict[str, typing.Optional[float]]) -> typing.Dict[str, Observation]:
+    by_process = {}
+    for task in tasks:
+        by_process.setdefault(task.short_process, []).append(task)
+
+    observations = {}
+    for process, group in by_process.items():
+        done = [t for t in group if t.status == "COMPLETED"]
+        # A task killed for its memory needed more than it was given; assume
+        # twice as much, as on its retry
+        oom = [t for t in group if t.exit in oom_exit_codes and t.memory is not None]
+        memory = [t.peak_rss for t in done if t.peak_rss is not None] + [2 * t.memory for t in oom]
+        if len(memory) == 0:
+            continue
+
+        observations[process] = Observation(
+            run=run,
+            memory=float(max(memory)),
+            time=max((t.realtime or 0) for t in done) / 1000 if len(done) > 0 else 0.0,
+            cpus=max((t.cpu_percent or 0) for t in done) / 100 if len(done) > 0 else max(t.cpus for t in group),
+            allocated_cpus=max(t.cpus for t in group),
+        )
+    return observations
+
+
+def _fit(xs: typing.List[float], ys: typing.List[float]) -> typing.Tuple[float, float, float]:
+    # Least squares fit of y = a + b * x; returns a, b and R^2
+    n = len(xs)
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    syy = sum((y - my) ** 2 for y in ys)
+    if sxx == 0:
+        return my, 0.0, 0.0
+    b = sxy / sxx
+    a = my - b * mx
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 1.0
+    return a, b, r_squared
+
+
+def predict(
+    observations: typing.List[Observation],
+    value: typing.Callable[[Observation], float],
+    target: typing.Dict[str, typing.Optional[float]],
+) -> typing.Tuple[float, typing.Optional[str]]:
+    best = None
+    for c in covariates:
+        if target.get(c) is None:
+            continue
+        points = [(o.run[c], value(o)) for o in observations if o.run.get(c) is not None]
+        if len(points) < min_runs_for_fit or len({x for x, _ in points}) < 2:
+            continue
+        a, b, r_squared = _fit([x for x, _ in points], [y for _, y in points])
+        if b <= 0 or r_squared < min_r_squared:
+            continue
+        if best is None or r_squared > best[0]:
+            best = (r_squared, c, a, b, points)
+
+    if best is None:
+        return max(value(o) for o in observations), None
+
+    _, c, a, b, points = best
+    # Shift the line up so that it covers every run it was fitted on
+    excess = max(y - (a + b * x) for x, y in points)
+    return max(a + b * target[c] + excess, 0.0), c
+
+
+def recommend(
+    records: typing.List[typing.Tuple[Path, typing.Dict[str, typing.Optional[float]]]],
+    target: typing.Dict[str, typing.Optional[float]],
+) -> typing.List[Recommendation]:
+    by_process = {}
+    for trace, run in records:
+        if not trace.exists():
+            print(f"Skipping missing trace {trace}")
+            continue
+        for process, observation in observe(read_trace(trace), run).items():
+            by_process.setdefault(process, []).append(observation)
+
+    recommendations = []
+    for process, observations in sorted(by_process.items()):
+        memory, covariate = predict(observations, lambda o: o.memory, target)
+        time, _ = predict(observations, lambda o: o.time, target)
+
+        # Multi-threaded tools use what they are given; only shrink allocations
+        # that were clearly not used
+        allocated = max(o.allocated_cpus for o in observations)
+        used = max(o.cpus for o in observations)
+        cpus = allocated if used > 0.75 * allocated else max(1, math.ceil(used))
+
+        recommendations.append(
+            Recommendation(
+                process=process,
+                cpus=cpus,
+                memory_mb=max(min_memory_mb, int(math.ceil(memory * memory_margin / 2**20 / 512) * 512)),
+                time_h=max(1, math.ceil(time * time_margin / 3600)),
+                covariate=covariate,
+                runs=len(observations),
+            )
+        )
+    return recommendations
+
+
+def write_overlay(
+    recommendations: typing.List[Recommendation],
+    target: typing.Dict[str, typing.Optional[float]],
+    path: Path,
+) -> None:
+    sizes = ", ".join(f"{c}={target[c]:g}" for c in covariates if target.get(c) is not None)
+    lines = [
+        "/*",
+        "    Resource requests tuned from the traces of previous runs",
+        f"    Target: {sizes if sizes != '' else 'no input sizes given'}",
+        "",
+        "    check_max() of nextflow.config cannot be called from an included config,",
+        "    so the requests are capped at --max_cpus, --max_memory and --max_time here",
+        "*/",
+        "",
+        "process {",
+    ]
+    for r in recommendations:
+        model = f"scaled by {r.covariate}" if r.covariate is not None else "largest seen"
+        lines += [
+            f"    // {r.runs} run(s), memory {model}",
+            f"    withName: '{r.process}' {{",
+            f"        cpus   = {{ Math.min( {r.cpus}, params.max_cpus as int ) }}",
+            f"        memory = {{ [ {r.memory_mb}.MB * task.attempt, params.max_memory as nextflow.util.MemoryUnit ].min() }}",
+            f"        time   = {{ [ {r.time_h}.h * task.attempt, params.max_time as nextflow.util.Duration ].min() }}",
+            "    }",
+        ]
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Write a Nextflow config with resource requests learned from the traces of previous runs.",
+        epilog="Example: python -m wf.resource_advisor --runs runs.csv --assembly genome.fa --output tuned.config",
+    )
+    parser.add_argument(
+        "--runs",
+        type=Path,
+        required=True,
+        help=f"CSV file with the columns {','.join(runs_header)}; the genome size is read from the run's assembly manifest if empty.",
+    )
+    parser.add_argument("--assembly", type=Path, help="Assembly of the run to tune for.")
+    parser.add_argument("--genome_size", type=float, help="Assembly size of the run to tune for, if no assembly is given.")
+    parser.add_argument("--read_bytes", type=float, help="Size of the compressed RNA-seq reads of the run to tune for, in bytes.")
+    parser.add_argument("--proteins", type=float, help="Number of proteins of the run to tune for.")
+    parser.add_argument("--output", type=Path, default=Path("tuned_resources.config"), help="The config file to write.")
+    args = parser.parse_args(argv)
+
+    target = {
+        "genome_size": float(genome_size(args.assembly)) if args.assembly is not None else args.genome_size,
+        "read_bytes": args.read_bytes,
+        "proteins": args.proteins,
+    }
+    recommendations = recommend(read_runs(args.runs), target)
+    write_overlay(recommendations, target, args.output)
+    print(f"Wrote resource requests for {len(recommendations)} processes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+import csv
+import datetime
+import json
+import re
+import statistics
+import typing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Trace values are parsed in both the human readable and the raw
+# (`trace.raw = true`) format
+_units = {"B": 1, "KB": 2**10, "MB": 2**20, "GB": 2**30, "TB": 2**40, "PB": 2**50}
+_durations = {"ms": 1, "s": 1000, "m": 60 * 1000, "h": 3600 * 1000, "d": 24 * 3600 * 1000}
+_duration_part = re.compile(r"([\d.]+)\s*(ms|s|m|h|d)")
+
+# Thresholds for flagging tasks, as fractions of the requested resources
+min_cpu_efficiency = 0.25
+min_memory_efficiency = 0.25
+max_memory_efficiency = 0.9
+min_flag_cpus = 4
+min_flag_memory = 4 * 2**30
+
+
+@dataclass
+class Task:
+    name: str
+    process: str
+    status: str
+    cpus: int
+    memory: typing.Optional[int]
+    submit: typing.Optional[float]
+    start: typing.Optional[float]
+    complete: typing.Optional[float]
+    realtime: typing.Optional[float]
+    cpu_percent: typing.Optional[float]
+    peak_rss: typing.Optional[int]
+    read_bytes: typing.Optional[int]
+    write_bytes: typing.Optional[int]
+    exit: typing.Optional[int] = None
+    flags: typing.List[str] = field(default_factory=list)
+
+    @property
+    def short_process(self) -> str:
+        return self.process.split(":")[-1]
+
+    @property
+    def cpu_efficiency(self) -> typing.Optional[float]:
+        if self.cpu_percent is None or self.cpus == 0:
+            return None
+        return self.cpu_percent / (100 * self.cpus)
+
+    @property
+    def memory_efficiency(self) -> typing.Optional[float]:
+        if self.peak_rss is None or not self.memory:
+            return None
+        return self.peak_rss / self.memory
+
+
+def _missing(value: typing.Optional[str]) -> bool:
+    return value is None or value.strip() in ("", "-")
+
+
+def _parse_bytes(value: typing.Optional[str]) -> typing.Optional[int]:
+    if _missing(value):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    number, _, unit = value.partition(" ")
+    return int(float(number) * _units.get(unit.strip().upper(), 1))
+
+
+def _parse_duration(value: typing.Optional[str]) -> typing.Optional[float]:
+    # Milliseconds
+    if _missing(value):
+        return None
+    value = value.strip()
+    if value.replace(".", "", 1).isdigit():
+        return float(value)
+    return sum(float(n) * _durations[u] for n, u in _duration_part.findall(value))
+
+
+def _parse_timestamp(value: typing.Optional[str]) -> typing.Optional[float]:
+    # Seconds since the epoch
+    if _missing(value):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value) / 1000
+    return datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f").timestamp()
+
+
+def _parse_percent(value: typing.Optional[str]) -> typing.Optional[float]:
+    if _missing(value):
+        return None
+    return float(value.strip().rstrip("%"))
+
+
+def read_trace(trace: Path) -> typing.List[Task]:
+    tasks = []
+    with trace.open() as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            name = row.get("name", "")
+            tasks.append(
+                Task(
+                    name=name,
+                    process=row.get("process") or name.split(" (")[0],
+                    status=row.get("status", ""),
+                    cpus=int(row["cpus"]) if not _missing(row.get("cpus")) else 1,
+                    memory=_parse_bytes(row.get("memory")),
+                    submit=_parse_timestamp(row.get("submit")),
+                    start=_parse_timestamp(row.get("start")),
+                    complete=_parse_timestamp(row.get("complete")),
+                    realtime=_parse_duration(row.get("realtime")),
+                    cpu_percent=_parse_percent(row.get("%cpu")),
+                    peak_rss=_parse_bytes(row.get("peak_rss")),
+                    read_bytes=_parse_bytes(row.get("read_bytes") or row.get("rchar")),
+                    write_bytes=_parse_bytes(row.get("write_bytes") or row.get("wchar")),
+                    exit=int(row["exit"]) if not _missing(row.get("exit")) else None,
+                )
+            )
+    return tasks
+
+
+def read_dag(dot: Path) -> typing.Dict[str, typing.Set[str]]:
+    # Nextflow writes processes and operators as nodes of a DOT graph; returns
+    # the processes upstream of each process, looking through operators
+    labels = {}
+    edges = {}
+    for line in dot.read_text().splitlines():
+        line = line.strip()
+        m = re.match(r'^(\w+)\s*->\s*(\w+)', line)
+        if m is not None:
+            edges.setdefault(m.group(2), set()).add(m.group(1))
+            continue
+        m = re.match(r'^(\w+)\s*\[(?:.*?,)?label="([^"]*)"', line)
+        if m is not None:
+            labels[m.group(1)] = m.group(2)
+
+    # Operators and channels have no or an empty label
+    processes = {node for node, label in labels.items() if label != ""}
+    upstream = {}
+    for node in processes:
+        seen = set()
+        stack = list(edges.get(node, ()))
+        while stack:
+            parent = stack.pop()
+            if parent in seen:
+                continue
+            seen.add(parent)
+            stack.extend(edges.get(parent, ()))
+        upstream[labels[node]] = {labels[n] for n in seen if n in processes}
+    return upstream
+
+
+def flag_tasks(tasks: typing.List[Task]) -> None:
+    for task in tasks:
+        cpu = task.cpu_efficiency
+        if cpu is not None and task.cpus >= min_flag_cpus and cpu < min_cpu_efficiency:
+            task.flags.append("under_parallelised")
+
+        mem = task.memory_efficiency
+        if mem is not None and task.memory >= min_flag_memory and mem < min_memory_efficiency:
+            task.flags.append("over_provisioned_memory")
+        if mem is not None and mem > max_memory_efficiency:
+            task.flags.append("memory_pressure")
+
+
+def critical_path(
+    tasks: typing.List[Task], upstream: typing.Optional[typing.Dict[str, typing.Set[str]]] = None
+) -> typing.List[Task]:
+    # Walk back from the task that completed last. A task is submitted once all
+    # its inputs exist, so its predecessor on the critical path is the upstream
+    # task that completed last before it was submitted.
+    done = [t for t in tasks if t.complete is not None and t.submit is not None and t.status != "CACHED"]
+    if len(done) == 0:
+        return []
+
+    current = max(done, key=lambda t: t.complete)
+    path = [current]
+    while True:
+        candidates = [
+            t
+            for t in done
+            if t.complete <= current.submit
+            and (upstream is None or current.process not in upstream or t.process in upstream[current.process])
+        ]
+        if len(candidates) == 0:
+            break
+        current = max(candidates, key=lambda t: t.complete)
+        path.append(current)
+
+    return path[::-1]
+
+
+def _gib(value: typing.Optional[float]) -> typing.Optional[float]:
+    return None if value is None else round(value / 2**30, 2)
+
+
+def _round(value: typing.Optional[float], digits: int = 2) -> typing.Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+def _median(values: typing.List[typing.Optional[float]]) -> typing.Optional[float]:
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if len(values) > 0 else None
+
+
+def summarize_processes(tasks: typing.List[Task]) -> typing.List[typing.Dict[str, typing.Any]]:
+    by_process = {}
+    for task in tasks:
+        by_process.setdefault(task.short_process, []).append(task)
+
+    rows = []
+    for process, group in by_process.items():
+        realtimes = [t.realtime / 1000 for t in group if t.realtime is not None]
+        allocated = sum(t.cpus * (t.realtime or 0) for t in group) / 3600 / 1000
+        used = sum((t.cpu_percent or 0) / 100 * (t.realtime or 0) for t in group) / 3600 / 1000
+
+        # A process is flagged if most of its tasks are
+        flags = sorted({f for t in group for f in t.flags if sum(f in u.flags for u in group) * 2 > len(group)})
+
+        rows.append(
+            {
+                "process": process,
+                "tasks": len(group),
+                "failed": sum(t.status not in ("COMPLETED", "CACHED") for t in group),
+                "cpus": max(t.cpus for t in group),
+                "memory_gib": _gib(max((t.memory or 0) for t in group)),
+                "wall_time_s": _round(sum(realtimes)),
+                "mean_time_s": _round(statistics.mean(realtimes)) if len(realtimes) > 0 else None,
+                "max_time_s": _round(max(realtimes)) if len(realtimes) > 0 else None,
+                "cpu_hours_allocated": _round(allocated),
+                "cpu_hours_used": _round(used),
+                "cpu_efficiency": _round(_median([t.cpu_efficiency for t in group])),
+                "peak_rss_gib": _gib(max((t.peak_rss or 0) for t in group)),
+                "memory_efficiency": _round(_median([t.memory_efficiency for t in group])),
+                "read_gib": _gib(sum(t.read_bytes or 0 for t in group)),
+                "write_gib": _gib(sum(t.write_bytes or 0 for t in group)),
+                "flags": flags,
+            }
+        )
+
+    rows.sort(key=lambda r: r["cpu_hours_allocated"], reverse=True)
+    return rows
+
+
+def performance_report(trace: Path, dag: typing.Optional[Path] = None) -> typing.Dict[str, typing.Any]:
+    tasks = read_trace(trace)
+    flag_tasks(tasks)
+
+    upstream = None
+    if dag is not None and dag.exists():
+        upstream = read_dag(dag)
+
+    starts = [t.start for t in tasks if t.start is not None]
+    completes = [t.complete for t in tasks if t.complete is not None]
+    path = critical_path(tasks, upstream)
+    processes = summarize_processes(tasks)
+
+    allocated = sum(p["cpu_hours_allocated"] for p in processes)
+    used = sum(p["cpu_hours_used"] for p in processes)
+
+    return {
+        "summary": {
+            "tasks": len(tasks),
+            "failed": sum(p["failed"] for p in processes),
+            "wall_time_s": _round(max(completes) - min(starts)) if starts and completes else None,
+            "cpu_hours_allocated": _round(allocated),
+            "cpu_hours_used": _round(used),
+            "cpu_efficiency": _round(used / allocated) if allocated > 0 else None,
+            "critical_path_s": _round(path[-1].complete - path[0].submit) if len(path) > 0 else None,
+        },
+        "processes": processes,
+        "critical_path": [
+            {
+                "task": t.name,
+                "process": t.short_process,
+                "queued_s": _round(t.start - t.submit) if t.start is not None else None,
+                "time_s": _round(t.realtime / 1000) if t.realtime is not None else None,
+            }
+            for t in path
+        ],
+        "flagged_tasks": [
+            {
+                "task": t.name,
+                "flags": t.flags,
+                "cpus": t.cpus,
+                "cpu_efficiency": _round(t.cpu_efficiency),
+                "memory_gib": _gib(t.memory),
+                "peak_rss_gib": _gib(t.peak_rss),
+                "time_s": _round(t.realtime / 1000) if t.realtime is not None else None,
+            }
+            for t in sorted(tasks, key=lambda t: t.cpus * (t.realtime or 0), reverse=True)
+            if len(t.flags) > 0
+        ][:50],
+    }
+
+
+def write_report(report: typing.Dict[str, typing.Any], path: Path) -> None:
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def print_report(report: typing.Dict[str, typing.Any]) -> None:
+    summary = report["summary"]
+    print(
+        f"{summary['tasks']} tasks, {summary['cpu_hours_used']} of {summary['cpu_hours_allocated']} "
+        f"allocated CPU hours used, critical path {summary['critical_path_s']}s"
+    )
+    for p in report["processes"]:
+        if len(p["flags"]) > 0:
+            print(f"  {p['process']}: {', '.join(p['flags'])} (cpus={p['cpus']}, cpu_efficiency={p['cpu_efficiency']}, memory={p['memory_gib']}GiB, peak_rss={p['peak_rss_gib']}GiB)")
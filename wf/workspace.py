@@ -0,0 +1,151 @@
+import csv
+import hashlib
+import math
+import os
+import shutil
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from latch.ldata.path import LPath
+
+# Disk space needed per byte of each input, for the copies, indices and
+# intermediate files the pipeline creates from it (e.g. the STAR and SPALN
+# indices, masked and split assemblies, trimmed reads and their alignments)
+blowup = {
+    "assembly": 40,
+    "reads": 3,
+    "transcripts": 4,
+    "proteins": 4,
+    "rm_db": 2,
+    "references": 10,
+}
+# Space for the software, logs and small files of every run
+base_gib = 20
+min_gib = 50
+max_gib = 4096
+round_to_gib = 10
+
+# The files of the image Nextflow needs to run the pipeline
+pipeline_entries = [
+    "main.nf",
+    "nextflow.config",
+    "nextflow_schema.json",
+    "latch.config",
+    "modules.json",
+    "assets",
+    "bin",
+    "conf",
+    "lib",
+    "modules",
+    "subworkflows",
+    "workflows",
+]
+skip_names = {"__pycache__", ".nextflow", "work", "results"}
+manifest_name = ".pipeline_manifest.tsv"
+
+
+def remote_size(remote_path: typing.Optional[str]) -> int:
+    if remote_path is None or not remote_path.startswith("latch://"):
+        return 0
+    try:
+        return LPath(remote_path).size()
+    except Exception as e:
+        print(f"Failed to get the size of {remote_path}: {e}")
+        return 0
+
+
+def samplesheet_files(samplesheet: Path, columns: typing.Iterable[str]) -> typing.List[str]:
+    with samplesheet.open() as f:
+        return [
+            row[column].strip()
+            for row in csv.DictReader(f)
+            for column in columns
+            if (row.get(column) or "").strip() != ""
+        ]
+
+
+def workspace_gib(input_bytes: typing.Dict[str, int]) -> int:
+    needed = base_gib + sum(blowup[kind] * size for kind, size in input_bytes.items()) / 2**30
+    needed = math.ceil(needed / round_to_gib) * round_to_gib
+    return min(max(needed, min_gib), max_gib)
+
+
+def _digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest(manifest: Path) -> typing.Dict[str, typing.Tuple[int, int, str]]:
+    entries = {}
+    if not manifest.exists():
+        return entries
+
+    for line in manifest.read_text().splitlines():
+        if line.startswith("#") or line.strip() == "":
+            continue
+        name, size, mtime, digest = line.split("\t")
+        entries[name] = (int(size), int(mtime), digest)
+
+    return entries
+
+
+def _pipeline_files(source: Path) -> typing.List[Path]:
+    files = []
+    for entry in pipeline_entries:
+        path = source / entry
+        if path.is_file():
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path, followlinks=True):
+            dirs[:] = [d for d in dirs if d not in skip_names]
+            files.extend(Path(root) / name for name in names if (Path(root) / name).exists())
+
+    return files
+
+
+def _stage_file(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    # Hard links only work within one file system, i.e. not onto the shared volume
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def stage_pipeline(source: Path, target: Path, workers: int = 16) -> typing.Tuple[int, int]:
+    # The manifest records what was staged, so that files which did not change
+    # since, e.g. when a task is retried on the same volume, are not copied again
+    manifest = target / manifest_name
+    previous = _read_manifest(manifest)
+    entries = {}
+    todo = []
+
+    for path in _pipeline_files(source):
+        name = str(path.relative_to(source))
+        stat = path.stat()
+        known = previous.get(name)
+        staged = (target / name).exists()
+        if staged and known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            entries[name] = known
+            continue
+
+        digest = _digest(path)
+        entries[name] = (stat.st_size, stat.st_mtime_ns, digest)
+        if staged and known is not None and known[2] == digest:
+            continue
+        todo.append(path)
+
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(lambda p: _stage_file(p, target / p.relative_to(source)), todo))
+
+    target.mkdir(parents=True, exist_ok=True)
+    lines = ["#name\tsize\tmtime\tsha256"] + [f"{n}\t{s}\t{m}\t{d}" for n, (s, m, d) in sorted(entries.items())]
+    manifest.write_text("\n".join(lines) + "\n")
+
+    return len(todo), len(entries) - len(todo)
@@ -60,6 +60,7 @@ include { EVM } from '../subworkflows/local/evm.nf'
 include { FASTA_PREPROCESS as TRANSCRIPT_PREPROCESS } from '../subworkflows/local/fasta_preprocess'
 include { BUSCO_QC } from '../subworkflows/local/busco_qc'
 include { NCRNA } from '../subworkflows/local/ncrna'
+include { INCREMENTAL } from '../subworkflows/local/incremental'
 
 /*
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -74,9 +75,16 @@ include { SAMTOOLS_MERGE } from '../modules/local/samtools/merge'
 include { MULTIQC                     } from '../modules/nf-core/modules/multiqc/main'
 include { CUSTOM_DUMPSOFTWAREVERSIONS } from '../modules/nf-core/modules/custom/dumpsoftwareversions/main'
 include { TRINITY_GENOMEGUIDED } from '../modules/local/trinity/genomeguided'
-include { AUGUSTUS_BAM2HINTS } from '../modules/local/augustus/bam2hints'
+include { TRINITY_GENOMEGUIDEDREGIONS } from '../modules/local/trinity/genomeguidedregions'
 include { REPEATMODELER } from '../modules/local/repeatmodeler'
 include { AUGUSTUS_STAGECONFIG } from '../modules/local/augustus/stageconfig'
+include { AUGUSTUS_TRAINING } from '../modules/local/augustus/training'
+include { HELPER_MERGEHINTS } from '../modules/local/helper/mergehints'
+include { HELPER_BAMTOHINTS } from '../modules/local/helper/bamtohints'
+include { HELPER_BAMCLUSTERS } from '../modules/local/helper/bamclusters'
+include { HELPER_SPLICEFASTA as REPEATMASKER_SPLICEFASTA } from '../modules/local/helper/splicefasta'
+include { HELPER_SPLICEGFF as AUGUSTUS_SPLICEGFF ; HELPER_SPLICEGFF as EVM_SPLICEGFF ; HELPER_SPLICEGFF as NCRNA_SPLICEGFF } from '../modules/local/helper/splicegff'
+include { HELPER_GFFTOOLKIT as AUGUSTUS_SPLICE_GFF2PROTEINS ; HELPER_GFFTOOLKIT as EVM_SPLICE_GFF2PROTEINS } from '../modules/local/helper/gfftoolkit'
 
 /*
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -124,16 +132,46 @@ workflow GENOMEANNOTATOR {
         ch_genome
     )
     ch_versions = ch_versions.mix(ASSEMBLY_PREPROCESS.out.versions)
+    ch_genome_annotate = ASSEMBLY_PREPROCESS.out.fasta
+
+    //
+    // SUBWORKFLOW: Only annotate sequences that are new or changed since a previous run
+    //
+    if (params.previous_run) {
+       INCREMENTAL(
+          ASSEMBLY_PREPROCESS.out.fasta,
+          ASSEMBLY_PREPROCESS.out.manifest,
+          previous_run_file("assembly/*.sequences.tsv")
+       )
+       ch_versions = ch_versions.mix(INCREMENTAL.out.versions)
+       ch_splice = INCREMENTAL.out.unchanged.join(INCREMENTAL.out.manifest)
+
+       // Without new or changed sequences, skip repeatmasking, ncRNA search and gene prediction
+       // and splice the results of the previous run instead
+       INCREMENTAL.out.fasta.branch { m,f ->
+          changed: f.size() > 0
+          unchanged: true
+       }.set { ch_subset }
+       ch_genome_annotate = ch_subset.changed
+       ch_nothing_changed = ch_subset.unchanged.map { m,f -> m }
+    }
 
     // 
     // SUBWORKFLOW: Search for ncRNAs
     //
     if (params.ncrna) {
        NCRNA(
-          ASSEMBLY_PREPROCESS.out.fasta,
+          ch_genome_annotate,
           ch_rfam_cm,
           ch_rfam_family
        )
+       if (params.previous_run) {
+          NCRNA_SPLICEGFF(
+             with_splice(reuse_previous(NCRNA.out.gff, ch_nothing_changed, "processing/helper/*.rfam.gff"), ch_splice),
+             previous_run_file("processing/helper/*.rfam.gff")
+          )
+          check_spliced(NCRNA_SPLICEGFF.out.gff, "ncRNA")
+       }
     }
 
     //
@@ -153,17 +191,22 @@ workflow GENOMEANNOTATOR {
     // SUBWORKFLOW: Repeat modelling if no repeats are provided
     //
     if (!params.rm_lib && !params.rm_species) {
-       REPEATMODELER(
-          ASSEMBLY_PREPROCESS.out.fasta
-       )
-       ch_repeats = REPEATMODELER.out.fasta.map {m,fasta -> fasta}
+       if (params.previous_run && file("${params.previous_run}/processing/repeatmodeler/consensi.fa").exists()) {
+          // Keep masking consistent with the sequences spliced in from the previous run
+          ch_repeats = Channel.fromPath("${params.previous_run}/processing/repeatmodeler/consensi.fa")
+       } else {
+          REPEATMODELER(
+             ASSEMBLY_PREPROCESS.out.fasta
+          )
+          ch_repeats = REPEATMODELER.out.fasta.map {m,fasta -> fasta}
+       }
     }
 
     //
     // MODULE: Repeatmask the genome; if a repeat species is provided, use that - else the repeats in FASTA format
     if (params.rm_species) {
        REPEATMASKER(
-          ASSEMBLY_PREPROCESS.out.fasta,
+          ch_genome_annotate,
           ch_repeats,
           params.rm_species,
           ch_rm_db
@@ -172,7 +215,7 @@ workflow GENOMEANNOTATOR {
        ch_genome_rm = REPEATMASKER.out.fasta
     } else {
        REPEATMASKER(
-          ASSEMBLY_PREPROCESS.out.fasta,
+          ch_genome_annotate,
           ch_repeats,
           false,
           ch_rm_db
@@ -180,6 +223,16 @@ workflow GENOMEANNOTATOR {
        ch_versions = ch_versions.mix(REPEATMASKER.out.versions)
        ch_genome_rm = REPEATMASKER.out.fasta
     }
+    ch_genome_rm_annotate = ch_genome_rm
+
+    if (params.previous_run) {
+       REPEATMASKER_SPLICEFASTA(
+          with_splice(reuse_previous(ch_genome_rm_annotate, ch_nothing_changed, "repeatmasker/*.rm.fasta"), ch_splice),
+          previous_run_file("repeatmasker/*.rm.fasta")
+       )
+       check_spliced(REPEATMASKER_SPLICEFASTA.out.fasta, "repeat-masked")
+       ch_genome_rm = REPEATMASKER_SPLICEFASTA.out.fasta
+    }
 
     //
     // SUBWORKFLOW: Align proteins from related organisms with SPALN
@@ -216,7 +269,7 @@ workflow GENOMEANNOTATOR {
           ch_samplesheet
        )
        // 
-       // MODULE: Merge all BAM files
+       // MODULE: Group all BAM files by assembly
        //
        RNASEQ_ALIGN.out.bam.map{ meta, bam ->
         new_meta = [:]
@@ -226,28 +279,59 @@ workflow GENOMEANNOTATOR {
        .set{bam_mapped}
 
        //
-       // MODULE: Merge BAM files
+       // MODULE: Count hints over all BAM files, region by region
        //
-       SAMTOOLS_MERGE(
-          bam_mapped
-       )
-       AUGUSTUS_BAM2HINTS(
-          SAMTOOLS_MERGE.out.bam,
-          params.pri_rnaseq
+       HELPER_BAMTOHINTS(
+          bam_mapped,
+          params.pri_rnaseq,
+          params.pri_wiggle
        )
-       ch_hints = ch_hints.mix(AUGUSTUS_BAM2HINTS.out.gff)
-       ch_versions = ch_versions.mix(RNASEQ_ALIGN.out.versions.first(),AUGUSTUS_BAM2HINTS.out.versions,SAMTOOLS_MERGE.out.versions)
+       ch_hints = ch_hints.mix(HELPER_BAMTOHINTS.out.gff)
+       ch_versions = ch_versions.mix(RNASEQ_ALIGN.out.versions.first(),HELPER_BAMTOHINTS.out.versions)
 
        //
        // SUBWORKFLOW: Assemble transcripts using Trinity and align to genome
        //
        if (params.trinity) {
-          TRINITY_GENOMEGUIDED(
-             SAMTOOLS_MERGE.out.bam,
-             params.max_intron_size
+          //
+          // MODULE: Merge BAM files, Trinity needs a single one
+          //
+          SAMTOOLS_MERGE(
+             bam_mapped
           )
-          ch_transcripts = ch_transcripts.mix(TRINITY_GENOMEGUIDED.out.fasta)
-          ch_versions = ch_versions.mix(TRINITY_GENOMEGUIDED.out.versions)
+          ch_versions = ch_versions.mix(SAMTOOLS_MERGE.out.versions)
+          if (params.trinity_parts) {
+             //
+             // MODULE: Split the reads into clusters no transcript can span and balance them across parts
+             //
+             HELPER_BAMCLUSTERS(
+                SAMTOOLS_MERGE.out.bam,
+                params.trinity_parts,
+                params.max_intron_size
+             )
+             TRINITY_GENOMEGUIDEDREGIONS(
+                HELPER_BAMCLUSTERS.out.regions
+                    .map { meta, bam, bai, beds -> [ meta, bam, bai, beds instanceof List ? beds : [ beds ] ] }
+                    .transpose(by: 3),
+                params.max_intron_size
+             )
+             TRINITY_GENOMEGUIDEDREGIONS.out.fasta.collectFile { meta, fasta ->
+                [ "${meta.id}.Trinity-GG.fasta", fasta ]
+             }.map { fasta ->
+                def tmeta = [:]
+                tmeta.id = fasta.getName() - ".Trinity-GG.fasta"
+                tuple(tmeta,fasta)
+             }.set { ch_trinity }
+             ch_versions = ch_versions.mix(HELPER_BAMCLUSTERS.out.versions,TRINITY_GENOMEGUIDEDREGIONS.out.versions.first())
+          } else {
+             TRINITY_GENOMEGUIDED(
+                SAMTOOLS_MERGE.out.bam,
+                params.max_intron_size
+             )
+             ch_trinity = TRINITY_GENOMEGUIDED.out.fasta
+             ch_versions = ch_versions.mix(TRINITY_GENOMEGUIDED.out.versions)
+          }
+          ch_transcripts = ch_transcripts.mix(ch_trinity)
        }
     }
 
@@ -285,50 +369,77 @@ workflow GENOMEANNOTATOR {
     // SUBWORKFLOW: Train augustus prediction model
     //
     if (params.aug_training) {
-
-       if (params.proteins_targeted) {
-          AUGUSTUS_TRAINING(
-             SPALN_ALIGN_MODELS.out.gff
-          )
-          ch_aug_config_final = AUGUSTUS_TRAINING.out.aug_config_folder             
-       } else if (params.pasa) {
-          AUGUSTUS_TRAINING(
-             PASA_PIPELINE.out.gff_training
-          )
-          ch_aug_config_final = AUGUSTUS_TRAINING.out.aug_config_folder
-       }
-
-    } else {
-       ch_aug_config_final = ch_aug_config_folder
+       ch_training_gff = params.proteins_targeted ? SPALN_ALIGN_MODELS.out.gff_training : PASA_PIPELINE.out.gff_training
+
+       // Optimise the species parameters in a copy of the staged config and predict with it
+       AUGUSTUS_TRAINING(
+          ch_training_gff.map { m,g -> g }.combine(ASSEMBLY_PREPROCESS.out.fasta).map { g,m,f -> tuple(m,g,f) },
+          ch_aug_config_folder.collect(),
+          params.aug_species,
+          params.aug_training_rounds,
+          params.aug_training_kfold
+       )
+       ch_versions = ch_versions.mix(AUGUSTUS_TRAINING.out.versions)
+       ch_aug_config_folder = AUGUSTUS_TRAINING.out.aug_config_folder
     }
 
     //
     // SUBWORKFLOW: Predict gene models using AUGUSTUS
     //
-    all_hints = ch_hints.unique().collectFile(name: 'hints.gff')
+    HELPER_MERGEHINTS(
+       ch_hints.unique().collect()
+    )
+    ch_versions = ch_versions.mix(HELPER_MERGEHINTS.out.versions)
 
     AUGUSTUS_PIPELINE(
-       REPEATMASKER.out.fasta,
-       all_hints,
+       ch_genome_rm_annotate,
+       HELPER_MERGEHINTS.out.gff,
        ch_aug_config_folder,
        ch_aug_extrinsic_cfg,
     )
     ch_versions = ch_versions.mix(AUGUSTUS_PIPELINE.out.versions)
-    ch_genes_gff = ch_genes_gff.mix(AUGUSTUS_PIPELINE.out.gff)
-    ch_proteins_fa = ch_proteins_fa.mix(AUGUSTUS_PIPELINE.out.proteins)
+    ch_augustus_gff = AUGUSTUS_PIPELINE.out.gff
+    ch_augustus_proteins = AUGUSTUS_PIPELINE.out.proteins
+
+    if (params.previous_run) {
+       AUGUSTUS_SPLICEGFF(
+          with_splice(reuse_previous(AUGUSTUS_PIPELINE.out.gff, ch_nothing_changed, "annotations/augustus/*.augustus.stable_id.gff"), ch_splice),
+          previous_run_file("annotations/augustus/*.augustus.stable_id.gff")
+       )
+       check_spliced(AUGUSTUS_SPLICEGFF.out.gff, "AUGUSTUS")
+       AUGUSTUS_SPLICE_GFF2PROTEINS(
+          AUGUSTUS_SPLICEGFF.out.gff.join(ch_genome_rm)
+       )
+       ch_augustus_gff = AUGUSTUS_SPLICEGFF.out.gff
+       ch_augustus_proteins = AUGUSTUS_SPLICE_GFF2PROTEINS.out.proteins
+    }
+    ch_genes_gff = ch_genes_gff.mix(ch_augustus_gff)
+    ch_proteins_fa = ch_proteins_fa.mix(ch_augustus_proteins)
 
     //
     // SUBWORKFLOW: Consensus gene building with EVM
     //
     if (params.evm) {
        EVM(
-          ch_genome_rm,
+          ch_genome_rm_annotate,
           ch_genes_gff.map{m,g -> g}.collectFile(name: 'genes.gff3'),
           ch_proteins_gff.map{m,p -> p}.mix(ch_empty_gff).collectFile(name: 'proteins.gff3'),
           ch_transcripts_gff.map{m,t ->t}.mix(ch_empty_gff).collectFile(name: 'transcripts.gff3'),
           ch_evm_weights
        )
-       ch_proteins_fa = ch_proteins_fa.mix(EVM.out.proteins)
+       if (params.previous_run) {
+          EVM_SPLICEGFF(
+             with_splice(reuse_previous(EVM.out.gff, ch_nothing_changed, "annotations/evm/*.evm.gff3"), ch_splice),
+             previous_run_file("annotations/evm/*.evm.gff3")
+          )
+          check_spliced(EVM_SPLICEGFF.out.gff, "EVM")
+          EVM_SPLICE_GFF2PROTEINS(
+             EVM_SPLICEGFF.out.gff.join(ch_genome_rm)
+          )
+          ch_proteins_fa = ch_proteins_fa.mix(EVM_SPLICE_GFF2PROTEINS.out.proteins)
+       } else {
+          ch_proteins_fa = ch_proteins_fa.mix(EVM.out.proteins)
+       }
     }
 
     //
@@ -384,6 +495,29 @@ workflow.onComplete {
     NfcoreTemplate.summary(workflow, params, log)
 }
 
+// Locate a result of the run given with --previous_run
+def previous_run_file(pattern) {
+    return Channel.fromPath("${params.previous_run}/${pattern}", checkIfExists: true).first()
+}
+
+// If no sequence changed, splicing the results of the previous run into themselves keeps them as they are
+def reuse_previous(results, nothing_changed, pattern) {
+    return results.mix(nothing_changed.combine(previous_run_file(pattern)))
+}
+
+// Results of the changed sequences carry the digest of the subset; match them to the whole assembly by name
+// and splice them under its meta
+def with_splice(results, splice) {
+    return results.map { m, f -> [ m.id, f ] }
+       .join(splice.map { m, unchanged, manifest -> [ m.id, m, unchanged, manifest ] })
+       .map { id, f, m, unchanged, manifest -> [ m, f, unchanged, manifest ] }
+}
+
+// A splice step without output means that its inputs did not match up, e.g. by their meta
+def check_spliced(results, name) {
+    results.ifEmpty { exit 1, "ERROR: No ${name} results were spliced into those of the previous run." }
+}
+
 /*
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     THE END